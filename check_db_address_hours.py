@@ -1,36 +1,70 @@
 """
 데이터베이스에 저장된 주소와 영업시간 정보 확인
 """
+import weakref
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 from config.config import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
 
-def check_address_hours():
-    """주소와 영업시간 정보 확인"""
-    try:
-        # 데이터베이스 연결
-        conn = psycopg2.connect(
+# 반복 호출 시 연결 핸드셰이크를 생략하기 위한 모듈 단위 커넥션 풀 (최초 호출 시 생성)
+_POOL = None
+
+def _get_pool():
+    """공유 커넥션 풀 반환"""
+    global _POOL
+    if _POOL is None:
+        _POOL = psycopg2.pool.ThreadedConnectionPool(
+            1, 4,
             host=DB_HOST,
             port=DB_PORT,
             database=DB_NAME,
             user=DB_USER,
             password=DB_PASSWORD
         )
+    return _POOL
+
+# 통계 쿼리 (연결별로 한 번 PREPARE 후 EXECUTE로 재사용하여 파싱/계획 단계 생략)
+STATS_STATEMENT = "address_hours_stats"
+STATS_QUERY = """
+    SELECT 
+        COUNT(*) as total_stores,
+        COUNT(*) FILTER (WHERE address IS NOT NULL AND address <> '') as stores_with_address,
+        COUNT(*) FILTER (WHERE open_hours IS NOT NULL AND open_hours <> '') as stores_with_hours,
+        COUNT(*) FILTER (WHERE holiday IS NOT NULL AND holiday <> '') as stores_with_holiday,
+        COUNT(*) FILTER (WHERE holiday LIKE '%요일%') as stores_with_weekday_holiday,
+        COUNT(*) FILTER (WHERE open_hours LIKE '%요일%') as stores_with_weekday_hours
+    FROM stores
+"""
+
+# 최근 저장 가게 샘플 개수
+RECENT_SAMPLE_LIMIT = 5
+
+# STATS_STATEMENT가 준비된 연결 (연결 객체 기준, 닫혀서 사라진 연결은 자동 제거)
+# 백엔드 PID는 새 연결에 재사용될 수 있으므로 키로 쓰지 않음
+_PREPARED_CONNECTIONS = weakref.WeakSet()
+
+def _execute_stats(cursor):
+    """통계 prepared statement 실행 (해당 연결에서 처음이면 PREPARE)"""
+    conn = cursor.connection
+    if conn not in _PREPARED_CONNECTIONS:
+        cursor.execute(f"PREPARE {STATS_STATEMENT} AS {STATS_QUERY}")
+        _PREPARED_CONNECTIONS.add(conn)
+    cursor.execute(f"EXECUTE {STATS_STATEMENT}")
+
+def check_address_hours():
+    """주소와 영업시간 정보 확인"""
+    conn = None
+    failed = False
+    try:
+        # 데이터베이스 연결 (풀에서 재사용)
+        conn = _get_pool().getconn()
         
         cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
         
-        # 통계 쿼리
+        # 통계 쿼리 (한 번의 테이블 스캔으로 모든 항목 집계)
         print("=== 주소 및 영업시간 수집 통계 ===")
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_stores,
-                COUNT(CASE WHEN address IS NOT NULL AND address != '' THEN 1 END) as stores_with_address,
-                COUNT(CASE WHEN open_hours IS NOT NULL AND open_hours != '' THEN 1 END) as stores_with_hours,
-                COUNT(CASE WHEN holiday IS NOT NULL AND holiday != '' THEN 1 END) as stores_with_holiday,
-                COUNT(CASE WHEN holiday LIKE '%요일%' THEN 1 END) as stores_with_weekday_holiday,
-                COUNT(CASE WHEN open_hours LIKE '%요일%' THEN 1 END) as stores_with_weekday_hours
-            FROM stores
-        """)
+        _execute_stats(cursor)
         
         stats = cursor.fetchone()
         print(f"전체 가게 수: {stats['total_stores']}")
@@ -40,82 +74,97 @@ def check_address_hours():
         print(f"요일별 휴무일: {stats['stores_with_weekday_holiday']} ({stats['stores_with_weekday_holiday']/stats['total_stores']*100:.1f}%)")
         print(f"요일별 영업시간: {stats['stores_with_weekday_hours']} ({stats['stores_with_weekday_hours']/stats['total_stores']*100:.1f}%)")
         
-        # 샘플 데이터 확인
-        print("\n=== 최근 저장된 가게 샘플 (5개) ===")
-        cursor.execute("""
-            SELECT 
-                name,
-                address,
-                open_hours,
-                holiday,
-                break_time,
-                last_order,
-                created_at
-            FROM stores
-            ORDER BY created_at DESC
-            LIMIT 5
-        """)
-        
-        samples = cursor.fetchall()
-        for i, store in enumerate(samples, 1):
-            print(f"\n[{i}] {store['name']}")
-            print(f"  주소: {store['address'] or 'N/A'}")
-            print(f"  영업시간: {store['open_hours'] or 'N/A'}")
-            print(f"  휴무일: {store['holiday'] or 'N/A'}")
-            print(f"  브레이크타임: {store['break_time'] or 'N/A'}")
-            print(f"  라스트오더: {store['last_order'] or 'N/A'}")
-            print(f"  저장일시: {store['created_at']}")
+        # 샘플 데이터 확인 (서버 측 커서로 itersize 단위 스트리밍, 전체 목록을 메모리에 올리지 않음)
+        print(f"\n=== 최근 저장된 가게 샘플 ({RECENT_SAMPLE_LIMIT}개) ===")
+        with conn.cursor(name='recent_stores', cursor_factory=psycopg2.extras.RealDictCursor) as recent_cursor:
+            recent_cursor.itersize = 100
+            recent_cursor.execute("""
+                SELECT 
+                    name,
+                    address,
+                    open_hours,
+                    holiday,
+                    break_time,
+                    last_order,
+                    created_at
+                FROM stores
+                ORDER BY created_at DESC
+                LIMIT %s
+            """, (RECENT_SAMPLE_LIMIT,))
+            
+            for i, store in enumerate(recent_cursor, 1):
+                print(f"\n[{i}] {store['name']}")
+                print(f"  주소: {store['address'] or 'N/A'}")
+                print(f"  영업시간: {store['open_hours'] or 'N/A'}")
+                print(f"  휴무일: {store['holiday'] or 'N/A'}")
+                print(f"  브레이크타임: {store['break_time'] or 'N/A'}")
+                print(f"  라스트오더: {store['last_order'] or 'N/A'}")
+                print(f"  저장일시: {store['created_at']}")
         
         # 문제가 있는 데이터 확인
         print("\n=== 문제가 있는 데이터 샘플 ===")
         
-        # 주소가 없는 가게
+        # 세 가지 문제 유형을 한 번의 왕복으로 조회 (유형별 최대 3개)
+        # 유형마다 출력에 쓰는 컬럼만 가져오고, 영업시간은 서버에서 100자로 잘라서 전송
         cursor.execute("""
-            SELECT name, diningcode_place_id
-            FROM stores
-            WHERE address IS NULL OR address = ''
-            LIMIT 3
+            (SELECT 'no_address' as issue, name, diningcode_place_id,
+                    NULL::text as open_hours, NULL::text as holiday
+             FROM stores
+             WHERE address IS NULL OR address = ''
+             LIMIT 3)
+            UNION ALL
+            (SELECT 'date_hours', name, NULL, LEFT(open_hours, 100), NULL
+             FROM stores
+             WHERE open_hours LIKE '%월%일%'
+             LIMIT 3)
+            UNION ALL
+            (SELECT 'vague_holiday', name, NULL, NULL, holiday
+             FROM stores
+             WHERE holiday IN ('휴무일', '정기휴일')
+             LIMIT 3)
         """)
-        no_address = cursor.fetchall()
+        issues = {"no_address": [], "date_hours": [], "vague_holiday": []}
+        for row in cursor.fetchall():
+            issues[row['issue']].append(row)
+        
+        # 주소가 없는 가게
+        no_address = issues["no_address"]
         if no_address:
             print("\n주소가 없는 가게:")
             for store in no_address:
                 print(f"  - {store['name']} (ID: {store['diningcode_place_id']})")
         
         # 날짜별 영업시간을 가진 가게 (개선 필요)
-        cursor.execute("""
-            SELECT name, open_hours
-            FROM stores
-            WHERE open_hours LIKE '%월%일%'
-            LIMIT 3
-        """)
-        date_hours = cursor.fetchall()
+        date_hours = issues["date_hours"]
         if date_hours:
             print("\n날짜별 영업시간 (개선 필요):")
             for store in date_hours:
                 print(f"  - {store['name']}")
-                print(f"    영업시간: {store['open_hours'][:100]}...")
+                print(f"    영업시간: {store['open_hours']}...")
         
         # 구체적이지 않은 휴무일
-        cursor.execute("""
-            SELECT name, holiday
-            FROM stores
-            WHERE holiday IN ('휴무일', '정기휴일')
-            LIMIT 3
-        """)
-        vague_holiday = cursor.fetchall()
+        vague_holiday = issues["vague_holiday"]
         if vague_holiday:
             print("\n구체적이지 않은 휴무일:")
             for store in vague_holiday:
                 print(f"  - {store['name']}: {store['holiday']}")
         
         cursor.close()
-        conn.close()
         
     except Exception as e:
+        failed = True
         print(f"오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    
+    finally:
+        if conn is not None:
+            # 읽기 트랜잭션 종료 후 풀에 반환 (오류가 났거나 연결이 끊겼으면 폐기)
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                failed = True
+            _get_pool().putconn(conn, close=failed)
 
 if __name__ == "__main__":
     check_address_hours() 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import contextvars
 from dotenv import load_dotenv
 from urllib.parse import urlparse
 
@@ -202,6 +203,11 @@ TEST_REGION = "강남"
 TEST_RECT = REGIONS[TEST_REGION]["rect"] 
 TEST_KEYWORDS = REGIONS[TEST_REGION]["keywords"]
 
+# 실행 컨텍스트별 크롤링 대상 (스케줄러 워커가 모듈 전역을 바꾸지 않고 구별로 지정)
+TEST_REGION_CV = contextvars.ContextVar('TEST_REGION', default=None)
+TEST_RECT_CV = contextvars.ContextVar('TEST_RECT', default=None)
+TEST_KEYWORDS_CV = contextvars.ContextVar('TEST_KEYWORDS', default=None)
+
 # 기본 무한리필 키워드 (지역명 없이)
 BASIC_KEYWORDS = [
     "무한리필",
@@ -278,6 +278,12 @@ CREATE INDEX IF NOT EXISTS idx_stores_status ON stores(status);
 CREATE INDEX IF NOT EXISTS idx_stores_name ON stores USING GIN(to_tsvector('korean', name));
 CREATE INDEX IF NOT EXISTS idx_stores_address ON stores USING GIN(to_tsvector('korean', address));
 CREATE INDEX IF NOT EXISTS idx_stores_keywords ON stores USING GIN(keywords);
+CREATE INDEX IF NOT EXISTS idx_stores_created_at_desc ON stores(created_at DESC) INCLUDE (name, last_order, holiday);
+CREATE INDEX IF NOT EXISTS idx_stores_has_address ON stores(id) WHERE address IS NOT NULL AND address <> '';
+CREATE INDEX IF NOT EXISTS idx_stores_has_open_hours ON stores(id) WHERE open_hours IS NOT NULL AND open_hours <> '';
+CREATE INDEX IF NOT EXISTS idx_stores_has_break_time ON stores(id) WHERE break_time IS NOT NULL AND break_time <> '';
+CREATE INDEX IF NOT EXISTS idx_stores_has_last_order ON stores(id) WHERE last_order IS NOT NULL AND last_order <> '';
+CREATE INDEX IF NOT EXISTS idx_stores_has_holiday ON stores(id) WHERE holiday IS NOT NULL AND holiday <> '';
 CREATE INDEX IF NOT EXISTS idx_categories_name ON categories(name);
 CREATE INDEX IF NOT EXISTS idx_crawling_logs_created_at ON crawling_logs(created_at);
 
@@ -340,6 +346,20 @@ FROM stores
 GROUP BY region
 ORDER BY total_stores DESC;
 
+-- 상태 확인용 가게 통계 (크롤링 실행 종료 시 REFRESH MATERIALIZED VIEW CONCURRENTLY로 갱신)
+CREATE MATERIALIZED VIEW IF NOT EXISTS stores_stats AS
+SELECT
+    1 AS id,
+    COUNT(*) AS total,
+    COUNT(*) FILTER (WHERE address IS NOT NULL AND address <> '') AS with_address,
+    COUNT(*) FILTER (WHERE open_hours IS NOT NULL AND open_hours <> '') AS with_open_hours,
+    COUNT(*) FILTER (WHERE break_time IS NOT NULL AND break_time <> '') AS with_break_time,
+    COUNT(*) FILTER (WHERE last_order IS NOT NULL AND last_order <> '') AS with_last_order,
+    COUNT(*) FILTER (WHERE holiday IS NOT NULL AND holiday <> '') AS with_holiday,
+    now() AS refreshed_at
+FROM stores;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stores_stats_id ON stores_stats(id);
+
 -- 함수 생성: 거리 기반 검색
 CREATE OR REPLACE FUNCTION find_nearby_stores(
     lat DECIMAL(10, 8),
@@ -10,8 +10,7 @@ import json
 import re
 import os
 from datetime import datetime
-from typing import List, Dict, Optional, Union
-from urllib.parse import urlparse
+from typing import List, Dict, Optional, Tuple, Union
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,6 +23,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _quote_sql_literal(text: str) -> str:
+    """작은따옴표를 이스케이프한 SQL 문자열 리터럴 생성"""
+    # 따옴표가 없는 대부분의 값은 replace 없이 바로 감싸기
+    if "'" in text:
+        text = text.replace("'", "''")
+    return f"'{text}'"
+
+# 이미지 URL을 수집할 크롤링 DB 필드
+IMAGE_FIELDS = ['main_image', 'image_urls', 'menu_images', 'interior_images']
+
 class SafeMigration:
     """안전한 데이터 마이그레이션 클래스"""
     
@@ -38,6 +47,18 @@ class SafeMigration:
         self.crawler_conn = self._create_connection(self.crawler_db_url)
         logger.info("크롤링 DB 연결 완료")
         
+        # 크롤링 DB 컬럼 타입을 한 번만 확인하여 행마다 isinstance 분기를 타지 않도록 변환기 선택
+        self._column_types = self._load_column_types()
+        if self._column_types.get('refill_items') == 'ARRAY':
+            self._process_refill_items = self._process_refill_items_list
+        self._image_list_fields = [f for f in IMAGE_FIELDS if self._column_types.get(f) == 'ARRAY']
+        self._image_text_fields = [f for f in IMAGE_FIELDS if self._column_types.get(f) == 'text']
+        self._image_other_fields = [
+            f for f in IMAGE_FIELDS
+            if f not in self._image_list_fields and f not in self._image_text_fields
+        ]
+        self._price_details_is_array = self._column_types.get('price_details') == 'ARRAY'
+        
         # 메인 프로젝트 스키마 정의 (변경하지 않을 원본 스키마)
         self.main_schema = {
             'required_fields': ['name', 'address', 'position_lat', 'position_lng', 'position_x', 'position_y'],
@@ -62,19 +83,35 @@ class SafeMigration:
     def _create_connection(self, db_url: str):
         """DB 연결 생성"""
         try:
-            parsed = urlparse(db_url)
-            config = {
-                'host': parsed.hostname,
-                'port': parsed.port or 5432,
-                'database': parsed.path[1:] if parsed.path else 'postgres',
-                'user': parsed.username,
-                'password': parsed.password
-            }
-            return psycopg2.connect(**config)
+            # libpq가 postgresql:// DSN을 직접 파싱 (URL 인코딩된 비밀번호 포함)
+            # keepalive로 장시간 마이그레이션 중 NAT 타임아웃에 의한 연결 끊김 방지
+            conn = psycopg2.connect(dsn=db_url, connect_timeout=10, keepalives=1, keepalives_idle=30)
+            # JSONB 컬럼은 조회 시점에 바로 파이썬 객체로 디코딩
+            psycopg2.extras.register_default_jsonb(conn_or_curs=conn, loads=json.loads)
+            return conn
         except Exception as e:
             logger.error(f"DB 연결 실패 ({db_url}): {e}")
             raise
     
+    def _load_column_types(self) -> Dict[str, str]:
+        """크롤링 DB stores 테이블의 컬럼 타입 조회"""
+        cursor = self.crawler_conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT column_name, data_type
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                AND table_name = 'stores'
+            """)
+            return dict(cursor.fetchall())
+        except Exception as e:
+            # 타입을 알 수 없으면 범용 변환 경로 사용
+            self.crawler_conn.rollback()
+            logger.warning(f"컬럼 타입 조회 실패, 범용 변환 사용: {e}")
+            return {}
+        finally:
+            cursor.close()
+    
     def get_crawler_stores(self, limit: Optional[int] = None) -> List[Dict]:
         """크롤링 DB에서 데이터 조회 (기존 크롤링 스키마 그대로 사용)"""
         try:
@@ -115,10 +152,8 @@ class SafeMigration:
             converted['address'] = self._safe_text(crawler_store.get('address'), '주소 정보 없음')
             
             # 2. 위치 정보 처리 (메인 프로젝트 NOT NULL)
-            converted['position_lat'] = self._safe_coordinate(crawler_store.get('position_lat'), 37.5665)  # 서울시청
-            converted['position_lng'] = self._safe_coordinate(crawler_store.get('position_lng'), 126.9780)
-            converted['position_x'] = self._safe_coordinate(crawler_store.get('position_x'), converted['position_lng'])
-            converted['position_y'] = self._safe_coordinate(crawler_store.get('position_y'), converted['position_lat'])
+            (converted['position_lat'], converted['position_lng'],
+             converted['position_x'], converted['position_y']) = self._safe_position(crawler_store)
             
             # 3. 선택적 필드 처리
             converted['description'] = self._generate_description(crawler_store)
@@ -158,6 +193,19 @@ class SafeMigration:
         except (ValueError, TypeError):
             return default
     
+    def _safe_position(self, store: Dict) -> Tuple[float, float, float, float]:
+        """위치 필드 4개를 한 번에 변환 (lat, lng, x, y)"""
+        lat = self._safe_coordinate(store.get('position_lat'), 37.5665)  # 서울시청
+        lng = self._safe_coordinate(store.get('position_lng'), 126.9780)
+        
+        # x/y가 없으면 변환 없이 lng/lat을 그대로 사용
+        x = store.get('position_x')
+        y = store.get('position_y')
+        x = lng if x is None else self._safe_coordinate(x, lng)
+        y = lat if y is None else self._safe_coordinate(y, lat)
+        
+        return lat, lng, x, y
+    
     def _safe_float(self, value) -> Optional[float]:
         """안전한 float 변환"""
         if value is None:
@@ -223,15 +271,16 @@ class SafeMigration:
                 return str(price).strip()
         
         # price_details 배열에서 추출
-        if store.get('price_details') and isinstance(store['price_details'], list):
-            details = [str(p) for p in store['price_details'] if p]
+        price_details = store.get('price_details')
+        if price_details and (self._price_details_is_array or isinstance(price_details, list)):
+            details = [str(p) for p in price_details if p]
             if details:
                 return ', '.join(details[:3])  # 상위 3개만
         
         return None
     
     def _process_refill_items(self, store: Dict) -> List[str]:
-        """무한리필 아이템 처리"""
+        """무한리필 아이템 처리 (컬럼 타입을 모를 때의 범용 경로)"""
         items = set()
         
         # 기존 refill_items 필드
@@ -241,6 +290,15 @@ class SafeMigration:
             elif isinstance(store['refill_items'], str):
                 items.add(store['refill_items'])
         
+        return self._finalize_refill_items(items, store)
+    
+    def _process_refill_items_list(self, store: Dict) -> List[str]:
+        """무한리필 아이템 처리 (refill_items가 text[] 컬럼인 경우)"""
+        items = {str(item) for item in store.get('refill_items') or () if item}
+        return self._finalize_refill_items(items, store)
+    
+    def _finalize_refill_items(self, items: set, store: Dict) -> List[str]:
+        """refill_type 보강 및 아이템 정리"""
         # refill_type에서 추출
         if store.get('refill_type'):
             refill_type = str(store['refill_type'])
@@ -263,10 +321,16 @@ class SafeMigration:
         """이미지 URL 처리"""
         urls = set()
         
-        # 다양한 이미지 필드에서 수집
-        image_fields = ['main_image', 'image_urls', 'menu_images', 'interior_images']
+        # 다양한 이미지 필드에서 수집 (컬럼 타입별로 미리 분류된 필드 사용)
+        for field in self._image_list_fields:
+            urls.update(str(url) for url in store.get(field) or () if url)
+        
+        for field in self._image_text_fields:
+            value = store.get(field)
+            if value:
+                urls.add(value)
         
-        for field in image_fields:
+        for field in self._image_other_fields:
             value = store.get(field)
             if value:
                 if isinstance(value, list):
@@ -353,13 +417,13 @@ INSERT INTO stores (
         """SQL 문자열 이스케이프"""
         if value is None:
             return 'NULL'
-        return f"'{str(value).replace(chr(39), chr(39)*2)}'"  # 작은따옴표 이스케이프
+        return _quote_sql_literal(str(value))
     
     def _array_to_sql(self, arr: List[str]) -> str:
         """배열을 SQL 형식으로 변환"""
         if not arr:
             return 'ARRAY[]::text[]'
-        escaped_items = [f"'{item.replace(chr(39), chr(39)*2)}'" for item in arr]
+        escaped_items = [_quote_sql_literal(item) for item in arr]
         return f"ARRAY[{','.join(escaped_items)}]"
     
     def close(self):
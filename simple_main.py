@@ -5,7 +5,13 @@
 
 import sys
 import os
+import re
+import json
+import time
+import atexit
+import threading
 import logging
+import logging.handlers
 from datetime import datetime
 from pathlib import Path
 
@@ -13,19 +19,104 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# 로깅 설정
+# 로깅 설정 (파일 기록은 100건 단위로 모아서 쓰고, ERROR 이상은 즉시 기록)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler(f'logs/simple_crawler_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8')
+# MemoryHandler는 레코드를 그대로 넘기므로 대상 파일 핸들러에 포맷을 직접 지정
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(f'logs/simple_crawler_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8'),
+        logging.handlers.MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=_file_handler),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# 스레드별 크롤러/DB 연결 (크롤러는 실행 종료 시, DB 연결은 프로세스 종료 시 정리)
+_resources = threading.local()
+
+def _close_quietly(resource):
+    """리소스 정리 (오류 무시)"""
+    try:
+        resource.close()
+    except Exception:
+        pass
+
+def _get_crawler():
+    """현재 스레드의 DiningCodeCrawler 반환 (최초 호출 시 생성)"""
+    crawler = getattr(_resources, 'crawler', None)
+    if crawler is None:
+        from src.core.crawler import DiningCodeCrawler
+        crawler = _resources.crawler = DiningCodeCrawler()
+    return crawler
+
+def _release_crawler():
+    """현재 스레드의 크롤러 종료 및 제거 (실패한 드라이버가 다음 실행에 재사용되지 않도록)"""
+    crawler = getattr(_resources, 'crawler', None)
+    _resources.crawler = None
+    if crawler is not None:
+        _close_quietly(crawler)
+
+def _get_db():
+    """현재 스레드의 공유 DatabaseManager 반환 (최초 호출 시 생성)"""
+    db = getattr(_resources, 'db', None)
+    if db is None:
+        from src.core.database import DatabaseManager
+        db = _resources.db = DatabaseManager()
+        atexit.register(_close_quietly, db)
+    return db
+
+def _short(text, n=50):
+    """로그용 축약 (n자 초과 시 잘라서 '…' 추가, 값이 없으면 'N/A')"""
+    if not text:
+        return 'N/A'
+    return text[:n] + '…' if len(text) > n else text
+
+# 상세 정보 병렬 수집에 사용할 브라우저 수
+DETAIL_FETCH_WORKERS = 3
+
+def _fetch_store_details(stores, crawler):
+    """가게 상세 정보를 여러 크롤러로 나누어 병렬 수집 (입력 순서 유지, 실패는 None)"""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.crawler import DiningCodeCrawler
+    
+    total = len(stores)
+    workers = max(1, min(DETAIL_FETCH_WORKERS, total))
+    
+    def fetch_share(worker_index):
+        # Selenium 드라이버는 스레드 간 공유할 수 없으므로 워커마다 별도 크롤러 사용
+        worker_crawler = crawler if worker_index == 0 else DiningCodeCrawler()
+        results = []
+        try:
+            for i in range(worker_index, total, workers):
+                store = stores[i]
+                logger.info(f"상세 정보 수집 중... ({i + 1}/{total}) {store.get('name', 'Unknown')}")
+                try:
+                    results.append(worker_crawler.get_store_detail(store))
+                except Exception as e:
+                    logger.error(f"가게 상세 정보 수집 실패: {e}")
+                    results.append(None)
+            return results
+        finally:
+            if worker_crawler is not crawler:
+                worker_crawler.close()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        shares = list(executor.map(fetch_share, range(workers)))
+    
+    details = [None] * total
+    for worker_index, results in enumerate(shares):
+        details[worker_index::workers] = results
+    return details
+
 def run_enhanced_crawling():
     """개선된 크롤링 실행 (강남 지역 테스트)"""
+    return bool(crawl_enhanced_stores())
+
+def crawl_enhanced_stores():
+    """개선된 크롤링 실행 후 저장된 가게 목록 반환 (실패 시 빈 목록, 스케줄러의 구별 실행에서도 사용)"""
     try:
         # 로그 디렉토리 생성
         os.makedirs('logs', exist_ok=True)
@@ -34,17 +125,20 @@ def run_enhanced_crawling():
         logger.info("📍 강남 지역 크롤링을 실행합니다...")
         logger.info("✨ 개선된 기능: 주소 추출, 영업시간, break_time, last_order 수집")
         
-        # 크롤러 임포트 및 실행
-        from src.core.crawler import DiningCodeCrawler
-        from src.core.database import DatabaseManager
+        from config.config import TEST_REGION_CV, TEST_RECT_CV, TEST_KEYWORDS_CV
+        
+        # 크롤러 초기화 (이번 실행 동안만 사용하고 종료 시 정리)
+        crawler = _get_crawler()
+        db = _get_db()
         
-        # 크롤러 초기화
-        crawler = DiningCodeCrawler()
-        db = DatabaseManager()
+        # 크롤링 설정 (스케줄러가 컨텍스트로 지정한 구가 있으면 우선, 없으면 강남)
+        region = TEST_REGION_CV.get()
+        keywords = TEST_KEYWORDS_CV.get()
+        keyword = keywords[0] if keywords else "서울 강남 무한리필"
+        rect = TEST_RECT_CV.get() or "37.4979,127.0276,37.5279,127.0576"  # 강남 지역 좌표
         
-        # 강남 지역 크롤링 설정
-        keyword = "서울 강남 무한리필"
-        rect = "37.4979,127.0276,37.5279,127.0576"  # 강남 지역 좌표
+        if region:
+            logger.info(f"대상 지역: {region}")
         
         logger.info(f"검색 키워드: {keyword}")
         logger.info(f"검색 영역: {rect}")
@@ -55,28 +149,30 @@ def run_enhanced_crawling():
         
         if not stores:
             logger.warning("수집된 가게가 없습니다.")
-            return False
+            return []
         
-        # 상세 정보 수집
+        # 상세 정보 수집 (여러 브라우저로 나누어 병렬 수집)
         detailed_stores = []
         success_count = 0
         
-        for i, store in enumerate(stores, 1):
+        for detail_info in _fetch_store_details(stores, crawler):
+            if not detail_info:
+                continue
+            
             try:
-                logger.info(f"상세 정보 수집 중... ({i}/{len(stores)}) {store.get('name', 'Unknown')}")
+                detailed_stores.append(detail_info)
+                success_count += 1
+                
+                # 개선된 기능 확인 로그 (가게당 한 번의 로그 호출)
+                logger.info(
+                    "  ✅ 주소: %s\n  ✅ 영업시간: %s\n  ✅ 브레이크타임: %s\n  ✅ 라스트오더: %s\n  ✅ 휴무일: %s",
+                    _short(detail_info.get('address')),
+                    _short(detail_info.get('open_hours')),
+                    detail_info.get('break_time', 'N/A'),
+                    detail_info.get('last_order', 'N/A'),
+                    detail_info.get('holiday', 'N/A')
+                )
                 
-                detail_info = crawler.get_store_detail(store)
-                if detail_info:
-                    detailed_stores.append(detail_info)
-                    success_count += 1
-                    
-                    # 개선된 기능 확인 로그
-                    logger.info(f"  ✅ 주소: {detail_info.get('address', 'N/A')[:50]}...")
-                    logger.info(f"  ✅ 영업시간: {detail_info.get('open_hours', 'N/A')[:50]}...")
-                    logger.info(f"  ✅ 브레이크타임: {detail_info.get('break_time', 'N/A')}")
-                    logger.info(f"  ✅ 라스트오더: {detail_info.get('last_order', 'N/A')}")
-                    logger.info(f"  ✅ 휴무일: {detail_info.get('holiday', 'N/A')}")
-                    
             except Exception as e:
                 logger.error(f"가게 상세 정보 수집 실패: {e}")
                 continue
@@ -96,113 +192,162 @@ def run_enhanced_crawling():
                 # 개선된 기능 통계
                 check_improvement_stats(detailed_stores)
                 
-                return True
+                return detailed_stores
                 
             except Exception as e:
                 logger.error(f"데이터베이스 저장 실패: {e}")
-                return False
+                return []
         else:
             logger.warning("저장할 데이터가 없습니다.")
-            return False
+            return []
             
     except Exception as e:
         logger.error(f"크롤링 실행 중 오류: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        return False
+        return []
     
     finally:
-        # 리소스 정리
-        try:
-            crawler.close()
-            db.close()
-        except:
-            pass
+        # 상주 워커 스레드가 실행 사이에 브라우저를 붙잡고 있지 않도록 실행마다 정리
+        _release_crawler()
+
+# 요일별 영업시간 판별 패턴 (요일 문자 중 하나라도 포함)
+_WEEKDAY_RE = re.compile('[월화수목금토일]')
+
+# 이 가게 수 이상이면 pandas로 집계 (작은 실행은 import 비용 생략)
+PANDAS_STATS_THRESHOLD = 500
+
+IMPROVEMENT_FIELDS = ('address', 'open_hours', 'break_time', 'last_order', 'holiday')
+
+def _count_improvement_fields(stores):
+    """필드별 수집 가게 수와 요일별 영업시간 가게 수 집계 (한 번의 순회)"""
+    counts = dict.fromkeys(IMPROVEMENT_FIELDS, 0)
+    weekday_pattern_count = 0
+    for store in stores:
+        hours = store.get('open_hours') or ''
+        counts['address'] += bool(store.get('address'))
+        counts['open_hours'] += bool(hours)
+        counts['break_time'] += bool(store.get('break_time'))
+        counts['last_order'] += bool(store.get('last_order'))
+        counts['holiday'] += bool(store.get('holiday'))
+        # 요일별 영업시간 (월화수목금토일 패턴 확인)
+        weekday_pattern_count += 1 if _WEEKDAY_RE.search(hours) else 0
+    return counts, weekday_pattern_count
+
+def _count_improvement_fields_pandas(stores):
+    """대량 실행용 pandas 집계 (_count_improvement_fields와 같은 결과)"""
+    import pandas as pd
+    
+    df = pd.DataFrame(stores).reindex(columns=IMPROVEMENT_FIELDS).fillna('')
+    counts = {field: int(count) for field, count in df.ne('').sum().items()}
+    weekday_pattern_count = int(df['open_hours'].astype(str).str.contains(_WEEKDAY_RE.pattern, regex=True).sum())
+    return counts, weekday_pattern_count
 
 def check_improvement_stats(stores):
     """개선된 기능 통계 확인"""
     logger.info("🔍 개선된 기능 통계 확인:")
     
+    total = len(stores)
+    if total >= PANDAS_STATS_THRESHOLD:
+        counts, weekday_pattern_count = _count_improvement_fields_pandas(stores)
+    else:
+        counts, weekday_pattern_count = _count_improvement_fields(stores)
+    address_count = counts['address']
+    hours_count = counts['open_hours']
+    break_count = counts['break_time']
+    last_order_count = counts['last_order']
+    holiday_count = counts['holiday']
+    
     # 주소 수집률
-    address_count = sum(1 for store in stores if store.get('address'))
-    address_rate = (address_count / len(stores)) * 100
-    logger.info(f"  📍 주소 수집률: {address_count}/{len(stores)} ({address_rate:.1f}%)")
+    address_rate = (address_count / total) * 100
+    logger.info(f"  📍 주소 수집률: {address_count}/{total} ({address_rate:.1f}%)")
     
     # 영업시간 수집률
-    hours_count = sum(1 for store in stores if store.get('open_hours'))
-    hours_rate = (hours_count / len(stores)) * 100
-    logger.info(f"  🕐 영업시간 수집률: {hours_count}/{len(stores)} ({hours_rate:.1f}%)")
+    hours_rate = (hours_count / total) * 100
+    logger.info(f"  🕐 영업시간 수집률: {hours_count}/{total} ({hours_rate:.1f}%)")
     
     # 브레이크타임 수집률
-    break_count = sum(1 for store in stores if store.get('break_time'))
-    break_rate = (break_count / len(stores)) * 100
-    logger.info(f"  ☕ 브레이크타임 수집률: {break_count}/{len(stores)} ({break_rate:.1f}%)")
+    break_rate = (break_count / total) * 100
+    logger.info(f"  ☕ 브레이크타임 수집률: {break_count}/{total} ({break_rate:.1f}%)")
     
     # 라스트오더 수집률
-    last_order_count = sum(1 for store in stores if store.get('last_order'))
-    last_order_rate = (last_order_count / len(stores)) * 100
-    logger.info(f"  🍽️ 라스트오더 수집률: {last_order_count}/{len(stores)} ({last_order_rate:.1f}%)")
+    last_order_rate = (last_order_count / total) * 100
+    logger.info(f"  🍽️ 라스트오더 수집률: {last_order_count}/{total} ({last_order_rate:.1f}%)")
     
     # 휴무일 수집률
-    holiday_count = sum(1 for store in stores if store.get('holiday'))
-    holiday_rate = (holiday_count / len(stores)) * 100
-    logger.info(f"  🚫 휴무일 수집률: {holiday_count}/{len(stores)} ({holiday_rate:.1f}%)")
+    holiday_rate = (holiday_count / total) * 100
+    logger.info(f"  🚫 휴무일 수집률: {holiday_count}/{total} ({holiday_rate:.1f}%)")
     
-    # 요일별 영업시간 수집률 (월화수목금토일 패턴 확인)
-    weekday_pattern_count = 0
-    for store in stores:
-        hours = store.get('open_hours', '')
-        if any(day in hours for day in ['월', '화', '수', '목', '금', '토', '일']):
-            weekday_pattern_count += 1
+    # 요일별 영업시간 수집률
+    weekday_rate = (weekday_pattern_count / total) * 100
+    logger.info(f"  📅 요일별 영업시간 수집률: {weekday_pattern_count}/{total} ({weekday_rate:.1f}%)")
+
+# 서울시 주요 지역 설정 (간소화)
+SEOUL_REGIONS = [
+    {"name": "강남", "keyword": "서울 강남 무한리필", "rect": "37.4979,127.0276,37.5279,127.0576"},
+    {"name": "강북", "keyword": "서울 강북 무한리필", "rect": "37.6279,127.0076,37.6579,127.0376"},
+    {"name": "마포", "keyword": "서울 마포 무한리필", "rect": "37.5379,126.8976,37.5679,126.9276"},
+    {"name": "송파", "keyword": "서울 송파 무한리필", "rect": "37.4779,127.0876,37.5079,127.1176"},
+    {"name": "영등포", "keyword": "서울 영등포 무한리필", "rect": "37.5079,126.8876,37.5379,126.9176"}
+]
+
+# 동시에 크롤링할 지역 수 (지역마다 브라우저를 하나씩 사용)
+FULL_CRAWL_MAX_WORKERS = 3
+
+def _crawl_region(region) -> list:
+    """지역 하나의 가게 상세 정보 수집 (워커 스레드에서 실행)"""
+    from src.core.crawler import DiningCodeCrawler
+    
+    logger.info(f"📍 {region['name']} 지역 크롤링 시작")
     
-    weekday_rate = (weekday_pattern_count / len(stores)) * 100
-    logger.info(f"  📅 요일별 영업시간 수집률: {weekday_pattern_count}/{len(stores)} ({weekday_rate:.1f}%)")
+    # Selenium 드라이버는 스레드 간 공유할 수 없으므로 지역별로 생성
+    crawler = DiningCodeCrawler()
+    try:
+        # 지역별 크롤링
+        stores = crawler.get_store_list(region['keyword'], region['rect'])
+        if not stores:
+            return []
+        
+        # 상세 정보 수집
+        detailed_stores = []
+        for store in stores:
+            detail_info = crawler.get_store_detail(store)
+            if detail_info:
+                detailed_stores.append(detail_info)
+        
+        logger.info(f"{region['name']} 지역: {len(detailed_stores)}개 수집")
+        return detailed_stores
+    
+    finally:
+        try:
+            crawler.close()
+        except:
+            pass
 
 def run_full_crawling():
     """전체 서울 크롤링 실행 (간소화 버전)"""
     try:
         logger.info("🚀 전체 서울 크롤링 시스템 시작")
         
-        from src.core.crawler import DiningCodeCrawler
-        from src.core.database import DatabaseManager
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         
-        crawler = DiningCodeCrawler()
-        db = DatabaseManager()
+        all_stores = []
         
-        # 서울시 주요 지역 설정 (간소화)
-        seoul_regions = [
-            {"name": "강남", "keyword": "서울 강남 무한리필", "rect": "37.4979,127.0276,37.5279,127.0576"},
-            {"name": "강북", "keyword": "서울 강북 무한리필", "rect": "37.6279,127.0076,37.6579,127.0376"},
-            {"name": "마포", "keyword": "서울 마포 무한리필", "rect": "37.5379,126.8976,37.5679,126.9276"},
-            {"name": "송파", "keyword": "서울 송파 무한리필", "rect": "37.4779,127.0876,37.5079,127.1176"},
-            {"name": "영등포", "keyword": "서울 영등포 무한리필", "rect": "37.5079,126.8876,37.5379,126.9176"}
-        ]
+        # 지역은 서로 독립적이므로 병렬로 크롤링 (전체 시간 ≈ 가장 느린 지역)
+        with ThreadPoolExecutor(max_workers=FULL_CRAWL_MAX_WORKERS) as executor:
+            futures = {executor.submit(_crawl_region, region): region for region in SEOUL_REGIONS}
+            for future in as_completed(futures):
+                region = futures[future]
+                try:
+                    all_stores.extend(future.result())
+                except Exception as e:
+                    logger.error(f"{region['name']} 지역 크롤링 실패: {e}")
         
+        # 모든 지역의 결과를 한 번에 저장
         total_stores = 0
-        
-        for region in seoul_regions:
-            logger.info(f"📍 {region['name']} 지역 크롤링 시작")
-            
-            try:
-                # 지역별 크롤링
-                stores = crawler.get_store_list(region['keyword'], region['rect'])
-                
-                if stores:
-                    # 상세 정보 수집
-                    detailed_stores = []
-                    for store in stores:
-                        detail_info = crawler.get_store_detail(store)
-                        if detail_info:
-                            detailed_stores.append(detail_info)
-                    
-                    if detailed_stores:
-                        inserted_count = db.insert_stores_batch(detailed_stores)
-                        total_stores += len(inserted_count)
-                        logger.info(f"{region['name']} 지역: {len(inserted_count)}개 저장")
-            
-            except Exception as e:
-                logger.error(f"{region['name']} 지역 크롤링 실패: {e}")
-                continue
+        if all_stores:
+            inserted_count = _get_db().insert_stores_batch(all_stores)
+            total_stores = len(inserted_count)
         
         logger.info(f"🎉 전체 크롤링 완료! 총 {total_stores}개 가게 수집")
         return True
@@ -210,21 +355,115 @@ def run_full_crawling():
     except Exception as e:
         logger.error(f"전체 크롤링 실행 중 오류: {e}")
         return False
+
+# 상태 확인용 집계 쿼리 (한 번의 테이블 스캔으로 전체/필드별 개수 조회)
+STORE_STATS_QUERY = """
+    SELECT
+        COUNT(*),
+        COUNT(*) FILTER (WHERE address IS NOT NULL AND address <> ''),
+        COUNT(*) FILTER (WHERE break_time IS NOT NULL AND break_time <> ''),
+        COUNT(*) FILTER (WHERE last_order IS NOT NULL AND last_order <> '')
+    FROM stores
+"""
+
+# 추정 가게 수가 이 값 이상이면 전체 스캔 대신 통계 추정치만 사용
+EXACT_COUNT_THRESHOLD = 5000
+
+def _fast_store_count(cursor) -> int:
+    """pg_class 통계 기반 가게 수 추정 (테이블 스캔 없음, 미분석 테이블은 -1)"""
+    cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = 'stores'")
+    row = cursor.fetchone()
+    return row[0] if row else -1
+
+def _fetch_stats(db):
+    """가게 수와 주소/브레이크타임/라스트오더 보유 가게 수 조회 (stores_stats view 우선)"""
+    try:
+        row = db.get_store_stats()
+    except Exception as e:
+        logger.warning(f"통계 view 조회 실패, 테이블에서 직접 집계: {e}")
+        row = None
+    
+    if row:
+        return {
+            "store_count": row["total"],
+            "estimated": False,
+            "refreshed_at": row["refreshed_at"].strftime('%Y-%m-%d %H:%M'),
+            "address_count": row["with_address"],
+            "break_time_count": row["with_break_time"],
+            "last_order_count": row["with_last_order"]
+        }
     
+    cursor = db.pg_conn.cursor()
+    try:
+        return _fetch_table_stats(cursor)
     finally:
-        try:
-            crawler.close()
-            db.close()
-        except:
-            pass
+        cursor.close()
+
+def _fetch_table_stats(cursor):
+    """stores 테이블에서 직접 집계 (대용량이면 추정치)"""
+    estimate = _fast_store_count(cursor)
+    if estimate >= EXACT_COUNT_THRESHOLD:
+        # 대용량 테이블은 추정치만 반환 (필드별 개수는 전체 스캔이 필요하므로 생략)
+        return {
+            "store_count": estimate,
+            "estimated": True,
+            "address_count": None,
+            "break_time_count": None,
+            "last_order_count": None
+        }
+    
+    cursor.execute(STORE_STATS_QUERY)
+    store_count, address_count, break_time_count, last_order_count = cursor.fetchone()
+    return {
+        "store_count": store_count,
+        "estimated": False,
+        "address_count": address_count,
+        "break_time_count": break_time_count,
+        "last_order_count": last_order_count
+    }
+
+# 상태 확인 통계 캐시 (반복 호출 시 TTL 동안 테이블 스캔 생략)
+STATS_CACHE_PATH = os.path.join('logs', '.stats_cache.json')
+STATS_CACHE_TTL_SECONDS = 600
+
+def _load_cached_stats():
+    """TTL 이내의 캐시된 통계 반환 (없거나 만료되면 None)"""
+    try:
+        with open(STATS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if time.time() - cached.get('ts', 0) >= STATS_CACHE_TTL_SECONDS:
+        return None
+    return cached.get('stats')
+
+def _save_cached_stats(stats):
+    """통계를 캐시 파일에 저장"""
+    try:
+        os.makedirs(os.path.dirname(STATS_CACHE_PATH), exist_ok=True)
+        with open(STATS_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'ts': time.time(), 'stats': stats}, f)
+    except OSError as e:
+        logger.warning(f"통계 캐시 저장 실패: {e}")
+
+def refresh_store_stats():
+    """크롤링 실행 종료 후 통계 view 갱신 및 상태 확인 캐시 무효화"""
+    try:
+        _get_db().refresh_stats_view()
+    except Exception as e:
+        logger.warning(f"가게 통계 갱신 실패: {e}")
+    try:
+        os.remove(STATS_CACHE_PATH)
+    except OSError:
+        pass
 
 def check_database_status():
     """데이터베이스 상태 확인"""
     try:
         logger.info("🔍 데이터베이스 상태 확인")
         
-        from src.core.database import DatabaseManager
-        db = DatabaseManager()
+        db = _get_db()
         
         # 기본 연결 테스트
         if not db.test_connection():
@@ -235,33 +474,36 @@ def check_database_status():
         
         # 테이블 확인
         try:
-            cursor = db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM stores")
-            store_count = cursor.fetchone()[0]
-            logger.info(f"📊 현재 저장된 가게 수: {store_count}개")
-            
-            # 개선된 필드 확인
-            cursor.execute("SELECT COUNT(*) FROM stores WHERE address IS NOT NULL AND address != ''")
-            address_count = cursor.fetchone()[0]
-            address_rate = (address_count / store_count * 100) if store_count > 0 else 0
-            logger.info(f"📍 주소 보유 가게: {address_count}개 ({address_rate:.1f}%)")
+            stats = _load_cached_stats()
+            cached_mark = " (캐시)" if stats else ""
+            if stats is None:
+                stats = _fetch_stats(db)
+                _save_cached_stats(stats)
             
-            cursor.execute("SELECT COUNT(*) FROM stores WHERE break_time IS NOT NULL AND break_time != ''")
-            break_time_count = cursor.fetchone()[0]
-            break_time_rate = (break_time_count / store_count * 100) if store_count > 0 else 0
-            logger.info(f"☕ 브레이크타임 보유 가게: {break_time_count}개 ({break_time_rate:.1f}%)")
-            
-            cursor.execute("SELECT COUNT(*) FROM stores WHERE last_order IS NOT NULL AND last_order != ''")
-            last_order_count = cursor.fetchone()[0]
-            last_order_rate = (last_order_count / store_count * 100) if store_count > 0 else 0
-            logger.info(f"🍽️ 라스트오더 보유 가게: {last_order_count}개 ({last_order_rate:.1f}%)")
-            
-            cursor.close()
+            store_count = stats["store_count"]
+            if stats.get("refreshed_at"):
+                logger.info(f"🕒 통계 기준 시각: {stats['refreshed_at']}")
+            if stats["estimated"]:
+                logger.info(f"📊 현재 저장된 가게 수: ~{store_count}개 (추정치, 필드별 통계 생략){cached_mark}")
+            else:
+                logger.info(f"📊 현재 저장된 가게 수: {store_count}개{cached_mark}")
+                
+                # 개선된 필드 확인
+                address_count = stats["address_count"]
+                address_rate = (address_count / store_count * 100) if store_count > 0 else 0
+                logger.info(f"📍 주소 보유 가게: {address_count}개 ({address_rate:.1f}%){cached_mark}")
+                
+                break_time_count = stats["break_time_count"]
+                break_time_rate = (break_time_count / store_count * 100) if store_count > 0 else 0
+                logger.info(f"☕ 브레이크타임 보유 가게: {break_time_count}개 ({break_time_rate:.1f}%){cached_mark}")
+                
+                last_order_count = stats["last_order_count"]
+                last_order_rate = (last_order_count / store_count * 100) if store_count > 0 else 0
+                logger.info(f"🍽️ 라스트오더 보유 가게: {last_order_count}개 ({last_order_rate:.1f}%){cached_mark}")
             
         except Exception as e:
             logger.warning(f"테이블 상태 확인 실패: {e}")
         
-        db.close()
         return True
         
     except Exception as e:
@@ -301,6 +543,10 @@ def main():
         print("🔍 데이터베이스 상태 확인 모드")
         success = check_database_status()
     
+    # 크롤링 실행 후 상태 확인용 통계를 한 번만 갱신
+    if args.mode != 'check':
+        refresh_store_stats()
+    
     if success:
         print("✅ 실행 완료!")
     else:
@@ -5,13 +5,20 @@
 
 import asyncio
 import logging
-import schedule
+import logging.handlers
+import queue
 import time
+import os
 import json
-import psutil
-from typing import Dict, List, Optional, Any
+import hashlib
+import heapq
+import sqlite3
+import orjson
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
+from functools import partial
+from collections import defaultdict
 from pathlib import Path
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -23,22 +30,63 @@ from .exception_handler import ExceptionHandler, ExceptionConfig
 from .store_status_manager import StoreStatusManager, StatusConfig
 from .notification_system import NotificationSystem, NotificationConfig
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('automated_operations.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# 로깅 설정 (실행 중에는 이벤트 루프가 디스크 쓰기에 막히지 않도록 큐를 거쳐 별도 스레드에서 기록)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+class _QueuedLogging:
+    """루트 로거를 QueueHandler로 전환하고 리스너 스레드에서 파일/콘솔에 기록"""
+    
+    def __init__(self):
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._handlers: List[logging.Handler] = []
+        self._prev_root_handlers: List[logging.Handler] = []
+        self._prev_root_level = logging.NOTSET
+    
+    def start(self):
+        """큐 기반 로깅 시작 (이미 시작했으면 무시)"""
+        if self._listener is not None:
+            return
+        
+        self._handlers = [
+            logging.FileHandler('automated_operations.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+        for handler in self._handlers:
+            handler.setFormatter(_log_formatter)
+        
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(log_queue, *self._handlers)
+        
+        # basicConfig는 이미 핸들러가 있으면 무시되므로 루트 핸들러를 직접 교체
+        root = logging.getLogger()
+        self._prev_root_handlers = root.handlers[:]
+        self._prev_root_level = root.level
+        root.handlers = [logging.handlers.QueueHandler(log_queue)]
+        root.setLevel(logging.INFO)
+        
+        self._listener.start()
+    
+    def stop(self):
+        """큐에 남은 로그를 기록하고 기존 루트 핸들러 복원"""
+        if self._listener is None:
+            return
+        
+        root = logging.getLogger()
+        root.handlers = self._prev_root_handlers
+        root.setLevel(self._prev_root_level)
+        
+        self._listener.stop()
+        self._listener = None
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = []
+
+@dataclass(slots=True, frozen=True)
 class OperationConfig:
     """운영 설정"""
     # 스케줄링 설정
-    daily_crawling_time: str = "02:00"  # 새벽 2시 일일 크롤링
+    daily_crawling_time: str = "02:00"  # 새벽 2시 야간 작업 (크롤링/품질 검증/상태 확인)
     quality_check_time: str = "03:00"   # 새벽 3시 품질 검증
     status_check_time: str = "04:00"    # 새벽 4시 상태 확인
     weekly_report_day: str = "monday"   # 월요일 주간 보고서
@@ -57,7 +105,7 @@ class OperationConfig:
     log_retention_days: int = 30        # 로그 보관 기간
     report_retention_days: int = 90     # 보고서 보관 기간
 
-@dataclass
+@dataclass(slots=True)
 class SystemStatus:
     """시스템 상태"""
     is_running: bool = False
@@ -70,32 +118,135 @@ class SystemStatus:
     active_stores: int = 0
     failed_stores: int = 0
 
+# 상태별 가게 수 캐시 유지 시간 (초)
+HEALTH_CACHE_TTL_SECONDS = 60
+
+# 복구 시도 시 DB 응답 대기 한도 (초)
+RECOVERY_PROBE_TIMEOUT_SECONDS = 5
+
+# 정리 작업 시 한 트랜잭션에서 삭제할 최대 행 수
+CLEANUP_BATCH_SIZE = 5000
+
+# 상태 저장 요청을 모아서 기록하는 대기 시간 (초)
+STATUS_SAVE_DEBOUNCE_SECONDS = 2
+
+# DB/정리 작업 전용 스레드 수 (이벤트 루프 기본 풀은 DNS 조회 등에 그대로 사용)
+OFFLOAD_MAX_WORKERS = 2
+
+# 시스템 정보에 표시할 다음 예약 작업 수
+UPCOMING_JOBS_LIMIT = 5
+
+# 상태 파일에서 datetime으로 복원할 필드
+DATETIME_STATUS_FIELDS = frozenset({'last_crawling', 'last_quality_check', 'last_status_check'})
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+@dataclass(slots=True)
+class ScheduledJob:
+    """예약 작업"""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    next_run: datetime
+    interval: timedelta
+
+    def advance(self, now: datetime):
+        """다음 실행 시각으로 이동 (밀린 회차는 건너뜀)"""
+        while self.next_run <= now:
+            self.next_run += self.interval
+
+def _next_time_of_day(at: str, now: datetime, weekday: Optional[int] = None) -> datetime:
+    """다음 HH:MM 시각 계산 (weekday 지정 시 해당 요일 기준)"""
+    hour, minute = map(int, at.split(":"))
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if weekday is not None:
+        run_at += timedelta(days=(weekday - now.weekday()) % 7)
+    if run_at <= now:
+        run_at += timedelta(weeks=1) if weekday is not None else timedelta(days=1)
+    return run_at
+
 class AutomatedOperations:
     """통합 자동화 운영 시스템"""
     
     def __init__(self, config: OperationConfig):
         self.config = config
+        self._config_dict = asdict(config)  # 설정은 초기화 후 변경되지 않음
         self.db_path = "refill_spot_crawler.db"  # DATABASE_CONFIG['database']
         self.is_running = False
-        self.scheduler_thread = None
+        self.jobs: List[ScheduledJob] = []
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._running_tasks = set()
+        self._task_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._health_cache: Optional[Tuple[float, Dict[str, int]]] = None
+        self._last_status_hash: Optional[bytes] = None
+        self._save_task: Optional[asyncio.Task] = None
+        self._queued_logging = _QueuedLogging()
         
         # 시스템 상태
         self.status = SystemStatus()
         
+        # 공용 SQLite 연결 (전용 작업 스레드에서 공유하므로 락으로 직렬화)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._db_lock = threading.Lock()
+        self._offload_executor = ThreadPoolExecutor(
+            max_workers=OFFLOAD_MAX_WORKERS, thread_name_prefix="ops-offload"
+        )
+        
+        # 저널 모드 및 인덱스 확인
+        self._enable_wal()
+        self._ensure_indexes()
+        
         # 하위 시스템 초기화
         self._initialize_subsystems()
         
         # 스케줄러 설정
         self._setup_scheduler()
         
+        # 수동 실행 가능한 작업
+        self._task_map: Dict[str, Callable[[], Awaitable[Any]]] = {
+            "crawling": self.run_daily_crawling,
+            "quality_check": self.run_quality_check,
+            "status_check": self.run_status_check,
+            "weekly_report": self.generate_weekly_report,
+            "health_check": self.health_check,
+            "cleanup": self.cleanup_old_data,
+        }
+        
         # 상태 파일 경로
         self.status_file = Path("system_status.json")
         
         logger.info("자동화 운영 시스템 초기화 완료")
     
+    def _enable_wal(self):
+        """WAL 모드 설정 (정리 작업 중에도 다른 읽기/쓰기 허용)"""
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        except Exception as e:
+            logger.warning(f"WAL 모드 설정 실패: {e}")
+    
+    def _ensure_indexes(self):
+        """상태 확인/정리 쿼리용 인덱스 생성"""
+        try:
+            with self._conn as conn:
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_stores_status ON stores(status)")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_crawling_logs_created_at "
+                    "ON crawling_logs(created_at)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_quality_issues_created_resolved "
+                    "ON quality_issues(created_at, resolved)"
+                )
+        except Exception as e:
+            logger.warning(f"인덱스 생성 실패: {e}")
+    
     def _initialize_subsystems(self):
         """하위 시스템 초기화"""
         try:
+            # 하위 시스템이 공유하는 PostgreSQL 연결
+            self.db = DatabaseManager()
+            
             # 품질 검증 시스템
             quality_config = QualityConfig(
                 coordinate_validation_enabled=True,
@@ -105,7 +256,7 @@ class AutomatedOperations:
                 similarity_threshold=0.85,
                 cluster_eps=0.3
             )
-            self.quality_system = QualityAssurance(quality_config, self.db_path)
+            self.quality_system = QualityAssurance(quality_config, self.db_path, self.db)
             
             # 예외 처리 시스템
             exception_config = ExceptionConfig(
@@ -117,7 +268,7 @@ class AutomatedOperations:
                 max_retries=3,
                 retry_delay=5
             )
-            self.exception_handler = ExceptionHandler(exception_config)
+            self.exception_handler = ExceptionHandler(exception_config, self.db)
             
             # 상태 관리 시스템
             status_config = StatusConfig(
@@ -128,7 +279,7 @@ class AutomatedOperations:
                 closure_detection_days=30,
                 inactive_threshold_days=90
             )
-            self.status_manager = StoreStatusManager(status_config, self.db_path)
+            self.status_manager = StoreStatusManager(status_config, self.db_path, self.db)
             
             # 알림 시스템
             notification_config = NotificationConfig(
@@ -140,7 +291,7 @@ class AutomatedOperations:
                 email_password=None,  # 실제 사용 시 설정
                 email_recipients=[]
             )
-            self.notification_system = NotificationSystem(notification_config, self.db_path)
+            self.notification_system = NotificationSystem(notification_config, self.db_path, self.db)
             
             logger.info("모든 하위 시스템 초기화 완료")
             
@@ -151,33 +302,26 @@ class AutomatedOperations:
     def _setup_scheduler(self):
         """스케줄러 설정"""
         try:
-            # 일일 크롤링
-            schedule.every().day.at(self.config.daily_crawling_time).do(
-                self._schedule_daily_crawling
-            )
-            
-            # 품질 검증
-            schedule.every().day.at(self.config.quality_check_time).do(
-                self._schedule_quality_check
-            )
-            
-            # 상태 확인
-            schedule.every().day.at(self.config.status_check_time).do(
-                self._schedule_status_check
-            )
-            
-            # 주간 보고서
-            getattr(schedule.every(), self.config.weekly_report_day).at(
-                self.config.weekly_report_time
-            ).do(self._schedule_weekly_report)
-            
-            # 상태 모니터링
-            schedule.every(self.config.health_check_interval).minutes.do(
-                self._schedule_health_check
-            )
-            
-            # 일일 정리 작업
-            schedule.every().day.at("01:00").do(self._schedule_cleanup)
+            now = datetime.now()
+            daily = timedelta(days=1)
+            health_interval = timedelta(minutes=self.config.health_check_interval)
+            weekday = WEEKDAYS.index(self.config.weekly_report_day.lower())
+            
+            self.jobs = [
+                # 야간 작업 (크롤링 + 품질 검증 + 상태 확인 동시 실행)
+                ScheduledJob("nightly", self.run_nightly,
+                             _next_time_of_day(self.config.daily_crawling_time, now), daily),
+                # 주간 보고서
+                ScheduledJob("weekly_report", self.generate_weekly_report,
+                             _next_time_of_day(self.config.weekly_report_time, now, weekday),
+                             timedelta(weeks=1)),
+                # 상태 모니터링
+                ScheduledJob("health_check", partial(self.health_check, force=True),
+                             now + health_interval, health_interval),
+                # 일일 정리 작업
+                ScheduledJob("cleanup", self.cleanup_old_data,
+                             _next_time_of_day("01:00", now), daily),
+            ]
             
             logger.info("스케줄러 설정 완료")
             
@@ -185,35 +329,46 @@ class AutomatedOperations:
             logger.error(f"스케줄러 설정 실패: {e}")
             raise
     
-    def _schedule_daily_crawling(self):
-        """일일 크롤링 스케줄"""
-        asyncio.create_task(self.run_daily_crawling())
-    
-    def _schedule_quality_check(self):
-        """품질 검증 스케줄"""
-        asyncio.create_task(self.run_quality_check())
-    
-    def _schedule_status_check(self):
-        """상태 확인 스케줄"""
-        asyncio.create_task(self.run_status_check())
-    
-    def _schedule_weekly_report(self):
-        """주간 보고서 스케줄"""
-        asyncio.create_task(self.generate_weekly_report())
+    async def _run_scheduler(self):
+        """가장 가까운 예약 시각까지 대기한 뒤 도래한 작업 실행"""
+        while self.status.is_running:
+            now = datetime.now()
+            for job in self.jobs:
+                if job.next_run <= now:
+                    job.advance(now)
+                    task = asyncio.create_task(self._run_singleton(job.name, job.func), name=job.name)
+                    self._running_tasks.add(task)
+                    task.add_done_callback(self._running_tasks.discard)
+            
+            next_run = min(job.next_run for job in self.jobs)
+            await asyncio.sleep(max((next_run - datetime.now()).total_seconds(), 0))
     
-    def _schedule_health_check(self):
-        """상태 모니터링 스케줄"""
-        asyncio.create_task(self.health_check())
+    async def _run_singleton(self, name: str, func: Callable[[], Awaitable[Any]]):
+        """같은 작업이 아직 실행 중이면 이번 회차는 건너뜀"""
+        lock = self._task_locks[name]
+        if lock.locked():
+            logger.warning(f"{name} 작업이 아직 실행 중이므로 건너뜀")
+            return
+        async with lock:
+            await func()
     
-    def _schedule_cleanup(self):
-        """정리 작업 스케줄"""
-        asyncio.create_task(self.cleanup_old_data())
+    async def run_nightly(self):
+        """야간 작업 실행 (서로 독립적인 작업을 동시에 실행)"""
+        results = await asyncio.gather(
+            self.run_daily_crawling(),
+            self.run_quality_check(),
+            self.run_status_check(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"야간 작업 중 오류: {result}")
     
     async def run_daily_crawling(self):
         """일일 크롤링 실행"""
         try:
             logger.info("일일 크롤링 시작")
-            start_time = datetime.now()
+            start_time = time.monotonic()
             
             # 크롤링 실행 (서울 전체 크롤링)
             from main import run_stage4_seoul_coverage
@@ -227,10 +382,13 @@ class AutomatedOperations:
                 self.status.last_crawling = datetime.now()
                 self.status.error_count = 0
                 
+                # 상태 확인용 가게 통계는 크롤링 실행 종료 시 한 번만 갱신
+                await self._offload(self.db.refresh_stats_view)
+                
                 # 일일 보고서 발송
                 await self.notification_system.send_daily_report()
                 
-                logger.info(f"일일 크롤링 완료 (소요시간: {datetime.now() - start_time})")
+                logger.info(f"일일 크롤링 완료 (소요시간: {time.monotonic() - start_time:.1f}초)")
             else:
                 self.status.error_count += 1
                 await self.notification_system.send_error_alert(
@@ -306,7 +464,7 @@ class AutomatedOperations:
             logger.info("주간 보고서 생성 시작")
             
             # 주간 보고서 생성
-            report_path = self.notification_system.generate_weekly_report()
+            report_path = await self.notification_system.generate_weekly_report()
             
             if report_path:
                 logger.info(f"주간 보고서 생성 완료: {report_path}")
@@ -321,23 +479,39 @@ class AutomatedOperations:
                 "보고서 생성 오류", str(e), "low"
             )
     
-    async def health_check(self):
+    async def _offload(self, func: Callable, *args) -> Any:
+        """블로킹 DB 작업을 전용 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._offload_executor, partial(func, *args))
+    
+    def _get_store_counts(self, force: bool = False) -> Dict[str, int]:
+        """상태별 가게 수 조회 (TTL 캐시)"""
+        if not force and self._health_cache:
+            cached_at, counts = self._health_cache
+            if time.monotonic() - cached_at < HEALTH_CACHE_TTL_SECONDS:
+                return counts
+        
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            # 상태별 건수를 한 번의 스캔으로 집계
+            cursor.execute("SELECT status, COUNT(*) FROM stores GROUP BY status")
+            counts = dict(cursor.fetchall())
+        
+        self._health_cache = (time.monotonic(), counts)
+        return counts
+    
+    async def health_check(self, force: bool = False):
         """시스템 상태 확인"""
         try:
             # 데이터베이스 연결 확인
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM stores WHERE status = 'active'")
-                self.status.active_stores = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM stores")
-                self.status.total_stores = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM stores WHERE status = 'failed'")
-                self.status.failed_stores = cursor.fetchone()[0]
+            counts = await self._offload(self._get_store_counts, force)
+            
+            self.status.active_stores = counts.get('active', 0)
+            self.status.failed_stores = counts.get('failed', 0)
+            self.status.total_stores = sum(counts.values())
             
             # 시스템 상태 저장
-            self._save_status()
+            self._request_status_save()
             
             # 연속 실패 시 알림
             if self.status.error_count >= self.config.error_alert_threshold:
@@ -355,6 +529,14 @@ class AutomatedOperations:
             logger.error(f"상태 확인 중 오류: {e}")
             self.status.last_error = str(e)
     
+    def _probe_db(self):
+        """데이터베이스 응답 확인 (정리 작업이 공용 연결을 잡고 있어도 기다리지 않도록 별도 연결 사용)"""
+        conn = sqlite3.connect(self.db_path, timeout=RECOVERY_PROBE_TIMEOUT_SECONDS)
+        try:
+            conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        finally:
+            conn.close()
+    
     async def _attempt_auto_recovery(self):
         """자동 복구 시도"""
         try:
@@ -363,15 +545,13 @@ class AutomatedOperations:
             for attempt in range(self.config.max_recovery_attempts):
                 logger.info(f"복구 시도 {attempt + 1}/{self.config.max_recovery_attempts}")
                 
-                # 시스템 재시작 시뮬레이션
-                await asyncio.sleep(self.config.recovery_delay_minutes * 60)
-                
-                # 간단한 테스트 실행
+                # 먼저 확인하고, 실패한 경우에만 지수적으로 대기
                 try:
-                    with sqlite3.connect(self.db_path) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT 1")
-                        
+                    await asyncio.wait_for(
+                        self._offload(self._probe_db),
+                        timeout=RECOVERY_PROBE_TIMEOUT_SECONDS
+                    )
+                    
                     logger.info(f"복구 시도 {attempt + 1} 성공")
                     self.status.error_count = 0
                     
@@ -383,8 +563,8 @@ class AutomatedOperations:
                     return True
                     
                 except Exception as e:
-                    logger.error(f"복구 시도 {attempt + 1} 실패: {e}")
-                    continue
+                    logger.error(f"복구 시도 {attempt + 1} 실패: {e!r}")
+                    await asyncio.sleep(min(2 ** attempt, self.config.recovery_delay_minutes * 60))
             
             # 모든 복구 시도 실패
             await self.notification_system.send_error_alert(
@@ -398,6 +578,42 @@ class AutomatedOperations:
             logger.error(f"자동 복구 중 오류: {e}")
             return False
     
+    def _delete_old_records(self, log_cutoff: datetime) -> int:
+        """보관 기간이 지난 로그/품질 이슈 삭제 (배치 단위 커밋)"""
+        queries = [
+            # 오래된 크롤링 로그 삭제
+            """
+                DELETE FROM crawling_logs WHERE rowid IN (
+                    SELECT rowid FROM crawling_logs
+                    WHERE created_at < ? LIMIT ?
+                )
+            """,
+            # 오래된 품질 이슈 삭제
+            """
+                DELETE FROM quality_issues WHERE rowid IN (
+                    SELECT rowid FROM quality_issues
+                    WHERE created_at < ? AND resolved = 1 LIMIT ?
+                )
+            """,
+        ]
+        
+        # CURRENT_TIMESTAMP와 같은 'YYYY-MM-DD HH:MM:SS' 형식으로 비교
+        cutoff = log_cutoff.isoformat(sep=' ', timespec='seconds')
+        
+        deleted_logs = 0
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            
+            for query in queries:
+                while True:
+                    cursor.execute(query, (cutoff, CLEANUP_BATCH_SIZE))
+                    self._conn.commit()
+                    deleted_logs += cursor.rowcount
+                    if cursor.rowcount < CLEANUP_BATCH_SIZE:
+                        break
+        
+        return deleted_logs
+    
     async def cleanup_old_data(self):
         """오래된 데이터 정리"""
         try:
@@ -405,33 +621,18 @@ class AutomatedOperations:
             
             # 오래된 로그 삭제
             log_cutoff = datetime.now() - timedelta(days=self.config.log_retention_days)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 오래된 크롤링 로그 삭제
-                cursor.execute("""
-                    DELETE FROM crawling_logs 
-                    WHERE created_at < ?
-                """, (log_cutoff,))
-                
-                # 오래된 품질 이슈 삭제
-                cursor.execute("""
-                    DELETE FROM quality_issues 
-                    WHERE created_at < ? AND resolved = 1
-                """, (log_cutoff,))
-                
-                deleted_logs = cursor.rowcount
-                conn.commit()
+            deleted_logs = await self._offload(self._delete_old_records, log_cutoff)
             
             # 오래된 보고서 파일 삭제
             reports_dir = Path("reports")
             if reports_dir.exists():
                 report_cutoff = datetime.now() - timedelta(days=self.config.report_retention_days)
+                cutoff_ts = report_cutoff.timestamp()
                 
-                for file_path in reports_dir.glob("*"):
-                    if file_path.stat().st_mtime < report_cutoff.timestamp():
-                        file_path.unlink()
+                with os.scandir(reports_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                            os.unlink(entry.path)
             
             logger.info(f"데이터 정리 완료 (삭제된 로그: {deleted_logs}건)")
             
@@ -441,29 +642,45 @@ class AutomatedOperations:
     def _save_status(self):
         """시스템 상태 저장"""
         try:
-            status_data = asdict(self.status)
-            # datetime 객체를 문자열로 변환
-            for key, value in status_data.items():
-                if isinstance(value, datetime):
-                    status_data[key] = value.isoformat() if value else None
-            
-            with open(self.status_file, 'w', encoding='utf-8') as f:
-                json.dump(status_data, f, ensure_ascii=False, indent=2)
+            # orjson이 dataclass/datetime을 직접 직렬화
+            data = orjson.dumps(self.status, option=orjson.OPT_INDENT_2)
+            
+            # 내용이 바뀌지 않았으면 기록 생략
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._last_status_hash:
+                return
+            
+            # 임시 파일에 쓴 뒤 교체 (중간에 중단되어도 기존 파일 보존)
+            tmp_file = self.status_file.with_suffix('.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.status_file)
+            self._last_status_hash = digest
                 
         except Exception as e:
             logger.error(f"상태 저장 실패: {e}")
     
+    def _request_status_save(self):
+        """상태 저장 예약 (짧은 시간 내 여러 요청은 한 번으로 합침)"""
+        if self._save_task and not self._save_task.done():
+            return
+        self._save_task = asyncio.create_task(self._save_status_later())
+    
+    async def _save_status_later(self):
+        """대기 후 상태 저장"""
+        await asyncio.sleep(STATUS_SAVE_DEBOUNCE_SECONDS)
+        self._save_status()
+    
     def _load_status(self):
         """시스템 상태 로드"""
         try:
             if self.status_file.exists():
-                with open(self.status_file, 'r', encoding='utf-8') as f:
-                    status_data = json.load(f)
+                status_data = orjson.loads(self.status_file.read_bytes())
                 
                 # 문자열을 datetime 객체로 변환
-                for key, value in status_data.items():
-                    if key in ['last_crawling', 'last_quality_check', 'last_status_check'] and value:
-                        status_data[key] = datetime.fromisoformat(value)
+                status_data = {
+                    key: datetime.fromisoformat(value) if key in DATETIME_STATUS_FIELDS and value else value
+                    for key, value in status_data.items()
+                }
                 
                 self.status = SystemStatus(**status_data)
                 logger.info("시스템 상태 로드 완료")
@@ -474,6 +691,7 @@ class AutomatedOperations:
     def start(self):
         """시스템 시작"""
         try:
+            self._queued_logging.start()
             logger.info("자동화 운영 시스템 시작")
             
             # 기존 상태 로드
@@ -481,15 +699,8 @@ class AutomatedOperations:
             
             self.status.is_running = True
             
-            # 스케줄러 실행
-            def run_scheduler():
-                while self.status.is_running:
-                    schedule.run_pending()
-                    time.sleep(60)  # 1분마다 확인
-            
-            # 별도 스레드에서 스케줄러 실행
-            scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-            scheduler_thread.start()
+            # 실행 중인 이벤트 루프에서 스케줄러 실행
+            self._scheduler_task = asyncio.create_task(self._run_scheduler())
             
             logger.info("자동화 운영 시스템 시작 완료")
             
@@ -497,31 +708,53 @@ class AutomatedOperations:
             logger.error(f"시스템 시작 실패: {e}")
             raise
     
-    def stop(self):
+    async def stop(self):
         """시스템 중지"""
         try:
             logger.info("자동화 운영 시스템 중지")
             
             self.status.is_running = False
+            
+            # 스케줄러와 실행 중인 작업을 취소하고 종료될 때까지 대기
+            pending = [
+                task for task in (self._scheduler_task, self._save_task, *self._running_tasks)
+                if task and not task.done()
+            ]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            
             self._save_status()
+            await self.exception_handler.close()
+            await self.notification_system.aclose()
+            
+            # 진행 중인 DB 작업이 끝난 뒤 공용 연결 종료 (대기는 루프 밖에서)
+            await asyncio.get_running_loop().run_in_executor(None, self._offload_executor.shutdown)
+            self._conn.close()
+            self.db.close()
             
             logger.info("자동화 운영 시스템 중지 완료")
             
         except Exception as e:
             logger.error(f"시스템 중지 실패: {e}")
+        finally:
+            # 큐에 남은 로그 기록 후 리스너 종료
+            self._queued_logging.stop()
     
     def get_system_info(self) -> Dict[str, Any]:
         """시스템 정보 조회"""
         return {
             "status": asdict(self.status),
-            "config": asdict(self.config),
+            "config": self._config_dict,
             "uptime": datetime.now().isoformat(),
             "next_scheduled_tasks": [
                 {
-                    "job": str(job.job_func),
-                    "next_run": job.next_run.isoformat() if job.next_run else None
+                    "job": job.name,
+                    "next_run": job.next_run.isoformat()
                 }
-                for job in schedule.jobs
+                for job in heapq.nsmallest(
+                    UPCOMING_JOBS_LIMIT, self.jobs, key=lambda job: job.next_run
+                )
             ]
         }
     
@@ -530,22 +763,13 @@ class AutomatedOperations:
         try:
             logger.info(f"수동 작업 실행: {task_type}")
             
-            if task_type == "crawling":
-                await self.run_daily_crawling()
-            elif task_type == "quality_check":
-                await self.run_quality_check()
-            elif task_type == "status_check":
-                await self.run_status_check()
-            elif task_type == "weekly_report":
-                await self.generate_weekly_report()
-            elif task_type == "health_check":
-                await self.health_check()
-            elif task_type == "cleanup":
-                await self.cleanup_old_data()
-            else:
+            task_func = self._task_map.get(task_type)
+            if not task_func:
                 logger.error(f"알 수 없는 작업 유형: {task_type}")
                 return False
             
+            await task_func()
+            
             logger.info(f"수동 작업 완료: {task_type}")
             return True
             
@@ -584,15 +808,14 @@ async def main():
         logger.info(f"시스템 정보: {json.dumps(system_info, ensure_ascii=False, indent=2)}")
         
         # 무한 실행 (실제 운영 시)
-        while True:
-            await asyncio.sleep(3600)  # 1시간마다 대기
+        await asyncio.Event().wait()
             
     except KeyboardInterrupt:
         logger.info("사용자에 의한 시스템 중지")
     except Exception as e:
         logger.error(f"시스템 실행 중 오류: {e}")
     finally:
-        automation.stop()
+        await automation.stop()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -5,21 +5,81 @@
 
 import logging
 import time
+import atexit
+import threading
 import random
 import json
+import orjson
 import requests
 import asyncio
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+import aiohttp
+from typing import List, Dict, Optional, Sequence, Tuple
+from datetime import datetime
+from dataclasses import dataclass, field
+from collections import deque, Counter
 import re
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+import heapq
+import functools
+from urllib.parse import urlsplit, urlunsplit
+import lxml.html
 from ..core.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# 브라우저처럼 보이기 위한 기본 요청 헤더 (User-Agent 제외)
+BROWSER_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# 실패율 이동 평균에 반영할 대략적인 이벤트 수 (alpha = 2 / (N + 1))
+FAILURE_RATE_WINDOW_EVENTS = 100
+
+# 실패율을 신뢰하기 위한 최소 관측 이벤트 수 (그 전에는 0으로 간주)
+FAILURE_RATE_MIN_EVENTS = 20
+
+# 비활성화된 프록시를 다시 사용할 수 있을 때까지의 시간
+PROXY_REACTIVATION_DELAY = 3600.0  # 초
+
+# 백업 전략 HTTP 요청 제한 시간
+BACKUP_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# 대소문자 구분 없이 class 속성 비교용 (XPath 1.0에는 lower-case()가 없음)
+_XPATH_LOWER_CLASS = 'translate(@class, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")'
+
+# 클래스명을 단어 단위로 나누는 패턴 (CamelCase / 소문자 연속)
+_CLASS_TOKEN_RE = re.compile(r'[A-Z][a-z]*|[a-z]+')
+
+# 차단으로 판단하는 HTTP 상태 코드
+_BLOCK_STATUSES = frozenset({403, 429, 503})
+
+# 에러 메시지의 'selector: <셀렉터>' 부분
+_SELECTOR_RE = re.compile(r'selector:\s*(\S+)')
+
+# 에러 패턴 분류 규칙 (앞쪽 규칙 우선)
+_ERROR_PATTERN_RULES = (
+    ('selector_missing', re.compile(r'element not found|no such element', re.IGNORECASE)),
+    ('timeout', re.compile(r'timeout', re.IGNORECASE)),
+    ('ip_blocked', re.compile(r'blocked|forbidden', re.IGNORECASE)),
+    ('rate_limit', re.compile(r'rate limit', re.IGNORECASE)),
+)
+
+def _classify_error(error_message: str) -> str:
+    """에러 메시지를 패턴으로 분류"""
+    for pattern, regex in _ERROR_PATTERN_RULES:
+        if regex.search(error_message):
+            return pattern
+    return 'unknown'
+
+@functools.lru_cache(maxsize=256)
+def _extract_keywords(old_selector: str) -> Tuple[str, ...]:
+    """클래스 셀렉터에서 소문자 키워드 추출 (셀렉터 종류가 적어 캐시)"""
+    old_class = old_selector.replace('.', '')
+    return tuple(keyword.lower() for keyword in _CLASS_TOKEN_RE.findall(old_class))
+
 @dataclass
 class ExceptionConfig:
     """예외 처리 설정"""
@@ -37,10 +97,11 @@ class CrawlingFailure:
     url: str
     error_type: str
     error_message: str
-    timestamp: datetime
+    timestamp: float  # epoch 초 (time.time), 저장 시에만 datetime으로 변환
     retry_count: int = 0
     user_agent: str = ""
     proxy: str = ""
+    error_pattern: str = ""  # 기록 시 한 번 분류한 에러 패턴
 
 @dataclass
 class StructureChange:
@@ -62,16 +123,35 @@ class ProxyInfo:
     protocol: str = "http"
     is_active: bool = True
     failure_count: int = 0
-    last_used: Optional[datetime] = None
+    last_used: Optional[float] = None  # time.monotonic
     success_rate: float = 100.0
+    proxy_dict: Dict[str, str] = field(init=False, repr=False)  # requests용 (접속 정보는 생성 후 불변)
+    
+    def __post_init__(self):
+        if self.username and self.password:
+            proxy_url = f"{self.protocol}://{self.username}:{self.password}@{self.host}:{self.port}"
+        else:
+            proxy_url = f"{self.protocol}://{self.host}:{self.port}"
+        self.proxy_dict = {
+            'http': proxy_url,
+            'https': proxy_url
+        }
 
 class WebsiteStructureMonitor:
     """웹사이트 구조 변경 감지"""
     
-    def __init__(self):
-        self.db_manager = DatabaseManager()
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        self.db_manager = db_manager or DatabaseManager()
+        self.session = create_resilient_crawler_session()
+        # (도메인, 기존 셀렉터) -> 발견한 새 셀렉터
+        self._selector_cache: Dict[Tuple[str, str], str] = {}
         self.failure_threshold = 0.7  # 70% 이상 실패 시 구조 변경 의심
-        self.time_window = timedelta(hours=1)  # 1시간 윈도우
+        self.time_window = 3600.0  # 1시간 윈도우 (초)
+        # 성공/실패 지수 이동 평균
+        self._ewma_alpha = 2 / (FAILURE_RATE_WINDOW_EVENTS + 1)
+        self._success_ewma = 0.0
+        self._failure_ewma = 0.0
+        self._event_count = 0
         self.known_selectors = {
             'diningcode': {
                 'store_list': '.Restaurant_ListItem',
@@ -85,12 +165,12 @@ class WebsiteStructureMonitor:
             }
         }
     
-    def detect_structure_changes(self, failures: List[CrawlingFailure]) -> List[StructureChange]:
-        """크롤링 실패율 급증 시 구조 변경 감지"""
+    def detect_structure_changes(self, recent_failures: Sequence[CrawlingFailure],
+                                 error_patterns: Optional[Dict[str, int]] = None) -> List[StructureChange]:
+        """크롤링 실패율 급증 시 구조 변경 감지 (recent_failures: 윈도우로 정리된 실패 목록, error_patterns: 미리 집계된 패턴별 건수)"""
         changes = []
         
         # 시간대별 실패율 분석
-        recent_failures = self._filter_recent_failures(failures)
         failure_rate = self._calculate_failure_rate(recent_failures)
         
         logger.info(f"최근 1시간 크롤링 실패율: {failure_rate:.1%}")
@@ -99,7 +179,8 @@ class WebsiteStructureMonitor:
             logger.warning(f"크롤링 실패율 급증 감지: {failure_rate:.1%}")
             
             # 실패 패턴 분석
-            error_patterns = self._analyze_error_patterns(recent_failures)
+            if error_patterns is None:
+                error_patterns = self._analyze_error_patterns(recent_failures)
             
             for pattern, count in error_patterns.items():
                 if count > len(recent_failures) * 0.3:  # 30% 이상의 실패가 같은 패턴
@@ -109,80 +190,72 @@ class WebsiteStructureMonitor:
         
         return changes
     
-    def _filter_recent_failures(self, failures: List[CrawlingFailure]) -> List[CrawlingFailure]:
-        """최근 시간 윈도우 내 실패만 필터링"""
-        cutoff_time = datetime.now() - self.time_window
-        return [f for f in failures if f.timestamp >= cutoff_time]
+    def record_event(self, success: bool):
+        """크롤링 성공/실패를 이동 평균에 반영"""
+        alpha = self._ewma_alpha
+        self._success_ewma = alpha * success + (1 - alpha) * self._success_ewma
+        self._failure_ewma = alpha * (not success) + (1 - alpha) * self._failure_ewma
+        self._event_count += 1
     
-    def _calculate_failure_rate(self, failures: List[CrawlingFailure]) -> float:
-        """실패율 계산"""
-        if not failures:
+    def _calculate_failure_rate(self, failures: Sequence[CrawlingFailure]) -> float:
+        """실패율 계산 (성공/실패 이동 평균 기반)"""
+        if not failures or self._event_count < FAILURE_RATE_MIN_EVENTS:
             return 0.0
         
-        # 총 시도 횟수 추정 (실패 + 성공)
-        # 실제로는 성공 로그도 필요하지만, 여기서는 실패 기반으로 추정
-        total_attempts = len(failures) * 2  # 간단한 추정
-        return len(failures) / total_attempts
+        total = self._success_ewma + self._failure_ewma
+        return self._failure_ewma / total if total else 0.0
     
-    def _analyze_error_patterns(self, failures: List[CrawlingFailure]) -> Dict[str, int]:
+    def _analyze_error_patterns(self, failures: Sequence[CrawlingFailure]) -> Dict[str, int]:
         """에러 패턴 분석"""
-        patterns = defaultdict(int)
-        
-        for failure in failures:
-            # 에러 메시지에서 패턴 추출
-            error_msg = failure.error_message.lower()
-            
-            if 'element not found' in error_msg or 'no such element' in error_msg:
-                patterns['selector_missing'] += 1
-            elif 'timeout' in error_msg:
-                patterns['timeout'] += 1
-            elif 'blocked' in error_msg or 'forbidden' in error_msg:
-                patterns['ip_blocked'] += 1
-            elif 'rate limit' in error_msg:
-                patterns['rate_limit'] += 1
-            else:
-                patterns['unknown'] += 1
-        
+        patterns = Counter(
+            failure.error_pattern or _classify_error(failure.error_message)
+            for failure in failures
+        )
         return dict(patterns)
     
-    def _identify_structure_change(self, pattern: str, failures: List[CrawlingFailure]) -> Optional[StructureChange]:
+    def _identify_structure_change(self, pattern: str, failures: Sequence[CrawlingFailure]) -> Optional[StructureChange]:
         """구조 변경 식별"""
         if pattern == 'selector_missing':
             # 가장 많이 실패한 셀렉터 찾기
-            selector_failures = defaultdict(int)
-            
-            for failure in failures:
-                # URL에서 셀렉터 정보 추출 (로그에 포함되어 있다고 가정)
-                if 'selector:' in failure.error_message:
-                    selector = failure.error_message.split('selector:')[1].split()[0]
-                    selector_failures[selector] += 1
+            # 에러 메시지에서 셀렉터 정보 추출 (로그에 포함되어 있다고 가정)
+            selector_failures = Counter(
+                match.group(1)
+                for match in map(_SELECTOR_RE.search, (f.error_message for f in failures))
+                if match
+            )
             
             if selector_failures:
-                most_failed_selector = max(selector_failures, key=selector_failures.get)
+                most_failed_selector, count = selector_failures.most_common(1)[0]
                 
                 return StructureChange(
                     url=failures[0].url,
                     change_type='selector_missing',
                     old_selector=most_failed_selector,
                     detected_at=datetime.now(),
-                    confidence=selector_failures[most_failed_selector] / len(failures)
+                    confidence=count / len(failures)
                 )
         
         return None
     
     def auto_detect_new_selectors(self, url: str, old_selector: str) -> Optional[str]:
         """새로운 셀렉터 자동 감지"""
+        # 같은 도메인에서 이미 찾은 셀렉터는 재사용
+        cache_key = (urlsplit(url).netloc, old_selector)
+        if cache_key in self._selector_cache:
+            return self._selector_cache[cache_key]
+        
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = lxml.html.fromstring(response.content)
             
             # 기존 셀렉터와 유사한 새로운 셀렉터 찾기
-            new_selector = self._find_similar_selector(soup, old_selector)
+            new_selector = self._find_similar_selector(tree, old_selector)
             
             if new_selector:
                 logger.info(f"새로운 셀렉터 발견: {old_selector} -> {new_selector}")
+                self._selector_cache[cache_key] = new_selector
                 return new_selector
             
         except Exception as e:
@@ -190,17 +263,24 @@ class WebsiteStructureMonitor:
         
         return None
     
-    def _find_similar_selector(self, soup: BeautifulSoup, old_selector: str) -> Optional[str]:
+    def _find_similar_selector(self, tree: lxml.html.HtmlElement, old_selector: str) -> Optional[str]:
         """유사한 셀렉터 찾기"""
         # 클래스명에서 키워드 추출
         if '.' in old_selector:
-            old_class = old_selector.replace('.', '')
-            keywords = re.findall(r'[A-Z][a-z]*|[a-z]+', old_class)
+            keywords = _extract_keywords(old_selector)
+            if not keywords:
+                return None
+            
+            # 키워드를 포함한 class를 가진 첫 요소를 lxml(C)에서 바로 검색
+            condition = ' or '.join(
+                f'contains({_XPATH_LOWER_CLASS}, $k{i})' for i in range(len(keywords))
+            )
+            variables = {f'k{i}': keyword for i, keyword in enumerate(keywords)}
             
-            # 유사한 클래스명 찾기
-            for element in soup.find_all(class_=True):
-                for class_name in element.get('class', []):
-                    if any(keyword.lower() in class_name.lower() for keyword in keywords):
+            keyword_re = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+            for element in tree.xpath(f'(//*[{condition}])[1]', **variables):
+                for class_name in element.get('class', '').split():
+                    if keyword_re.search(class_name):
                         return f'.{class_name}'
         
         return None
@@ -213,28 +293,34 @@ class IPBlockDetector:
             'blocked', 'forbidden', '403', '429', 'rate limit',
             'too many requests', 'access denied', 'captcha'
         ]
-        self.consecutive_failures = deque(maxlen=10)
+        # 모든 지표를 한 번에 검사하는 정규식
+        self._block_re = re.compile(
+            '|'.join(re.escape(indicator) for indicator in self.block_indicators),
+            re.IGNORECASE
+        )
         self.block_threshold = 5  # 연속 5회 실패 시 차단 의심
+        self.block_window_seconds = 300.0  # 5분 내 연속 실패
+        # 최근 실패 시각 (time.monotonic)
+        self.consecutive_failures = deque(maxlen=self.block_threshold)
+    
+    def record_failure(self):
+        """크롤링 실패 시각 기록"""
+        self.consecutive_failures.append(time.monotonic())
     
     def is_ip_blocked(self, error_message: str, status_code: int = None) -> bool:
         """IP 차단 여부 확인"""
-        error_lower = error_message.lower()
+        # HTTP 상태 코드 기반 확인 (가장 저렴하므로 먼저)
+        if status_code is not None and status_code in _BLOCK_STATUSES:
+            return True
         
         # 에러 메시지 기반 확인
-        for indicator in self.block_indicators:
-            if indicator in error_lower:
-                return True
-        
-        # HTTP 상태 코드 기반 확인
-        if status_code in [403, 429, 503]:
+        if self._block_re.search(error_message):
             return True
         
-        # 연속 실패 패턴 확인
-        self.consecutive_failures.append(datetime.now())
-        if len(self.consecutive_failures) >= self.block_threshold:
-            time_span = self.consecutive_failures[-1] - self.consecutive_failures[0]
-            if time_span < timedelta(minutes=5):  # 5분 내 연속 실패
-                return True
+        # 연속 실패 패턴 확인 (최근 block_threshold회 실패가 윈도우 안에 몰렸는지)
+        failures = self.consecutive_failures
+        if len(failures) == failures.maxlen and failures[-1] - failures[0] < self.block_window_seconds:
+            return True
         
         return False
     
@@ -268,6 +354,12 @@ class ProxyRotationManager:
     def __init__(self):
         self.proxies: List[ProxyInfo] = []
         self.current_proxy_index = 0
+        # 활성 프록시 힙 (-성공률, 실패 횟수, 순번, 프록시) - 상태가 바뀌면 새 항목을 넣고 이전 항목은 무효 처리
+        self._proxy_heap: List[Tuple[float, int, int, ProxyInfo]] = []
+        self._heap_seq: Dict[int, int] = {}
+        self._seq = 0
+        # 재활성화 예정 힙 (재활성화 가능 시각, 순번, 프록시)
+        self._reactivation_heap: List[Tuple[float, int, ProxyInfo]] = []
         self.load_proxy_list()
         
     def load_proxy_list(self):
@@ -284,6 +376,7 @@ class ProxyRotationManager:
                 protocol=proxy_data.get('protocol', 'http')
             )
             self.proxies.append(proxy)
+            self._push_proxy(proxy)
         
         # 기본 프록시가 없으면 무료 프록시 서비스 사용
         if not self.proxies:
@@ -303,38 +396,64 @@ class ProxyRotationManager:
                 port=proxy_data['port']
             )
             self.proxies.append(proxy)
+            self._push_proxy(proxy)
+    
+    def _push_proxy(self, proxy: ProxyInfo):
+        """현재 성공률 기준으로 힙에 등록 (같은 프록시의 이전 항목은 무효)"""
+        self._seq += 1
+        self._heap_seq[id(proxy)] = self._seq
+        heapq.heappush(self._proxy_heap, (-proxy.success_rate, proxy.failure_count, self._seq, proxy))
+        
+        # 무효 항목이 쌓이면 재구성
+        if len(self._proxy_heap) > 4 * len(self.proxies) + 16:
+            self._proxy_heap = [entry for entry in self._proxy_heap if self._is_valid_entry(entry)]
+            heapq.heapify(self._proxy_heap)
+    
+    def _is_valid_entry(self, entry: Tuple[float, int, int, ProxyInfo]) -> bool:
+        """힙 항목이 프록시의 최신 상태인지 확인"""
+        proxy = entry[3]
+        return proxy.is_active and self._heap_seq.get(id(proxy)) == entry[2]
+    
+    def _peek_best_proxy(self) -> Optional[ProxyInfo]:
+        """성공률이 가장 높은 활성 프록시 (무효 항목은 제거)"""
+        while self._proxy_heap:
+            if self._is_valid_entry(self._proxy_heap[0]):
+                return self._proxy_heap[0][3]
+            heapq.heappop(self._proxy_heap)
+        return None
     
     def get_next_proxy(self) -> Optional[ProxyInfo]:
         """다음 사용 가능한 프록시 반환"""
         if not self.proxies:
             return None
         
-        # 활성 프록시만 필터링
-        active_proxies = [p for p in self.proxies if p.is_active]
+        # 성공률 기반 선택
+        best_proxy = self._peek_best_proxy()
         
-        if not active_proxies:
+        if not best_proxy:
             # 모든 프록시가 비활성화된 경우 재활성화
             self._reactivate_proxies()
-            active_proxies = [p for p in self.proxies if p.is_active]
+            best_proxy = self._peek_best_proxy()
         
-        if not active_proxies:
+        if not best_proxy:
             return None
         
-        # 성공률 기반 선택
-        best_proxy = max(active_proxies, key=lambda p: p.success_rate)
-        best_proxy.last_used = datetime.now()
+        best_proxy.last_used = time.monotonic()
         
         return best_proxy
     
     def _reactivate_proxies(self):
         """비활성화된 프록시 재활성화"""
-        for proxy in self.proxies:
-            if not proxy.is_active:
-                # 일정 시간 후 재활성화
-                if proxy.last_used and datetime.now() - proxy.last_used > timedelta(hours=1):
-                    proxy.is_active = True
-                    proxy.failure_count = 0
-                    logger.info(f"프록시 재활성화: {proxy.host}:{proxy.port}")
+        now = time.monotonic()
+        # 일정 시간이 지난 프록시만 재활성화
+        while self._reactivation_heap and self._reactivation_heap[0][0] < now:
+            _, _, proxy = heapq.heappop(self._reactivation_heap)
+            if proxy.is_active:
+                continue
+            proxy.is_active = True
+            proxy.failure_count = 0
+            self._push_proxy(proxy)
+            logger.info(f"프록시 재활성화: {proxy.host}:{proxy.port}")
     
     def report_proxy_failure(self, proxy: ProxyInfo):
         """프록시 실패 보고"""
@@ -342,31 +461,35 @@ class ProxyRotationManager:
         proxy.success_rate = max(0, proxy.success_rate - 10)
         
         if proxy.failure_count >= 3:
+            was_active = proxy.is_active
             proxy.is_active = False
             logger.warning(f"프록시 비활성화: {proxy.host}:{proxy.port}")
+            # 사용 기록이 있는 프록시만 재활성화 대상 (비활성화 시점에 한 번만 등록)
+            if was_active and proxy.last_used is not None:
+                self._seq += 1
+                heapq.heappush(
+                    self._reactivation_heap,
+                    (proxy.last_used + PROXY_REACTIVATION_DELAY, self._seq, proxy)
+                )
+        elif proxy.is_active:
+            self._push_proxy(proxy)
     
     def report_proxy_success(self, proxy: ProxyInfo):
         """프록시 성공 보고"""
         proxy.success_rate = min(100, proxy.success_rate + 5)
         proxy.failure_count = max(0, proxy.failure_count - 1)
+        if proxy.is_active:
+            self._push_proxy(proxy)
     
     def get_proxy_dict(self, proxy: ProxyInfo) -> Dict:
-        """requests 라이브러리용 프록시 딕셔너리 생성"""
-        if proxy.username and proxy.password:
-            proxy_url = f"{proxy.protocol}://{proxy.username}:{proxy.password}@{proxy.host}:{proxy.port}"
-        else:
-            proxy_url = f"{proxy.protocol}://{proxy.host}:{proxy.port}"
-        
-        return {
-            'http': proxy_url,
-            'https': proxy_url
-        }
+        """requests 라이브러리용 프록시 딕셔너리 반환 (생성 시 미리 계산, 수정하지 말 것)"""
+        return proxy.proxy_dict
 
 class UserAgentRotator:
     """User-Agent 자동 변경"""
     
     def __init__(self):
-        self.user_agents = [
+        self.user_agents = (
             # Chrome
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -382,13 +505,21 @@ class UserAgentRotator:
             
             # Edge
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
-        ]
+        )
+        # User-Agent별 요청 헤더 미리 생성
+        self._header_templates = tuple(
+            {**BROWSER_HEADERS, 'User-Agent': user_agent} for user_agent in self.user_agents
+        )
         self.current_index = 0
     
     def get_random_user_agent(self) -> str:
         """랜덤 User-Agent 반환"""
         return random.choice(self.user_agents)
     
+    def get_random_headers(self) -> Dict[str, str]:
+        """랜덤 User-Agent가 적용된 요청 헤더 반환 (공유 객체이므로 수정 시 복사해서 사용)"""
+        return random.choice(self._header_templates)
+    
     def get_next_user_agent(self) -> str:
         """순차적 User-Agent 반환"""
         user_agent = self.user_agents[self.current_index]
@@ -451,44 +582,90 @@ class BackupCrawlingStrategy:
                 'api_endpoint'
             ]
         }
-    
-    def execute_backup_strategy(self, original_url: str, error_type: str) -> Optional[Dict]:
+        # 대체 엔드포인트는 고정이므로 미리 분해
+        self._parsed_endpoints = [urlsplit(endpoint) for endpoint in self.strategies['alternative_endpoints']]
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self.session = create_resilient_crawler_session()
+        self.user_agent_rotator = UserAgentRotator()
+        # 헤드리스 Chrome은 첫 사용 시 한 번만 띄워서 재사용
+        self._selenium_driver = None
+        self._selenium_lock = threading.Lock()
+        atexit.register(self._quit_selenium_driver)
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """공용 aiohttp 세션 (첫 사용 시 생성 후 연결 재사용)"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+            )
+        return self._http_session
+    
+    async def close(self):
+        """HTTP 세션 및 Selenium 드라이버 종료"""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        await asyncio.to_thread(self._quit_selenium_driver)
+    
+    def _quit_selenium_driver(self):
+        """Selenium 드라이버 종료"""
+        with self._selenium_lock:
+            if self._selenium_driver is not None:
+                try:
+                    self._selenium_driver.quit()
+                except Exception as e:
+                    logger.warning(f"Selenium 드라이버 종료 실패: {e}")
+                self._selenium_driver = None
+    
+    async def execute_backup_strategy(self, original_url: str, error_type: str) -> Optional[Dict]:
         """백업 전략 실행"""
         if error_type == 'structure_change':
-            return self._try_alternative_endpoints(original_url)
+            return await self._try_alternative_endpoints(original_url)
         elif error_type == 'ip_block':
-            return self._try_alternative_methods(original_url)
+            return await self._try_alternative_methods(original_url)
         else:
-            return self._try_all_alternatives(original_url)
-    
-    def _try_alternative_endpoints(self, original_url: str) -> Optional[Dict]:
-        """대체 엔드포인트 시도"""
-        for endpoint in self.strategies['alternative_endpoints']:
-            try:
-                # URL 파라미터 추출 및 대체 엔드포인트에 적용
-                parsed_original = urlparse(original_url)
-                parsed_alternative = urlparse(endpoint)
-                
-                alternative_url = f"{parsed_alternative.scheme}://{parsed_alternative.netloc}{parsed_alternative.path}?{parsed_original.query}"
-                
-                response = requests.get(alternative_url, timeout=10)
-                if response.status_code == 200:
-                    logger.info(f"대체 엔드포인트 성공: {alternative_url}")
-                    return {'url': alternative_url, 'content': response.content}
-                    
-            except Exception as e:
-                logger.warning(f"대체 엔드포인트 실패: {endpoint} - {e}")
+            return await self._try_all_alternatives(original_url)
+    
+    async def _fetch_endpoint(self, url: str) -> Optional[Dict]:
+        """엔드포인트 요청 (200 응답일 때만 결과 반환)"""
+        session = self._get_http_session()
+        async with session.get(url, timeout=BACKUP_HTTP_TIMEOUT) as response:
+            if response.status != 200:
+                return None
+            return {'url': url, 'content': await response.read()}
+    
+    async def _try_alternative_endpoints(self, original_url: str) -> Optional[Dict]:
+        """대체 엔드포인트 시도 (모든 엔드포인트 동시 요청)"""
+        # URL 파라미터 추출 및 대체 엔드포인트에 적용
+        parsed_original = urlsplit(original_url)
+        alternative_urls = [
+            urlunsplit((parsed.scheme, parsed.netloc, parsed.path, parsed_original.query, parsed_original.fragment))
+            for parsed in self._parsed_endpoints
+        ]
+        
+        results = await asyncio.gather(
+            *(self._fetch_endpoint(url) for url in alternative_urls),
+            return_exceptions=True
+        )
+        
+        # 우선순위(설정 순서)대로 첫 성공 결과 사용
+        for endpoint, result in zip(self.strategies['alternative_endpoints'], results):
+            if isinstance(result, Exception):
+                logger.warning(f"대체 엔드포인트 실패: {endpoint} - {result!r}")
+            elif result:
+                logger.info(f"대체 엔드포인트 성공: {result['url']}")
+                return result
         
         return None
     
-    def _try_alternative_methods(self, original_url: str) -> Optional[Dict]:
+    async def _try_alternative_methods(self, original_url: str) -> Optional[Dict]:
         """대체 크롤링 방법 시도"""
         for method in self.strategies['alternative_methods']:
             try:
+                # 블로킹 방식(Selenium, requests)은 스레드에서 실행
                 if method == 'selenium_headless':
-                    result = self._try_selenium_headless(original_url)
+                    result = await asyncio.to_thread(self._try_selenium_headless, original_url)
                 elif method == 'requests_session':
-                    result = self._try_requests_session(original_url)
+                    result = await asyncio.to_thread(self._try_requests_session, original_url)
                 elif method == 'api_endpoint':
                     result = self._try_api_endpoint(original_url)
                 else:
@@ -509,36 +686,33 @@ class BackupCrawlingStrategy:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
             
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            
-            driver = webdriver.Chrome(options=options)
-            driver.get(url)
-            
-            content = driver.page_source
-            driver.quit()
+            with self._selenium_lock:
+                if self._selenium_driver is None:
+                    options = Options()
+                    options.add_argument('--headless')
+                    options.add_argument('--no-sandbox')
+                    options.add_argument('--disable-dev-shm-usage')
+                    
+                    self._selenium_driver = webdriver.Chrome(options=options)
+                
+                self._selenium_driver.get(url)
+                content = self._selenium_driver.page_source
             
             return {'url': url, 'content': content.encode()}
             
         except Exception as e:
             logger.warning(f"Selenium 헤드리스 실패: {e}")
+            # 세션이 죽었을 수 있으므로 다음 시도에서 새로 생성
+            self._quit_selenium_driver()
             return None
     
     def _try_requests_session(self, url: str) -> Optional[Dict]:
         """requests 세션 시도"""
         try:
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            })
-            
-            response = session.get(url, timeout=15)
+            # 공용 세션 재사용 (keep-alive 연결로 TLS 핸드셰이크 생략)
+            response = self.session.get(
+                url, headers=self.user_agent_rotator.get_random_headers(), timeout=15
+            )
             response.raise_for_status()
             
             return {'url': url, 'content': response.content}
@@ -553,30 +727,36 @@ class BackupCrawlingStrategy:
         # 여기서는 예시로만 구현
         return None
     
-    def _try_all_alternatives(self, original_url: str) -> Optional[Dict]:
+    async def _try_all_alternatives(self, original_url: str) -> Optional[Dict]:
         """모든 대체 방법 시도"""
         # 엔드포인트 먼저 시도
-        result = self._try_alternative_endpoints(original_url)
+        result = await self._try_alternative_endpoints(original_url)
         if result:
             return result
         
         # 방법론 시도
-        return self._try_alternative_methods(original_url)
+        return await self._try_alternative_methods(original_url)
 
 class ExceptionHandler:
     """예외 상황 처리 통합 시스템"""
     
-    def __init__(self, config: ExceptionConfig):
+    def __init__(self, config: ExceptionConfig, db_manager: Optional[DatabaseManager] = None):
         self.config = config
-        self.structure_monitor = WebsiteStructureMonitor()
+        self.db_manager = db_manager or DatabaseManager()
+        self.structure_monitor = WebsiteStructureMonitor(self.db_manager)
         self.ip_detector = IPBlockDetector()
         self.proxy_manager = ProxyRotationManager()
         self.user_agent_rotator = UserAgentRotator()
         self.rate_controller = RequestRateController()
         self.backup_strategy = BackupCrawlingStrategy()
         
-        self.failure_log: List[CrawlingFailure] = []
-        self.db_manager = DatabaseManager()
+        # 구조 변경 감지 윈도우(최근 1시간) 안의 실패만 시간순으로 보관
+        self.failure_log: deque[CrawlingFailure] = deque()
+        self.total_failures = 0
+        # failure_log 기준 누적 집계 (추가/제거 시 갱신)
+        self._pattern_counts: Counter = Counter()
+        self._error_type_counts: Counter = Counter()
+        self._hourly_counts: Counter = Counter()  # 시간 버킷(epoch 기준 시) -> 건수
     
     async def execute_with_exception_handling(self, func, task_name: str) -> bool:
         """예외 처리와 함께 함수 실행"""
@@ -584,12 +764,23 @@ class ExceptionHandler:
             if asyncio.iscoroutinefunction(func):
                 await func()
             else:
-                func()
+                # 동기 크롤링 함수는 스레드에서 실행 (이벤트 루프의 다른 작업과 겹쳐 실행되도록)
+                await asyncio.to_thread(func)
+            # 작업 단위 성공은 URL 단위 실패와 단위가 달라 실패율 이동 평균에 반영하지 않음
             return True
         except Exception as e:
             logger.error(f"작업 실행 실패 ({task_name}): {e}")
             return False
     
+    def record_success(self, url: str):
+        """URL 단위 크롤링 성공 보고 (handle_crawling_exception의 실패 기록과 짝을 이루는 실패율 계산용)"""
+        logger.debug(f"크롤링 성공: {url}")
+        self.structure_monitor.record_event(success=True)
+    
+    async def close(self):
+        """백업 전략 HTTP 세션 정리"""
+        await self.backup_strategy.close()
+    
     def handle_crawling_exception(self, url: str, error: Exception, 
                                 context: Dict = None) -> Dict:
         """크롤링 예외 통합 처리"""
@@ -601,11 +792,11 @@ class ExceptionHandler:
             url=url,
             error_type=error_type,
             error_message=error_message,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             user_agent=context.get('user_agent', '') if context else '',
             proxy=context.get('proxy', '') if context else ''
         )
-        self.failure_log.append(failure)
+        self._record_failure(failure)
         
         logger.warning(f"크롤링 예외 발생: {url} - {error_type}: {error_message}")
         
@@ -619,9 +810,34 @@ class ExceptionHandler:
             'success': recovery_result.get('success', False),
             'recovery_plan': recovery_plan,
             'result': recovery_result,
-            'failure_info': asdict(failure)
+            'failure_info': failure.__dict__.copy()  # 필드가 모두 단순 값이라 얕은 복사로 충분
         }
     
+    def _record_failure(self, failure: CrawlingFailure):
+        """실패 기록 후 윈도우를 벗어난 오래된 실패 제거"""
+        failure.error_pattern = _classify_error(failure.error_message)
+        self.failure_log.append(failure)
+        self.total_failures += 1
+        self._pattern_counts[failure.error_pattern] += 1
+        self._error_type_counts[failure.error_type] += 1
+        self._hourly_counts[int(failure.timestamp // 3600)] += 1
+        self.structure_monitor.record_event(success=False)
+        self.ip_detector.record_failure()
+        
+        self._evict_expired_failures(failure.timestamp)
+    
+    def _evict_expired_failures(self, now: float):
+        """시간 윈도우를 벗어난 실패 제거 및 집계 차감"""
+        cutoff_time = now - self.structure_monitor.time_window
+        while self.failure_log and self.failure_log[0].timestamp < cutoff_time:
+            expired = self.failure_log.popleft()
+            self._pattern_counts[expired.error_pattern] -= 1
+            self._error_type_counts[expired.error_type] -= 1
+            hour = int(expired.timestamp // 3600)
+            self._hourly_counts[hour] -= 1
+            if not self._hourly_counts[hour]:
+                del self._hourly_counts[hour]
+    
     def _create_recovery_plan(self, failure: CrawlingFailure) -> Dict:
         """복구 계획 생성"""
         plan = {
@@ -645,7 +861,9 @@ class ExceptionHandler:
             plan['change_user_agent'] = True
         
         # 구조 변경 확인
-        structure_changes = self.structure_monitor.detect_structure_changes(self.failure_log)
+        structure_changes = self.structure_monitor.detect_structure_changes(
+            self.failure_log, +self._pattern_counts
+        )
         if structure_changes:
             logger.warning(f"웹사이트 구조 변경 감지: {len(structure_changes)}개")
             
@@ -710,25 +928,21 @@ class ExceptionHandler:
     
     def get_failure_statistics(self) -> Dict:
         """실패 통계 조회"""
-        if not self.failure_log:
+        if not self.total_failures:
             return {}
         
-        recent_failures = self.structure_monitor._filter_recent_failures(self.failure_log)
-        
-        error_types = defaultdict(int)
-        hourly_failures = defaultdict(int)
-        
-        for failure in recent_failures:
-            error_types[failure.error_type] += 1
-            hour = failure.timestamp.strftime('%Y-%m-%d %H:00')
-            hourly_failures[hour] += 1
+        # 누적 집계를 그대로 사용 (윈도우 밖 실패만 정리)
+        self._evict_expired_failures(time.time())
         
         return {
-            'total_failures': len(self.failure_log),
-            'recent_failures': len(recent_failures),
-            'failure_rate': self.structure_monitor._calculate_failure_rate(recent_failures),
-            'error_types': dict(error_types),
-            'hourly_failures': dict(hourly_failures),
+            'total_failures': self.total_failures,
+            'recent_failures': len(self.failure_log),
+            'failure_rate': self.structure_monitor._calculate_failure_rate(self.failure_log),
+            'error_types': dict(+self._error_type_counts),
+            'hourly_failures': {
+                datetime.fromtimestamp(hour * 3600).strftime('%Y-%m-%d %H:00'): count
+                for hour, count in sorted(self._hourly_counts.items())
+            },
             'active_proxies': len([p for p in self.proxy_manager.proxies if p.is_active]),
             'current_delay': self.rate_controller.current_delay
         }
@@ -738,29 +952,26 @@ class ExceptionHandler:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_data = {
             'timestamp': datetime.now().isoformat(),
-            'failures': [asdict(f) for f in self.failure_log],
+            'failures': [
+                {**f.__dict__, 'timestamp': datetime.fromtimestamp(f.timestamp)}
+                for f in self.failure_log
+            ],
             'statistics': self.get_failure_statistics()
         }
         
-        with open(f'data/failure_log_{timestamp}.json', 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=2, default=str)
+        with open(f'data/failure_log_{timestamp}.json', 'wb') as f:
+            f.write(orjson.dumps(log_data, option=orjson.OPT_INDENT_2, default=str))
         
         logger.info(f"실패 로그 저장: data/failure_log_{timestamp}.json")
 
+_DEFAULT_USER_AGENT_ROTATOR = UserAgentRotator()
+
 def create_resilient_crawler_session() -> requests.Session:
     """복원력 있는 크롤러 세션 생성"""
     session = requests.Session()
     
     # 기본 헤더 설정
-    user_agent_rotator = UserAgentRotator()
-    session.headers.update({
-        'User-Agent': user_agent_rotator.get_random_user_agent(),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    })
+    session.headers.update(_DEFAULT_USER_AGENT_ROTATOR.get_random_headers())
     
     # 재시도 설정
     from requests.adapters import HTTPAdapter
@@ -772,7 +983,8 @@ def create_resilient_crawler_session() -> requests.Session:
         status_forcelist=[429, 500, 502, 503, 504],
     )
     
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # 같은 호스트 재요청 시 연결을 재사용하도록 풀 크기 확대
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry_strategy)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
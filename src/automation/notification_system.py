@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import smtplib
@@ -13,14 +14,18 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
+from collections import defaultdict
 from dataclasses import dataclass, asdict
+from operator import itemgetter
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import aiohttp
+import matplotlib
+matplotlib.use('Agg')  # 화면 없는 서버용 백엔드 (pyplot 임포트 전에 지정)
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-from jinja2 import Template
+from jinja2 import Environment
 import sqlite3
 import os
 from ..core.database import DatabaseManager
@@ -29,6 +34,129 @@ from ..core.database import DatabaseManager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 웹훅 요청 제한 시간
+WEBHOOK_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# 보고서 차트 해상도 (이메일/HTML 표시용)
+REPORT_CHART_DPI = 150
+
+# 보고서 쿼리용 인덱스 (테이블이 없을 수 있으므로 문장별로 생성)
+REPORT_INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_stores_created_at ON stores(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_stores_updated_at ON stores(updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_stores_district_status ON stores(district, status)",
+    "CREATE INDEX IF NOT EXISTS idx_quality_issues_created_fixed ON quality_issues(created_at, auto_fixed)",
+    "CREATE INDEX IF NOT EXISTS idx_crawling_logs_created_status ON crawling_logs(created_at, status)",
+)
+
+# 주간 HTML 보고서 템플릿 (모듈 로드 시 1회 컴파일)
+TEMPLATE_STR = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>크롤링 시스템 주간 보고서</title>
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
+        .header { text-align: center; margin-bottom: 30px; padding-bottom: 20px; border-bottom: 3px solid #007bff; }
+        .header h1 { color: #007bff; margin: 0; font-size: 2.5em; }
+        .header p { color: #666; margin: 10px 0 0 0; font-size: 1.1em; }
+        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 30px 0; }
+        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }
+        .stat-card h3 { margin: 0 0 10px 0; font-size: 1.2em; opacity: 0.9; }
+        .stat-card .number { font-size: 2.5em; font-weight: bold; margin: 10px 0; }
+        .quality-section { margin: 30px 0; padding: 20px; background: #f8f9fa; border-radius: 10px; }
+        .quality-section h2 { color: #28a745; margin-bottom: 20px; }
+        .progress-bar { background: #e9ecef; border-radius: 10px; overflow: hidden; height: 20px; margin: 10px 0; }
+        .progress-fill { height: 100%; background: linear-gradient(90deg, #28a745, #20c997); transition: width 0.3s ease; }
+        .trend-section { margin: 30px 0; }
+        .trend-section h2 { color: #dc3545; margin-bottom: 20px; }
+        .district-list { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 15px; }
+        .district-card { background: white; padding: 15px; border-radius: 8px; border-left: 4px solid #ffc107; }
+        .chart-section { text-align: center; margin: 30px 0; }
+        .chart-section img { max-width: 100%; height: auto; border-radius: 10px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }
+        .footer { text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #dee2e6; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🏪 크롤링 시스템 주간 보고서</h1>
+            <p>{{ stats.timestamp.strftime('%Y년 %m월 %d일') }} 기준</p>
+        </div>
+        
+        <div class="stats-grid">
+            <div class="stat-card">
+                <h3>총 가게 수</h3>
+                <div class="number">{{ "{:,}".format(stats.total_stores) }}</div>
+            </div>
+            <div class="stat-card">
+                <h3>신규 가게</h3>
+                <div class="number">{{ "{:,}".format(stats.new_stores) }}</div>
+            </div>
+            <div class="stat-card">
+                <h3>업데이트</h3>
+                <div class="number">{{ "{:,}".format(stats.updated_stores) }}</div>
+            </div>
+            <div class="stat-card">
+                <h3>성공률</h3>
+                <div class="number">{{ "%.1f"|format(stats.success_rate) }}%</div>
+            </div>
+        </div>
+        
+        <div class="quality-section">
+            <h2>📊 품질 현황</h2>
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+                <div>
+                    <p><strong>품질 점수:</strong> {{ "%.1f"|format(quality_stats.quality_score) }}/100</p>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {{ quality_stats.quality_score }}%"></div>
+                    </div>
+                </div>
+                <div>
+                    <p><strong>총 이슈:</strong> {{ quality_stats.total_issues }}개</p>
+                    <p><strong>자동 수정:</strong> {{ quality_stats.auto_fixed_issues }}개</p>
+                    <p><strong>수동 검토 필요:</strong> {{ quality_stats.manual_review_needed }}개</p>
+                </div>
+            </div>
+        </div>
+        
+        {% if chart_path %}
+        <div class="chart-section">
+            <h2>📈 트렌드 분석</h2>
+            <img src="{{ chart_path }}" alt="트렌드 분석 차트">
+        </div>
+        {% endif %}
+        
+        <div class="trend-section">
+            <h2>🏙️ 지역별 현황</h2>
+            <div class="district-list">
+                {% for trend in trend_analyses[:6] %}
+                <div class="district-card">
+                    <h4>{{ trend.district }}</h4>
+                    <p><strong>신규 가게:</strong> {{ trend.new_stores_trend|length }}건</p>
+                    <p><strong>인기 지역:</strong> 
+                        {% for area, count in trend.popular_areas[:2] %}
+                            {{ area }} ({{ count }}개){% if not loop.last %}, {% endif %}
+                        {% endfor %}
+                    </p>
+                </div>
+                {% endfor %}
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>🤖 자동 생성된 보고서 | 크롤링 시스템 v6.0</p>
+            <p>문의사항이 있으시면 시스템 관리자에게 연락해주세요.</p>
+        </div>
+    </div>
+</body>
+</html>
+        """
+_REPORT_TEMPLATE = Environment(autoescape=False).from_string(TEMPLATE_STR)
+
 @dataclass
 class NotificationConfig:
     """알림 설정"""
@@ -77,11 +205,25 @@ class TrendAnalysis:
     category_growth: Dict[str, float]        # 카테고리별 성장률
     popular_areas: List[Tuple[str, int]]     # (지역명, 가게 수)
 
-class SlackNotifier:
-    """Slack 알림 발송"""
+class WebhookNotifier:
+    """웹훅 기반 알림 공통 (공유 세션이 있으면 연결 재사용)"""
     
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, session: Optional[aiohttp.ClientSession] = None):
         self.webhook_url = webhook_url
+        self.session = session
+    
+    async def _post_json(self, payload: Dict) -> int:
+        """웹훅 POST 후 상태 코드 반환"""
+        if self.session is None or self.session.closed:
+            async with aiohttp.ClientSession(timeout=WEBHOOK_TIMEOUT) as session:
+                async with session.post(self.webhook_url, json=payload) as response:
+                    return response.status
+        
+        async with self.session.post(self.webhook_url, json=payload) as response:
+            return response.status
+
+class SlackNotifier(WebhookNotifier):
+    """Slack 알림 발송"""
     
     async def send_message(self, message: str, title: str = "크롤링 시스템 알림", 
                           color: str = "good") -> bool:
@@ -98,14 +240,13 @@ class SlackNotifier:
                 ]
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.webhook_url, json=payload) as response:
-                    if response.status == 200:
-                        logger.info("Slack 메시지 발송 성공")
-                        return True
-                    else:
-                        logger.error(f"Slack 메시지 발송 실패: {response.status}")
-                        return False
+            status = await self._post_json(payload)
+            if status == 200:
+                logger.info("Slack 메시지 발송 성공")
+                return True
+            else:
+                logger.error(f"Slack 메시지 발송 실패: {status}")
+                return False
                         
         except Exception as e:
             logger.error(f"Slack 알림 발송 중 오류: {e}")
@@ -161,12 +302,9 @@ class SlackNotifier:
         
         await self.send_message(message, "🚨 시스템 에러 알림", color)
 
-class DiscordNotifier:
+class DiscordNotifier(WebhookNotifier):
     """Discord 알림 발송"""
     
-    def __init__(self, webhook_url: str):
-        self.webhook_url = webhook_url
-    
     async def send_message(self, message: str, title: str = "크롤링 시스템 알림") -> bool:
         """Discord 메시지 발송"""
         try:
@@ -181,14 +319,13 @@ class DiscordNotifier:
                 ]
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.webhook_url, json=payload) as response:
-                    if response.status == 204:
-                        logger.info("Discord 메시지 발송 성공")
-                        return True
-                    else:
-                        logger.error(f"Discord 메시지 발송 실패: {response.status}")
-                        return False
+            status = await self._post_json(payload)
+            if status == 204:
+                logger.info("Discord 메시지 발송 성공")
+                return True
+            else:
+                logger.error(f"Discord 메시지 발송 실패: {status}")
+                return False
                         
         except Exception as e:
             logger.error(f"Discord 알림 발송 중 오류: {e}")
@@ -203,8 +340,13 @@ class EmailNotifier:
         self.username = config.email_username
         self.password = config.email_password
     
-    def send_email(self, recipients: List[str], subject: str, body: str, 
-                   attachments: List[str] = None) -> bool:
+    async def send_email_async(self, recipients: List[str], subject: str, body: str,
+                               attachments: List[str] = None) -> bool:
+        """이메일 발송 (SMTP 연결/인증이 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(self._send_email_sync, recipients, subject, body, attachments)
+    
+    def _send_email_sync(self, recipients: List[str], subject: str, body: str, 
+                         attachments: List[str] = None) -> bool:
         """이메일 발송"""
         try:
             msg = MIMEMultipart()
@@ -249,11 +391,31 @@ class ReportGenerator:
         self.db_path = db_path
         self.reports_dir = Path("reports")
         self.reports_dir.mkdir(exist_ok=True)
+        self._ensure_indexes()
     
     def get_db_connection(self):
         """데이터베이스 연결"""
         return sqlite3.connect(self.db_path)
     
+    def _ensure_indexes(self):
+        """보고서 쿼리용 인덱스 생성 (날짜 조건은 범위 검색으로 인덱스 사용)"""
+        try:
+            with self.get_db_connection() as conn:
+                # 한 테이블이 없어도 나머지 인덱스는 생성되도록 문장별로 처리
+                for statement in REPORT_INDEX_STATEMENTS:
+                    try:
+                        conn.execute(statement)
+                    except sqlite3.Error as e:
+                        logger.warning(f"보고서 인덱스 생성 실패: {e}")
+        except Exception as e:
+            logger.warning(f"보고서 인덱스 생성 실패: {e}")
+    
+    @staticmethod
+    def _today_range() -> Tuple[str, str]:
+        """오늘 날짜의 반개구간 [오늘, 내일) 경계"""
+        today = datetime.now().date()
+        return today.isoformat(), (today + timedelta(days=1)).isoformat()
+    
     def generate_daily_stats(self) -> CrawlingStats:
         """일일 통계 생성"""
         try:
@@ -261,44 +423,34 @@ class ReportGenerator:
                 cursor = conn.cursor()
                 
                 # 오늘 처리된 데이터 조회
-                today = datetime.now().date()
-                
-                # 총 가게 수
-                cursor.execute("SELECT COUNT(*) FROM stores WHERE status = 'active'")
-                total_stores = cursor.fetchone()[0]
-                
-                # 오늘 신규 가게
-                cursor.execute("""
-                    SELECT COUNT(*) FROM stores 
-                    WHERE DATE(created_at) = ? AND status = 'active'
-                """, (today,))
-                new_stores = cursor.fetchone()[0]
+                day_start, day_end = self._today_range()
                 
-                # 오늘 업데이트된 가게
+                # 가게 집계 (총/신규/업데이트 수와 처리 지역을 한 번의 스캔으로)
                 cursor.execute("""
-                    SELECT COUNT(*) FROM stores 
-                    WHERE DATE(updated_at) = ? AND DATE(created_at) != ?
-                """, (today, today))
-                updated_stores = cursor.fetchone()[0]
+                    SELECT
+                        COUNT(CASE WHEN status = 'active' THEN 1 END),
+                        COUNT(CASE WHEN created_at >= :start AND created_at < :end
+                                    AND status = 'active' THEN 1 END),
+                        COUNT(CASE WHEN updated_at >= :start AND updated_at < :end
+                                    AND (created_at < :start OR created_at >= :end) THEN 1 END),
+                        GROUP_CONCAT(DISTINCT CASE WHEN updated_at >= :start AND updated_at < :end
+                                                   THEN district END)
+                    FROM stores
+                """, {"start": day_start, "end": day_end})
+                total_stores, new_stores, updated_stores, districts_csv = cursor.fetchone()
+                districts = districts_csv.split(',') if districts_csv else []
                 
                 # 크롤링 로그에서 실패 건수 조회
                 cursor.execute("""
                     SELECT COUNT(*) FROM crawling_logs 
-                    WHERE DATE(created_at) = ? AND status = 'failed'
-                """, (today,))
+                    WHERE created_at >= ? AND created_at < ? AND status = 'failed'
+                """, (day_start, day_end))
                 failed_requests = cursor.fetchone()[0] or 0
                 
                 # 성공률 계산
                 total_requests = new_stores + updated_stores + failed_requests
                 success_rate = ((new_stores + updated_stores) / max(total_requests, 1)) * 100
                 
-                # 처리된 지역 조회
-                cursor.execute("""
-                    SELECT DISTINCT district FROM stores 
-                    WHERE DATE(updated_at) = ?
-                """, (today,))
-                districts = [row[0] for row in cursor.fetchall()]
-                
                 return CrawlingStats(
                     total_stores=total_stores,
                     new_stores=new_stores,
@@ -321,24 +473,20 @@ class ReportGenerator:
             with self.get_db_connection() as conn:
                 cursor = conn.cursor()
                 
-                today = datetime.now().date()
+                day_start, day_end = self._today_range()
                 
-                # 품질 이슈 조회
+                # 품질 이슈 조회 (유형별 건수와 자동 수정 건수를 함께 집계)
                 cursor.execute("""
-                    SELECT issue_type, COUNT(*) FROM quality_issues 
-                    WHERE DATE(created_at) = ?
+                    SELECT issue_type, COUNT(*), COUNT(CASE WHEN auto_fixed = 1 THEN 1 END)
+                    FROM quality_issues 
+                    WHERE created_at >= ? AND created_at < ?
                     GROUP BY issue_type
-                """, (today,))
+                """, (day_start, day_end))
                 
-                issue_counts = dict(cursor.fetchall())
+                rows = cursor.fetchall()
+                issue_counts = {issue_type: count for issue_type, count, _ in rows}
                 total_issues = sum(issue_counts.values())
-                
-                # 자동 수정된 이슈
-                cursor.execute("""
-                    SELECT COUNT(*) FROM quality_issues 
-                    WHERE DATE(created_at) = ? AND auto_fixed = 1
-                """, (today,))
-                auto_fixed = cursor.fetchone()[0] or 0
+                auto_fixed = sum(fixed for _, _, fixed in rows)
                 
                 # 품질 점수 계산 (임시 로직)
                 quality_score = max(0, 100 - (total_issues * 2))
@@ -370,50 +518,56 @@ class ReportGenerator:
                 cursor.execute("SELECT DISTINCT district FROM stores WHERE district IS NOT NULL")
                 districts = [row[0] for row in cursor.fetchall()]
                 
-                trend_analyses = []
+                # 신규 가게 트렌드 (지역·날짜별 일괄 집계)
+                cursor.execute("""
+                    SELECT district, DATE(created_at) as date, COUNT(*) as count
+                    FROM stores 
+                    WHERE district IS NOT NULL AND created_at >= ?
+                    GROUP BY district, DATE(created_at)
+                    ORDER BY district, date
+                """, (start_date,))
+                new_by_district = defaultdict(list)
+                for district, date, count in cursor.fetchall():
+                    new_by_district[district].append((date, count))
+                
+                # 폐업 가게 트렌드
+                cursor.execute("""
+                    SELECT district, DATE(updated_at) as date, COUNT(*) as count
+                    FROM stores 
+                    WHERE district IS NOT NULL AND status = 'closed' AND updated_at >= ?
+                    GROUP BY district, DATE(updated_at)
+                    ORDER BY district, date
+                """, (start_date,))
+                closure_by_district = defaultdict(list)
+                for district, date, count in cursor.fetchall():
+                    closure_by_district[district].append((date, count))
                 
-                for district in districts:
-                    # 신규 가게 트렌드
-                    cursor.execute("""
-                        SELECT DATE(created_at) as date, COUNT(*) as count
-                        FROM stores 
-                        WHERE district = ? AND created_at >= ?
-                        GROUP BY DATE(created_at)
-                        ORDER BY date
-                    """, (district, start_date))
-                    new_stores_trend = cursor.fetchall()
-                    
-                    # 폐업 가게 트렌드
-                    cursor.execute("""
-                        SELECT DATE(updated_at) as date, COUNT(*) as count
-                        FROM stores 
-                        WHERE district = ? AND status = 'closed' AND updated_at >= ?
-                        GROUP BY DATE(updated_at)
-                        ORDER BY date
-                    """, (district, start_date))
-                    closure_trend = cursor.fetchall()
-                    
-                    # 카테고리별 성장률 (임시 로직)
-                    category_growth = {"음식점": 5.2, "카페": 3.1, "편의점": 1.8}
-                    
-                    # 인기 지역
-                    cursor.execute("""
-                        SELECT address, COUNT(*) as count
-                        FROM stores 
-                        WHERE district = ? AND status = 'active'
-                        GROUP BY address
-                        ORDER BY count DESC
-                        LIMIT 5
-                    """, (district,))
-                    popular_areas = cursor.fetchall()
-                    
-                    trend_analyses.append(TrendAnalysis(
+                # 인기 지역 (지역별 상위 5개는 Python에서 선택)
+                cursor.execute("""
+                    SELECT district, address, COUNT(*) as count
+                    FROM stores 
+                    WHERE district IS NOT NULL AND status = 'active'
+                    GROUP BY district, address
+                """)
+                areas_by_district = defaultdict(list)
+                for district, address, count in cursor.fetchall():
+                    areas_by_district[district].append((address, count))
+                
+                # 카테고리별 성장률 (임시 로직)
+                category_growth = {"음식점": 5.2, "카페": 3.1, "편의점": 1.8}
+                
+                trend_analyses = [
+                    TrendAnalysis(
                         district=district,
-                        new_stores_trend=new_stores_trend,
-                        closure_trend=closure_trend,
-                        category_growth=category_growth,
-                        popular_areas=popular_areas
-                    ))
+                        new_stores_trend=new_by_district.get(district, []),
+                        closure_trend=closure_by_district.get(district, []),
+                        category_growth=dict(category_growth),
+                        popular_areas=heapq.nlargest(
+                            5, areas_by_district.get(district, []), key=itemgetter(1)
+                        )
+                    )
+                    for district in districts
+                ]
                 
                 return trend_analyses
                 
@@ -426,26 +580,33 @@ class ReportGenerator:
         try:
             # 한글 폰트 설정
             plt.rcParams['font.family'] = 'DejaVu Sans'
+            plt.rcParams['agg.path.chunksize'] = 10000
             
             fig, axes = plt.subplots(2, 2, figsize=(15, 10))
             fig.suptitle('서울시 가게 현황 분석', fontsize=16, fontweight='bold')
             
-            # 1. 지역별 신규 가게 수
-            districts = [ta.district for ta in trend_analyses[:10]]  # 상위 10개 지역
-            new_counts = [sum([count for _, count in ta.new_stores_trend]) for ta in trend_analyses[:10]]
+            # 트렌드 분석에서 이미 집계된 (지역, 날짜, 건수) 행을 한 번에 DataFrame으로 변환
+            new_df = pd.DataFrame.from_records(
+                [(ta.district, date, count) for ta in trend_analyses for date, count in ta.new_stores_trend],
+                columns=['district', 'day', 'count']
+            ).astype({'count': 'int64'})
             
-            axes[0, 0].bar(districts, new_counts, color='skyblue')
+            # 1. 지역별 신규 가게 수 (상위 10개 지역)
+            totals = new_df.groupby('district')['count'].sum().nlargest(10)
+            
+            axes[0, 0].bar(totals.index, totals.values, color='skyblue')
             axes[0, 0].set_title('지역별 신규 가게 수 (최근 30일)')
             axes[0, 0].set_xlabel('지역')
             axes[0, 0].set_ylabel('신규 가게 수')
             axes[0, 0].tick_params(axis='x', rotation=45)
             
             # 2. 시간별 트렌드
-            if trend_analyses:
-                dates = [date for date, _ in trend_analyses[0].new_stores_trend]
-                counts = [count for _, count in trend_analyses[0].new_stores_trend]
-                
-                axes[0, 1].plot(dates, counts, marker='o', color='green')
+            if trend_analyses and not new_df.empty:
+                pivot = new_df.pivot_table(index='day', columns='district', values='count',
+                                           aggfunc='sum', fill_value=0)
+                district = trend_analyses[0].district
+                if district in pivot.columns:
+                    axes[0, 1].plot(pivot.index, pivot[district], marker='o', color='green')
                 axes[0, 1].set_title('신규 가게 등록 트렌드')
                 axes[0, 1].set_xlabel('날짜')
                 axes[0, 1].set_ylabel('신규 가게 수')
@@ -472,8 +633,8 @@ class ReportGenerator:
             
             # 파일 저장
             chart_path = self.reports_dir / f"trend_analysis_{datetime.now().strftime('%Y%m%d')}.png"
-            plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(chart_path, dpi=REPORT_CHART_DPI, bbox_inches='tight')
+            plt.close(fig)
             
             return str(chart_path)
             
@@ -484,115 +645,8 @@ class ReportGenerator:
     def generate_html_report(self, stats: CrawlingStats, quality_stats: QualityStats, 
                            trend_analyses: List[TrendAnalysis], chart_path: str = "") -> str:
         """HTML 보고서 생성"""
-        template_str = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>크롤링 시스템 주간 보고서</title>
-    <style>
-        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
-        .header { text-align: center; margin-bottom: 30px; padding-bottom: 20px; border-bottom: 3px solid #007bff; }
-        .header h1 { color: #007bff; margin: 0; font-size: 2.5em; }
-        .header p { color: #666; margin: 10px 0 0 0; font-size: 1.1em; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 30px 0; }
-        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }
-        .stat-card h3 { margin: 0 0 10px 0; font-size: 1.2em; opacity: 0.9; }
-        .stat-card .number { font-size: 2.5em; font-weight: bold; margin: 10px 0; }
-        .quality-section { margin: 30px 0; padding: 20px; background: #f8f9fa; border-radius: 10px; }
-        .quality-section h2 { color: #28a745; margin-bottom: 20px; }
-        .progress-bar { background: #e9ecef; border-radius: 10px; overflow: hidden; height: 20px; margin: 10px 0; }
-        .progress-fill { height: 100%; background: linear-gradient(90deg, #28a745, #20c997); transition: width 0.3s ease; }
-        .trend-section { margin: 30px 0; }
-        .trend-section h2 { color: #dc3545; margin-bottom: 20px; }
-        .district-list { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 15px; }
-        .district-card { background: white; padding: 15px; border-radius: 8px; border-left: 4px solid #ffc107; }
-        .chart-section { text-align: center; margin: 30px 0; }
-        .chart-section img { max-width: 100%; height: auto; border-radius: 10px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }
-        .footer { text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #dee2e6; color: #666; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🏪 크롤링 시스템 주간 보고서</h1>
-            <p>{{ stats.timestamp.strftime('%Y년 %m월 %d일') }} 기준</p>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <h3>총 가게 수</h3>
-                <div class="number">{{ "{:,}".format(stats.total_stores) }}</div>
-            </div>
-            <div class="stat-card">
-                <h3>신규 가게</h3>
-                <div class="number">{{ "{:,}".format(stats.new_stores) }}</div>
-            </div>
-            <div class="stat-card">
-                <h3>업데이트</h3>
-                <div class="number">{{ "{:,}".format(stats.updated_stores) }}</div>
-            </div>
-            <div class="stat-card">
-                <h3>성공률</h3>
-                <div class="number">{{ "%.1f"|format(stats.success_rate) }}%</div>
-            </div>
-        </div>
-        
-        <div class="quality-section">
-            <h2>📊 품질 현황</h2>
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
-                <div>
-                    <p><strong>품질 점수:</strong> {{ "%.1f"|format(quality_stats.quality_score) }}/100</p>
-                    <div class="progress-bar">
-                        <div class="progress-fill" style="width: {{ quality_stats.quality_score }}%"></div>
-                    </div>
-                </div>
-                <div>
-                    <p><strong>총 이슈:</strong> {{ quality_stats.total_issues }}개</p>
-                    <p><strong>자동 수정:</strong> {{ quality_stats.auto_fixed_issues }}개</p>
-                    <p><strong>수동 검토 필요:</strong> {{ quality_stats.manual_review_needed }}개</p>
-                </div>
-            </div>
-        </div>
-        
-        {% if chart_path %}
-        <div class="chart-section">
-            <h2>📈 트렌드 분석</h2>
-            <img src="{{ chart_path }}" alt="트렌드 분석 차트">
-        </div>
-        {% endif %}
-        
-        <div class="trend-section">
-            <h2>🏙️ 지역별 현황</h2>
-            <div class="district-list">
-                {% for trend in trend_analyses[:6] %}
-                <div class="district-card">
-                    <h4>{{ trend.district }}</h4>
-                    <p><strong>신규 가게:</strong> {{ trend.new_stores_trend|length }}건</p>
-                    <p><strong>인기 지역:</strong> 
-                        {% for area, count in trend.popular_areas[:2] %}
-                            {{ area }} ({{ count }}개){% if not loop.last %}, {% endif %}
-                        {% endfor %}
-                    </p>
-                </div>
-                {% endfor %}
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>🤖 자동 생성된 보고서 | 크롤링 시스템 v6.0</p>
-            <p>문의사항이 있으시면 시스템 관리자에게 연락해주세요.</p>
-        </div>
-    </div>
-</body>
-</html>
-        """
-        
         try:
-            template = Template(template_str)
-            html_content = template.render(
+            html_content = _REPORT_TEMPLATE.render(
                 stats=stats,
                 quality_stats=quality_stats,
                 trend_analyses=trend_analyses,
@@ -610,31 +664,58 @@ class ReportGenerator:
         except Exception as e:
             logger.error(f"HTML 보고서 생성 실패: {e}")
             return ""
+    
+    async def generate_html_report_async(self, stats: CrawlingStats, quality_stats: QualityStats,
+                                         trend_analyses: List[TrendAnalysis], chart_path: str = "") -> str:
+        """HTML 보고서 생성 (렌더링/파일 쓰기는 스레드에서)"""
+        return await asyncio.to_thread(
+            self.generate_html_report, stats, quality_stats, trend_analyses, chart_path
+        )
 
 class NotificationSystem:
     """통합 알림 시스템"""
     
-    def __init__(self, config: NotificationConfig, db_path: str):
+    def __init__(self, config: NotificationConfig, db_path: str,
+                 db_manager: Optional[DatabaseManager] = None):
         self.config = config
         self.db_path = db_path
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or DatabaseManager()
         self.slack_notifier = SlackNotifier(config.slack_webhook_url)
         self.discord_notifier = DiscordNotifier(config.discord_webhook_url)
         self.email_notifier = EmailNotifier(config)
         self.report_generator = ReportGenerator(db_path)
+        self._session: Optional[aiohttp.ClientSession] = None
         
         logger.info("알림 시스템 초기화 완료")
     
+    async def _ensure_session(self):
+        """Slack/Discord가 공유하는 HTTP 세션 생성 (이벤트 루프 안에서 최초 1회)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=WEBHOOK_TIMEOUT
+            )
+            self.slack_notifier.session = self._session
+            self.discord_notifier.session = self._session
+    
+    async def aclose(self):
+        """공유 HTTP 세션 종료"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+    
     async def send_daily_report(self):
         """일일 보고서 발송"""
         try:
-            # 통계 생성
-            stats = self.report_generator.generate_daily_stats()
-            quality_stats = self.report_generator.generate_quality_stats()
+            await self._ensure_session()
+            
+            # 통계 생성 (SQLite 조회는 스레드에서)
+            stats, quality_stats = await asyncio.to_thread(self._collect_daily_stats)
+            
+            sends = []
             
             # Slack 알림
             if self.slack_notifier:
-                await self.slack_notifier.send_daily_report(stats, quality_stats)
+                sends.append(self.slack_notifier.send_daily_report(stats, quality_stats))
             
             # Discord 알림
             if self.discord_notifier:
@@ -645,7 +726,10 @@ class NotificationSystem:
 • 성공률: {stats.success_rate:.1f}%
 • 품질점수: {quality_stats.quality_score:.1f}/100
                 """
-                await self.discord_notifier.send_message(message, "일일 크롤링 보고")
+                sends.append(self.discord_notifier.send_message(message, "일일 크롤링 보고"))
+            
+            # 채널별 발송은 동시에 진행
+            await asyncio.gather(*sends, return_exceptions=True)
             
             logger.info("일일 보고서 발송 완료")
             
@@ -655,33 +739,55 @@ class NotificationSystem:
     async def send_error_alert(self, error_type: str, error_message: str, severity: str = "high"):
         """에러 알림 발송"""
         try:
+            await self._ensure_session()
+            
+            sends = []
+            
             # Slack 알림
             if self.slack_notifier:
-                await self.slack_notifier.send_error_alert(error_type, error_message, severity)
+                sends.append(self.slack_notifier.send_error_alert(error_type, error_message, severity))
             
             # Discord 알림
             if self.discord_notifier:
                 message = f"🚨 **{error_type}** 에러 발생\n심각도: {severity}\n```{error_message}```"
-                await self.discord_notifier.send_message(message, "시스템 에러 알림")
+                sends.append(self.discord_notifier.send_message(message, "시스템 에러 알림"))
+            
+            # 채널별 발송은 동시에 진행
+            await asyncio.gather(*sends, return_exceptions=True)
             
             logger.info(f"에러 알림 발송 완료: {error_type}")
             
         except Exception as e:
             logger.error(f"에러 알림 발송 실패: {e}")
     
-    def generate_weekly_report(self) -> str:
+    def _collect_daily_stats(self) -> Tuple[CrawlingStats, QualityStats]:
+        """일일 보고서용 크롤링/품질 통계 조회"""
+        return (
+            self.report_generator.generate_daily_stats(),
+            self.report_generator.generate_quality_stats(),
+        )
+    
+    def _collect_weekly_data(self) -> Tuple[CrawlingStats, QualityStats, List[TrendAnalysis], str]:
+        """주간 보고서용 통계/트렌드 분석 및 차트 생성"""
+        stats = self.report_generator.generate_daily_stats()
+        quality_stats = self.report_generator.generate_quality_stats()
+        trend_analyses = self.report_generator.generate_trend_analysis(days=7)
+        
+        # 시각화 차트 생성
+        chart_path = self.report_generator.create_visualization(trend_analyses)
+        
+        return stats, quality_stats, trend_analyses, chart_path
+    
+    async def generate_weekly_report(self) -> str:
         """주간 보고서 생성"""
         try:
-            # 통계 및 트렌드 분석 생성
-            stats = self.report_generator.generate_daily_stats()
-            quality_stats = self.report_generator.generate_quality_stats()
-            trend_analyses = self.report_generator.generate_trend_analysis(days=7)
-            
-            # 시각화 차트 생성
-            chart_path = self.report_generator.create_visualization(trend_analyses)
+            # 통계 및 트렌드 분석 생성 (SQLite 조회와 차트 렌더링은 스레드에서)
+            stats, quality_stats, trend_analyses, chart_path = await asyncio.to_thread(
+                self._collect_weekly_data
+            )
             
             # HTML 보고서 생성
-            report_path = self.report_generator.generate_html_report(
+            report_path = await self.report_generator.generate_html_report_async(
                 stats, quality_stats, trend_analyses, chart_path
             )
             
@@ -703,7 +809,7 @@ class NotificationSystem:
                 if chart_path:
                     attachments.append(chart_path)
                 
-                self.email_notifier.send_email(
+                await self.email_notifier.send_email_async(
                     self.config.email_recipients, subject, body, attachments
                 )
             
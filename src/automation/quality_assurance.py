@@ -531,13 +531,14 @@ class BusinessHoursValidator:
 class QualityAssurance:
     """데이터 품질 자동 검증 통합 시스템"""
     
-    def __init__(self, config: QualityConfig, db_path: str):
+    def __init__(self, config: QualityConfig, db_path: str,
+                 db_manager: Optional[DatabaseManager] = None):
         self.config = config
         self.db_path = db_path
         self.coordinate_validator = CoordinateValidator()
         self.duplicate_detector = MLDuplicateDetector()
         self.hours_validator = BusinessHoursValidator()
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or DatabaseManager()
     
     async def run_comprehensive_quality_check(self) -> QualityReport:
         """포괄적 품질 검증 실행 (비동기)"""
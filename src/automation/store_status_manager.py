@@ -251,8 +251,8 @@ class WebsiteAccessibilityChecker:
 class ReviewActivityMonitor:
     """리뷰 업데이트 중단 감지"""
     
-    def __init__(self):
-        self.db_manager = DatabaseManager()
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        self.db_manager = db_manager or DatabaseManager()
         self.inactivity_threshold = timedelta(days=90)  # 90일 비활성
         self.review_sources = ['naver', 'google', 'diningcode']
     
@@ -346,13 +346,14 @@ class ReviewActivityMonitor:
 class StoreStatusManager:
     """가게 상태 관리 통합 시스템"""
     
-    def __init__(self, config: StatusConfig, db_path: str):
+    def __init__(self, config: StatusConfig, db_path: str,
+                 db_manager: Optional[DatabaseManager] = None):
         self.config = config
         self.db_path = db_path
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or DatabaseManager()
         self.phone_validator = PhoneValidator()
         self.website_checker = WebsiteAccessibilityChecker()
-        self.review_monitor = ReviewActivityMonitor()
+        self.review_monitor = ReviewActivityMonitor(self.db_manager)
         
         self.status_transitions = {
             '운영중': ['휴업', '폐업'],
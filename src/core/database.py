@@ -7,11 +7,157 @@ from datetime import datetime
 import sys
 import os
 import json
+import io
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'config'))
 import config
 
 logger = logging.getLogger(__name__)
 
+# stores UPSERT 대상 컬럼 (행 튜플 순서와 동일)
+STORE_COLUMNS = (
+    'name', 'address', 'position_lat', 'position_lng',
+    'position_x', 'position_y', 'naver_rating', 'kakao_rating', 'diningcode_rating',
+    'open_hours', 'open_hours_raw', 'price', 'refill_items', 'image_urls',
+    'phone_number', 'diningcode_place_id', 'raw_categories_diningcode', 'status',
+    'menu_items', 'menu_categories', 'signature_menu',
+    'price_details', 'break_time', 'last_order', 'holiday', 'main_image',
+    'menu_images', 'interior_images', 'review_summary', 'keywords', 'atmosphere',
+    'website', 'social_media', 'refill_type', 'refill_conditions', 'is_confirmed_refill'
+)
+
+STORE_UPSERT_CONFLICT = """
+    ON CONFLICT (diningcode_place_id) 
+    DO UPDATE SET
+        name = EXCLUDED.name,
+        address = COALESCE(EXCLUDED.address, stores.address),
+        position_lat = COALESCE(EXCLUDED.position_lat, stores.position_lat),
+        position_lng = COALESCE(EXCLUDED.position_lng, stores.position_lng),
+        position_x = COALESCE(EXCLUDED.position_x, stores.position_x),
+        position_y = COALESCE(EXCLUDED.position_y, stores.position_y),
+        naver_rating = COALESCE(EXCLUDED.naver_rating, stores.naver_rating),
+        kakao_rating = COALESCE(EXCLUDED.kakao_rating, stores.kakao_rating),
+        diningcode_rating = COALESCE(EXCLUDED.diningcode_rating, stores.diningcode_rating),
+        open_hours = COALESCE(EXCLUDED.open_hours, stores.open_hours),
+        open_hours_raw = COALESCE(EXCLUDED.open_hours_raw, stores.open_hours_raw),
+        price = COALESCE(EXCLUDED.price, stores.price),
+        refill_items = COALESCE(EXCLUDED.refill_items, stores.refill_items),
+        image_urls = COALESCE(EXCLUDED.image_urls, stores.image_urls),
+        phone_number = COALESCE(EXCLUDED.phone_number, stores.phone_number),
+        raw_categories_diningcode = COALESCE(EXCLUDED.raw_categories_diningcode, stores.raw_categories_diningcode),
+        status = EXCLUDED.status,
+        menu_items = COALESCE(EXCLUDED.menu_items, stores.menu_items),
+        menu_categories = COALESCE(EXCLUDED.menu_categories, stores.menu_categories),
+        signature_menu = COALESCE(EXCLUDED.signature_menu, stores.signature_menu),
+        price_details = COALESCE(EXCLUDED.price_details, stores.price_details),
+        break_time = COALESCE(EXCLUDED.break_time, stores.break_time),
+        last_order = COALESCE(EXCLUDED.last_order, stores.last_order),
+        holiday = COALESCE(EXCLUDED.holiday, stores.holiday),
+        main_image = COALESCE(EXCLUDED.main_image, stores.main_image),
+        menu_images = COALESCE(EXCLUDED.menu_images, stores.menu_images),
+        interior_images = COALESCE(EXCLUDED.interior_images, stores.interior_images),
+        review_summary = COALESCE(EXCLUDED.review_summary, stores.review_summary),
+        keywords = COALESCE(EXCLUDED.keywords, stores.keywords),
+        atmosphere = COALESCE(EXCLUDED.atmosphere, stores.atmosphere),
+        website = COALESCE(EXCLUDED.website, stores.website),
+        social_media = COALESCE(EXCLUDED.social_media, stores.social_media),
+        refill_type = COALESCE(EXCLUDED.refill_type, stores.refill_type),
+        refill_conditions = COALESCE(EXCLUDED.refill_conditions, stores.refill_conditions),
+        is_confirmed_refill = EXCLUDED.is_confirmed_refill,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING diningcode_place_id, id
+"""
+
+STORE_UPSERT_QUERY = f"""
+    INSERT INTO stores ({', '.join(STORE_COLUMNS)})
+    VALUES %s
+""" + STORE_UPSERT_CONFLICT
+
+# execute_values 한 번에 전송할 행 수
+STORE_UPSERT_PAGE_SIZE = 500
+
+# 이 행 수 이상이면 COPY로 임시 테이블에 적재 후 한 번에 UPSERT
+STORE_COPY_THRESHOLD = 100
+
+# COPY 적재용 세션 임시 테이블 (ord는 삽입 순서 고정용, 결과 ID는 가게 ID로 매핑)
+STORE_STAGING_CREATE_QUERY = f"""
+    CREATE TEMP TABLE IF NOT EXISTS stores_staging AS
+    SELECT 0::bigint AS ord, {', '.join(STORE_COLUMNS)} FROM stores WITH NO DATA
+"""
+
+STORE_STAGING_COPY_QUERY = f"""
+    COPY stores_staging (ord, {', '.join(STORE_COLUMNS)}) FROM STDIN
+"""
+
+STORE_STAGING_UPSERT_QUERY = f"""
+    INSERT INTO stores ({', '.join(STORE_COLUMNS)})
+    SELECT {', '.join(STORE_COLUMNS)} FROM stores_staging ORDER BY ord
+""" + STORE_UPSERT_CONFLICT
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+def _format_array_element_for_copy(value) -> str:
+    """배열 원소를 PostgreSQL 배열 리터럴 원소로 변환"""
+    if value is None:
+        return 'NULL'
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else str(value)
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _format_value_for_copy(value) -> str:
+    """COPY text 형식 필드로 변환 (NULL은 \\N, 탭/개행/역슬래시 이스케이프)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (list, tuple)):
+        value = '{' + ','.join(_format_array_element_for_copy(v) for v in value) + '}'
+    elif isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False)
+    else:
+        value = str(value)
+    return value.translate(_COPY_ESCAPES)
+
+def _store_row(store: Dict) -> tuple:
+    """가게 dict를 STORE_COLUMNS 순서의 행 튜플로 변환"""
+    return (
+        store.get('name'),
+        store.get('address'),
+        store.get('position_lat'),
+        store.get('position_lng'),
+        store.get('position_x'),
+        store.get('position_y'),
+        store.get('naver_rating'),
+        store.get('kakao_rating'),
+        store.get('diningcode_rating'),
+        store.get('open_hours'),
+        store.get('open_hours_raw'),
+        store.get('price'),
+        store.get('refill_items', []),
+        store.get('image_urls', []),
+        store.get('phone_number'),
+        store.get('diningcode_place_id'),
+        store.get('raw_categories_diningcode', []),
+        store.get('status', '운영중'),
+        json.dumps(store.get('menu_items', []), ensure_ascii=False) if store.get('menu_items') else None,
+        store.get('menu_categories', []),
+        store.get('signature_menu', []),
+        store.get('price_details', []),
+        store.get('break_time', ''),
+        store.get('last_order', ''),
+        store.get('holiday', ''),
+        store.get('main_image', ''),
+        store.get('menu_images', []),
+        store.get('interior_images', []),
+        store.get('review_summary', ''),
+        store.get('keywords', []),
+        store.get('atmosphere', ''),
+        store.get('website', ''),
+        store.get('social_media', []),
+        store.get('refill_type', ''),
+        store.get('refill_conditions', ''),
+        store.get('is_confirmed_refill', False)
+    )
+
 class DatabaseManager:
     def __init__(self):
         self.pg_conn = None
@@ -150,106 +296,41 @@ class DatabaseManager:
         store_ids = []
         
         try:
-            # 개별 UPSERT 처리 (PostgreSQL ON CONFLICT 사용)
-            for store in stores_data:
-                cursor.execute("""
-                    INSERT INTO stores (
-                    name, address, position_lat, position_lng, 
-                    position_x, position_y, naver_rating, kakao_rating, diningcode_rating,
-                    open_hours, open_hours_raw, price, refill_items, image_urls,
-                    phone_number, diningcode_place_id, raw_categories_diningcode, status,
-                    menu_items, menu_categories, signature_menu,
-                    price_details, break_time, last_order, holiday, main_image,
-                    menu_images, interior_images, review_summary, keywords, atmosphere,
-                    website, social_media, refill_type, refill_conditions, is_confirmed_refill
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            # 같은 배치 안의 중복 가게는 한 행으로 병합 (한 문장에서 같은 행을 두 번 UPSERT할 수 없음)
+            # 가게 ID는 RETURNING이 돌려주는 텍스트 값과 같도록 문자열로 한 번만 정규화해 병합/조회에 함께 사용
+            place_keys = [
+                str(store['diningcode_place_id']) if store.get('diningcode_place_id') is not None else None
+                for store in stores_data
+            ]
+            rows = []
+            place_rows = {}
+            for store, key in zip(stores_data, place_keys):
+                row = _store_row(store)
+                if key is not None and key in place_rows:
+                    idx = place_rows[key]
+                    # 나중 값 우선, NULL은 기존 값 유지 (개별 UPSERT의 COALESCE와 동일)
+                    rows[idx] = tuple(new if new is not None else prev for prev, new in zip(rows[idx], row))
+                else:
+                    idx = len(rows)
+                    rows.append(row)
+                    if key is not None:
+                        place_rows[key] = idx
+            
+            # 대량이면 COPY 적재 후 UPSERT, 아니면 다중 VALUES 한 문장으로 UPSERT
+            if len(rows) >= STORE_COPY_THRESHOLD:
+                results = self._upsert_stores_via_copy(cursor, rows)
+            elif rows:
+                results = psycopg2.extras.execute_values(
+                    cursor, STORE_UPSERT_QUERY, rows,
+                    page_size=STORE_UPSERT_PAGE_SIZE, fetch=True
                 )
-                    ON CONFLICT (diningcode_place_id) 
-                    DO UPDATE SET
-                        name = EXCLUDED.name,
-                        address = COALESCE(EXCLUDED.address, stores.address),
-                        position_lat = COALESCE(EXCLUDED.position_lat, stores.position_lat),
-                        position_lng = COALESCE(EXCLUDED.position_lng, stores.position_lng),
-                        position_x = COALESCE(EXCLUDED.position_x, stores.position_x),
-                        position_y = COALESCE(EXCLUDED.position_y, stores.position_y),
-                        naver_rating = COALESCE(EXCLUDED.naver_rating, stores.naver_rating),
-                        kakao_rating = COALESCE(EXCLUDED.kakao_rating, stores.kakao_rating),
-                        diningcode_rating = COALESCE(EXCLUDED.diningcode_rating, stores.diningcode_rating),
-                        open_hours = COALESCE(EXCLUDED.open_hours, stores.open_hours),
-                        open_hours_raw = COALESCE(EXCLUDED.open_hours_raw, stores.open_hours_raw),
-                        price = COALESCE(EXCLUDED.price, stores.price),
-                        refill_items = COALESCE(EXCLUDED.refill_items, stores.refill_items),
-                        image_urls = COALESCE(EXCLUDED.image_urls, stores.image_urls),
-                        phone_number = COALESCE(EXCLUDED.phone_number, stores.phone_number),
-                        raw_categories_diningcode = COALESCE(EXCLUDED.raw_categories_diningcode, stores.raw_categories_diningcode),
-                        status = EXCLUDED.status,
-                        menu_items = COALESCE(EXCLUDED.menu_items, stores.menu_items),
-                        menu_categories = COALESCE(EXCLUDED.menu_categories, stores.menu_categories),
-                        signature_menu = COALESCE(EXCLUDED.signature_menu, stores.signature_menu),
-                        price_details = COALESCE(EXCLUDED.price_details, stores.price_details),
-                        break_time = COALESCE(EXCLUDED.break_time, stores.break_time),
-                        last_order = COALESCE(EXCLUDED.last_order, stores.last_order),
-                        holiday = COALESCE(EXCLUDED.holiday, stores.holiday),
-                        main_image = COALESCE(EXCLUDED.main_image, stores.main_image),
-                        menu_images = COALESCE(EXCLUDED.menu_images, stores.menu_images),
-                        interior_images = COALESCE(EXCLUDED.interior_images, stores.interior_images),
-                        review_summary = COALESCE(EXCLUDED.review_summary, stores.review_summary),
-                        keywords = COALESCE(EXCLUDED.keywords, stores.keywords),
-                        atmosphere = COALESCE(EXCLUDED.atmosphere, stores.atmosphere),
-                        website = COALESCE(EXCLUDED.website, stores.website),
-                        social_media = COALESCE(EXCLUDED.social_media, stores.social_media),
-                        refill_type = COALESCE(EXCLUDED.refill_type, stores.refill_type),
-                        refill_conditions = COALESCE(EXCLUDED.refill_conditions, stores.refill_conditions),
-                        is_confirmed_refill = EXCLUDED.is_confirmed_refill,
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id
-                """, (
-                    store.get('name'),
-                    store.get('address'),
-                    store.get('position_lat'),
-                    store.get('position_lng'),
-                    store.get('position_x'),
-                    store.get('position_y'),
-                    store.get('naver_rating'),
-                    store.get('kakao_rating'),
-                    store.get('diningcode_rating'),
-                    store.get('open_hours'),
-                    store.get('open_hours_raw'),
-                    store.get('price'),
-                    store.get('refill_items', []),
-                    store.get('image_urls', []),
-                    store.get('phone_number'),
-                    store.get('diningcode_place_id'),
-                    store.get('raw_categories_diningcode', []),
-                    store.get('status', '운영중'),
-                    json.dumps(store.get('menu_items', []), ensure_ascii=False) if store.get('menu_items') else None,
-                    store.get('menu_categories', []),
-                    store.get('signature_menu', []),
-                    store.get('price_details', []),
-                    store.get('break_time', ''),
-                    store.get('last_order', ''),
-                    store.get('holiday', ''),
-                    store.get('main_image', ''),
-                    store.get('menu_images', []),
-                    store.get('interior_images', []),
-                    store.get('review_summary', ''),
-                    store.get('keywords', []),
-                    store.get('atmosphere', ''),
-                    store.get('website', ''),
-                    store.get('social_media', []),
-                    store.get('refill_type', ''),
-                    store.get('refill_conditions', ''),
-                    store.get('is_confirmed_refill', False)
-                ))
-                
-                # 삽입/업데이트된 ID 수집
-                result = cursor.fetchone()
-                if result:
-                    store_ids.append(result[0])
+            else:
+                results = []
+            
+            if results:
+                # RETURNING 행 순서는 보장되지 않으므로 가게 ID(키)로 입력 순서에 맞춤
+                id_by_place = {place_id: store_id for place_id, store_id in results}
+                store_ids = [id_by_place.get(key) if key is not None else None for key in place_keys]
             
             logger.info(f"가게 정보 UPSERT 완료: {len(store_ids)}개 (신규 삽입 또는 업데이트)")
             
@@ -261,6 +342,48 @@ class DatabaseManager:
             
         return store_ids
     
+    def refresh_stats_view(self):
+        """가게 통계 materialized view 갱신 (크롤링 실행 종료 시 1회 호출, view가 없으면 생략)"""
+        cursor = self.pg_conn.cursor()
+        try:
+            cursor.execute("SELECT to_regclass('stores_stats') IS NOT NULL")
+            if cursor.fetchone()[0]:
+                cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY stores_stats")
+        except Exception as e:
+            logger.warning(f"가게 통계 view 갱신 실패: {e}")
+        finally:
+            cursor.close()
+    
+    def get_store_stats(self) -> Optional[Dict]:
+        """가게 통계 materialized view 조회 (단일 행, view가 없으면 None)"""
+        cursor = self.pg_conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        try:
+            cursor.execute("SELECT to_regclass('stores_stats') IS NOT NULL AS exists")
+            if not cursor.fetchone()["exists"]:
+                return None
+            cursor.execute("SELECT * FROM stores_stats")
+            return cursor.fetchone()
+        finally:
+            cursor.close()
+    
+    def _upsert_stores_via_copy(self, cursor, rows: List[tuple]) -> List[tuple]:
+        """COPY로 임시 테이블에 적재한 뒤 INSERT ... SELECT로 UPSERT (가게 ID별 id 결과 반환, 순서 무관)"""
+        cursor.execute(STORE_STAGING_CREATE_QUERY)
+        cursor.execute("TRUNCATE stores_staging")
+        
+        buffer = io.StringIO()
+        for ord_, row in enumerate(rows):
+            buffer.write(str(ord_))
+            for value in row:
+                buffer.write('\t')
+                buffer.write(_format_value_for_copy(value))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        cursor.copy_expert(STORE_STAGING_COPY_QUERY, buffer)
+        cursor.execute(STORE_STAGING_UPSERT_QUERY)
+        return cursor.fetchall()
+    
     def link_store_categories(self, store_id: int, category_ids: List[int]):
         """가게-카테고리 연결"""
         if not category_ids:
@@ -286,6 +409,40 @@ class DatabaseManager:
         finally:
             cursor.close()
     
+    def link_store_categories_batch(self, store_categories: Dict[int, List[int]]):
+        """여러 가게의 카테고리 연결을 한 번에 갱신 (DELETE 1회 + INSERT 1회)"""
+        if not store_categories:
+            return
+        
+        cursor = self.pg_conn.cursor()
+        
+        try:
+            # 기존 연결 일괄 삭제
+            cursor.execute(
+                "DELETE FROM store_categories WHERE store_id = ANY(%s)",
+                (list(store_categories),)
+            )
+            
+            # 새 연결 일괄 삽입
+            category_values = [
+                (store_id, cat_id)
+                for store_id, category_ids in store_categories.items()
+                for cat_id in category_ids
+            ]
+            if category_values:
+                psycopg2.extras.execute_values(
+                    cursor,
+                    "INSERT INTO store_categories (store_id, category_id) VALUES %s",
+                    category_values,
+                    page_size=STORE_UPSERT_PAGE_SIZE
+                )
+            
+        except Exception as e:
+            logger.error(f"가게-카테고리 일괄 연결 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+    
     def log_crawling_session(self, keyword: str, rect_area: str) -> int:
         """크롤링 세션 로그 시작"""
         cursor = self.pg_conn.cursor()
@@ -387,9 +544,10 @@ class DatabaseManager:
             # 가게 정보 삽입
             store_ids = self.insert_stores_batch(stores_data)
             
-            # 가게-카테고리 연결
+            # 가게-카테고리 연결 (가게별로 모은 뒤 한 번에 반영)
+            store_categories = {}
             for i, store in enumerate(stores_data):
-                if i < len(store_ids):
+                if i < len(store_ids) and store_ids[i] is not None:
                     store_id = store_ids[i]
                     
                     # 기본 카테고리 연결
@@ -407,7 +565,10 @@ class DatabaseManager:
                     category_ids.extend(keyword_ids)
                     
                     if category_ids:
-                        self.link_store_categories(store_id, list(set(category_ids)))
+                        # 배치 내 중복 가게는 같은 store_id로 합쳐지므로 마지막 값 사용
+                        store_categories[store_id] = list(set(category_ids))
+            
+            self.link_store_categories_batch(store_categories)
             
             # 크롤링 로그 업데이트
             self.update_crawling_log(
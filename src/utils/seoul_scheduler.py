@@ -3,20 +3,90 @@
 4단계: 서울 25개 구 순차 크롤링 전략
 """
 
+import sys
 import logging
 import schedule
 import time
-import json
+import orjson
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Callable, NamedTuple
+from dataclasses import dataclass
 from enum import Enum
 import threading
 import queue
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import heapq
+from collections import deque
+from pathlib import Path
 from seoul_districts import SeoulDistrictManager, DistrictInfo
 
+# 프로젝트 루트를 Python 경로에 추가 (simple_main, config 모듈 사용)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 logger = logging.getLogger(__name__)
 
+# 스케줄러 루프가 한 번에 대기하는 최대 시간 (초)
+MAX_SCHEDULER_IDLE_SECONDS = 300
+
+# 동시에 크롤링할 수 있는 최대 구 수
+MAX_PARALLEL_DISTRICTS = 2
+
+# 대시보드/리포트 JSON 직렬화 옵션
+JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _dump_json(path: str, obj) -> None:
+    """JSON 파일 저장 (orjson으로 바이트 직렬화 후 한 번에 기록)"""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=JSON_DUMP_OPTIONS, default=str))
+
+# 메모리에 유지하는 세션 보관 기간 (주간 리포트 7일 + 여유 1일)
+SESSION_RETENTION = timedelta(days=8)
+
+# 요일 이름 → datetime.weekday() 값
+WEEKDAY_INDEX = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6
+}
+
+# 구별 특성 키워드 (검색 결과 부족 시 추가)
+DISTRICT_SPECIAL_KEYWORDS = {
+    "성북구": ["성신여대", "한성대", "정릉"],
+    "관악구": ["서울대", "신림동", "봉천동"],
+    "서대문구": ["연세대", "이화여대", "신촌"],
+    "동대문구": ["한국외대", "경희대", "회기동"],
+    "종로구": ["대학로", "인사동", "삼청동"],
+    "중구": ["명동", "남대문", "동대문"],
+    "용산구": ["이태원", "한남동", "용산역"],
+    "영등포구": ["여의도", "타임스퀘어", "영등포역"]
+}
+
+# 무한리필 키워드와 조합한 구별 특화 키워드 (모듈 로드 시 1회 생성)
+DISTRICT_SPECIFIC_KEYWORDS = {
+    district: tuple(
+        f"{keyword} {suffix}"
+        for keyword in keywords
+        for suffix in ("무한리필", "고기무한리필", "뷔페")
+    )
+    for district, keywords in DISTRICT_SPECIAL_KEYWORDS.items()
+}
+
+# 작업 큐 우선순위 (낮을수록 먼저 실행)
+PRIORITY_RANK = {
+    "manual": 0,
+    "highest": 1,
+    "high": 2,
+    "medium": 3,
+    "low": 4
+}
+
 class CrawlingStatus(Enum):
     """크롤링 상태 열거형"""
     PENDING = "대기"
@@ -26,7 +96,7 @@ class CrawlingStatus(Enum):
     PAUSED = "일시정지"
     CANCELLED = "취소"
 
-@dataclass
+@dataclass(slots=True)
 class CrawlingSession:
     """크롤링 세션 정보"""
     session_id: str
@@ -45,6 +115,21 @@ class CrawlingSession:
             self.errors = []
         if self.keywords_used is None:
             self.keywords_used = []
+    
+    def to_dict(self) -> Dict:
+        """상태 조회용 얕은 dict 변환 (asdict의 deepcopy 회피)"""
+        return {
+            "session_id": self.session_id,
+            "district_name": self.district_name,
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "status": self.status.value,
+            "stores_found": self.stores_found,
+            "stores_processed": self.stores_processed,
+            "errors": list(self.errors),
+            "keywords_used": list(self.keywords_used),
+            "processing_time_seconds": self.processing_time_seconds
+        }
 
 @dataclass
 class WeeklyScheduleConfig:
@@ -121,16 +206,125 @@ SEOUL_WEEKLY_SCHEDULE = {
     )
 }
 
+# (요일, 구, 시간, 우선순위) 평탄화 목록 (스케줄 설정 시 한 번의 순회로 등록)
+_FLAT_SCHEDULE = tuple(
+    (day_name, district, time_slot, config.priority)
+    for day_name, config in SEOUL_WEEKLY_SCHEDULE.items()
+    for district, time_slot in zip(config.districts, config.time_slots)
+)
+
+# 주간 예상 처리량 (스케줄이 고정이므로 최초 계산 후 재사용)
+_WEEKLY_ESTIMATE_CACHE: Optional[Dict] = None
+
+def get_weekly_estimates(district_manager: SeoulDistrictManager) -> Dict:
+    """주간 스케줄 기준 예상 처리량 계산 (프로세스당 1회)"""
+    global _WEEKLY_ESTIMATE_CACHE
+    if _WEEKLY_ESTIMATE_CACHE is not None:
+        return _WEEKLY_ESTIMATE_CACHE
+    
+    total_districts = 0
+    total_stores = 0
+    
+    for config in SEOUL_WEEKLY_SCHEDULE.values():
+        total_districts += len(config.districts)
+        for district in config.districts:
+            district_info = district_manager.get_district_info(district)
+            if district_info:
+                total_stores += district_info.expected_stores
+    
+    _WEEKLY_ESTIMATE_CACHE = {
+        "total_districts": total_districts,
+        "total_stores": total_stores,
+        "avg_stores_per_district": total_stores / total_districts if total_districts > 0 else 0
+    }
+    return _WEEKLY_ESTIMATE_CACHE
+
+class DistrictSlot(NamedTuple):
+    """구별 주간 크롤링 슬롯 (next_run, seq 순으로 정렬)"""
+    next_run: datetime
+    seq: int
+    day: str
+    district: str
+    time_slot: str
+    priority: str
+
+def _next_weekly_run(day_name: str, time_slot: str, now: datetime) -> datetime:
+    """now 이후 가장 가까운 요일/시각 계산"""
+    hour, minute = map(int, time_slot.split(":"))
+    days_ahead = (WEEKDAY_INDEX[day_name] - now.weekday()) % 7
+    next_run = (now + timedelta(days=days_ahead)).replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=7)
+    return next_run
+
+class DistrictSlotHeap:
+    """구별 주간 슬롯을 다음 실행 시각 기준 최소 힙으로 관리
+    
+    schedule 라이브러리는 run_pending/idle_seconds마다 전체 작업을 순회하므로,
+    동질적인 25개 구 슬롯은 힙으로 관리하고 schedule에는 리포트/재시도 작업만 남긴다.
+    """
+    
+    def __init__(self):
+        self._heap: List[DistrictSlot] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+    
+    def clear(self):
+        """모든 슬롯 제거"""
+        with self._lock:
+            self._heap.clear()
+    
+    def add(self, day_name: str, district: str, time_slot: str, priority: str, now: Optional[datetime] = None):
+        """슬롯 등록"""
+        next_run = _next_weekly_run(day_name, time_slot, now or datetime.now())
+        with self._lock:
+            heapq.heappush(self._heap, DistrictSlot(next_run, next(self._seq), day_name, district, time_slot, priority))
+    
+    def pop_due(self, now: datetime) -> List[DistrictSlot]:
+        """실행 시각이 된 슬롯을 꺼내고 다음 주 실행으로 재등록"""
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0].next_run <= now:
+                slot = heapq.heappop(self._heap)
+                due.append(slot)
+                # 놓친 주기는 건너뛰고 now 이후 다음 실행으로 재등록
+                next_run = _next_weekly_run(slot.day, slot.time_slot, now)
+                heapq.heappush(self._heap, slot._replace(next_run=next_run, seq=next(self._seq)))
+        return due
+    
+    def idle_seconds(self, now: datetime) -> Optional[float]:
+        """다음 슬롯까지 남은 시간 (슬롯이 없으면 None)"""
+        with self._lock:
+            if not self._heap:
+                return None
+            return (self._heap[0].next_run - now).total_seconds()
+    
+    def peek(self, n: int) -> List[DistrictSlot]:
+        """다음 실행 예정 슬롯 n개"""
+        with self._lock:
+            return heapq.nsmallest(n, self._heap)
+
 class SeoulCrawlingScheduler:
     """서울 전용 크롤링 스케줄러"""
     
     def __init__(self, district_manager: SeoulDistrictManager):
         self.district_manager = district_manager
         self.sessions: Dict[str, CrawlingSession] = {}
-        self.current_session: Optional[CrawlingSession] = None
+        self._recent_sessions: deque = deque()  # 시작 시간 순 세션 (SESSION_RETENTION 이내)
+        self._active_sessions: Dict[str, CrawlingSession] = {}  # 구 이름 -> 실행 중인 세션
+        self._active_lock = threading.Lock()  # 실행 시작 시 같은 구 중복 확인/등록용
         self.is_running = False
-        self.task_queue = queue.Queue()
+        self.task_queue = queue.PriorityQueue()
+        self._task_sequence = itertools.count()  # 같은 우선순위 내 FIFO 보장 (dict 비교 방지)
+        self._queued = 0  # 대기 중인 작업 수 (읽기는 잠금 없이, 증감만 _counter_lock 안에서)
+        self._counter_lock = threading.Lock()
         self.worker_thread = None
+        self._crawl_executor: Optional[ThreadPoolExecutor] = None
+        self._crawl_slots = threading.BoundedSemaphore(MAX_PARALLEL_DISTRICTS)
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()  # 작업 추가 시 워커를 깨우는 신호
+        self.district_slots = DistrictSlotHeap()
+        self.error_handler: Optional["SeoulErrorHandler"] = None
         self.dashboard = SeoulDashboard(self)
         
     def setup_weekly_schedule(self):
@@ -139,17 +333,19 @@ class SeoulCrawlingScheduler:
         
         # 기존 스케줄 초기화
         schedule.clear()
+        self.district_slots.clear()
         
-        for day_name, config in SEOUL_WEEKLY_SCHEDULE.items():
-            for i, (district, time_slot) in enumerate(zip(config.districts, config.time_slots)):
-                # 각 구별로 스케줄 등록
-                getattr(schedule.every(), day_name).at(time_slot).do(
-                    self._schedule_district_crawling,
-                    district_name=district,
-                    priority=config.priority
-                ).tag(f"{day_name}_{district}")
-                
-                logger.info(f"{day_name.capitalize()} {time_slot}: {district} (우선순위: {config.priority})")
+        now = datetime.now()
+        for day_name, district, time_slot, priority in _FLAT_SCHEDULE:
+            # 각 구별 슬롯은 힙 스케줄러에 등록
+            self.district_slots.add(day_name, district, time_slot, priority, now)
+            
+            logger.info(f"{day_name.capitalize()} {time_slot}: {district} (우선순위: {priority})")
+        
+        # 상태 확인용 가게 통계 갱신 (구별 실행마다가 아니라 하루 한 번)
+        schedule.every().day.at("04:00").do(
+            self._refresh_store_stats
+        ).tag("stats_refresh")
         
         # 주간 통계 리포트 스케줄 (일요일 23:00)
         schedule.every().sunday.at("23:00").do(
@@ -163,64 +359,87 @@ class SeoulCrawlingScheduler:
     
     def _calculate_weekly_estimates(self):
         """주간 예상 처리량 계산"""
-        total_districts = 0
-        total_stores = 0
-        
-        for config in SEOUL_WEEKLY_SCHEDULE.values():
-            total_districts += len(config.districts)
-            for district in config.districts:
-                district_info = self.district_manager.get_district_info(district)
-                if district_info:
-                    total_stores += district_info.expected_stores
+        estimates = get_weekly_estimates(self.district_manager)
         
         logger.info(f"주간 예상 처리량:")
-        logger.info(f"  총 구 수: {total_districts}개")
-        logger.info(f"  예상 가게 수: {total_stores:,}개")
-        logger.info(f"  평균 구당 가게: {total_stores/total_districts:.1f}개")
+        logger.info(f"  총 구 수: {estimates['total_districts']}개")
+        logger.info(f"  예상 가게 수: {estimates['total_stores']:,}개")
+        logger.info(f"  평균 구당 가게: {estimates['avg_stores_per_district']:.1f}개")
     
     def _schedule_district_crawling(self, district_name: str, priority: str):
         """구별 크롤링 스케줄 실행"""
         logger.info(f"스케줄 실행: {district_name} (우선순위: {priority})")
         
-        # 현재 실행 중인 작업이 있는지 확인
-        if self.current_session and self.current_session.status == CrawlingStatus.RUNNING:
-            logger.warning(f"이미 실행 중인 세션이 있습니다: {self.current_session.district_name}")
+        # 같은 구가 이미 실행 중인지 확인 (다른 구는 병렬 실행 가능)
+        with self._active_lock:
+            is_active = district_name in self._active_sessions
+        if is_active:
+            logger.warning(f"이미 실행 중인 세션이 있습니다: {district_name}")
             return
         
         # 크롤링 세션 생성
         session = self._create_crawling_session(district_name)
         
-        # 작업 큐에 추가
-        self.task_queue.put({
-            "type": "district_crawling",
-            "session": session,
-            "priority": priority
-        })
-        
-        # 워커 스레드 시작 (아직 실행 중이 아닌 경우)
-        if not self.is_running:
-            self._start_worker_thread()
+        # 작업 큐에 추가 (start_scheduler에서 시작된 상주 워커가 처리)
+        self._enqueue_task(session, priority)
     
     def _create_crawling_session(self, district_name: str) -> CrawlingSession:
         """크롤링 세션 생성"""
-        session_id = f"{district_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        session_id = f"{district_name}_{now.strftime('%Y%m%d_%H%M%S')}"
         
         session = CrawlingSession(
             session_id=session_id,
             district_name=district_name,
-            start_time=datetime.now(),
+            start_time=now,
             status=CrawlingStatus.PENDING
         )
         
         self.sessions[session_id] = session
+        self._recent_sessions.append(session)
+        
+        # 보관 기간이 지난 세션 정리 (sessions가 무한히 커지지 않도록)
+        cutoff = now - SESSION_RETENTION
+        while self._recent_sessions and self._recent_sessions[0].start_time < cutoff:
+            expired = self._recent_sessions.popleft()
+            if self.sessions.get(expired.session_id) is expired:
+                del self.sessions[expired.session_id]
+        
         return session
     
+    def get_sessions_since(self, since: datetime) -> List[CrawlingSession]:
+        """since 이후 시작된 세션 목록 (시작 시간 순)"""
+        sessions = []
+        # 최신 세션부터 역순으로 확인하여 기간을 벗어나면 중단
+        for session in reversed(tuple(self._recent_sessions)):
+            if session.start_time < since:
+                break
+            sessions.append(session)
+        sessions.reverse()
+        return sessions
+    
+    def _enqueue_task(self, session: CrawlingSession, priority: str):
+        """우선순위에 따라 작업 큐에 추가"""
+        rank = PRIORITY_RANK.get(priority, len(PRIORITY_RANK))
+        self.task_queue.put((rank, next(self._task_sequence), {
+            "type": "district_crawling",
+            "session": session,
+            "priority": priority
+        }))
+        with self._counter_lock:
+            self._queued += 1
+        self._wake.set()
+    
     def _start_worker_thread(self):
         """워커 스레드 시작"""
         if self.worker_thread and self.worker_thread.is_alive():
             return
         
         self.is_running = True
+        if self._crawl_executor is None:
+            self._crawl_executor = ThreadPoolExecutor(
+                max_workers=MAX_PARALLEL_DISTRICTS, thread_name_prefix="district-crawl"
+            )
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
         self.worker_thread.start()
         logger.info("크롤링 워커 스레드 시작")
@@ -228,24 +447,48 @@ class SeoulCrawlingScheduler:
     def _worker_loop(self):
         """워커 스레드 메인 루프"""
         while self.is_running:
-            try:
-                # 작업 큐에서 작업 가져오기 (타임아웃 5초)
-                task = self.task_queue.get(timeout=5)
-                
-                if task["type"] == "district_crawling":
-                    self._execute_district_crawling(task["session"])
-                
-                self.task_queue.task_done()
+            # 작업이 추가될 때까지 대기 (여러 번의 추가는 한 번의 깨움으로 합쳐짐)
+            self._wake.wait(timeout=60)
+            self._wake.clear()
+            
+            # 빈 실행 슬롯이 있는 만큼 우선순위 순으로 꺼내 병렬 실행
+            while self.is_running and self._crawl_slots.acquire(blocking=False):
+                try:
+                    _, _, task = self.task_queue.get_nowait()
+                except queue.Empty:
+                    self._crawl_slots.release()
+                    break
+                with self._counter_lock:
+                    self._queued -= 1
                 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"워커 스레드 오류: {e}")
-                continue
+                # 작업마다 별도 컨텍스트에서 실행 (구별 설정이 서로 섞이지 않음)
+                future = self._crawl_executor.submit(contextvars.copy_context().run, self._run_task, task)
+                future.add_done_callback(self._on_task_done)
+    
+    def _run_task(self, task: Dict):
+        """작업 실행 (실행 스레드에서 호출)"""
+        try:
+            if task["type"] == "district_crawling":
+                self._execute_district_crawling(task["session"])
+        except Exception as e:
+            logger.error(f"워커 스레드 오류: {e}")
+    
+    def _on_task_done(self, _future):
+        """작업 완료 시 실행 슬롯 반환 후 워커를 깨움"""
+        self.task_queue.task_done()
+        self._crawl_slots.release()
+        self._wake.set()
     
     def _execute_district_crawling(self, session: CrawlingSession):
         """구별 크롤링 실행"""
-        self.current_session = session
+        # 큐에 같은 구가 두 번 들어갔을 수 있으므로 실행 직전에 다시 확인
+        with self._active_lock:
+            if session.district_name in self._active_sessions:
+                logger.warning(f"이미 실행 중인 세션이 있어 건너뜁니다: {session.district_name}")
+                session.status = CrawlingStatus.CANCELLED
+                session.end_time = datetime.now()
+                return
+            self._active_sessions[session.district_name] = session
         session.status = CrawlingStatus.RUNNING
         
         logger.info(f"=== {session.district_name} 크롤링 시작 ===")
@@ -285,29 +528,25 @@ class SeoulCrawlingScheduler:
             self.district_manager.update_district_status(session.district_name, "오류")
             
         finally:
-            self.current_session = None
+            with self._active_lock:
+                self._active_sessions.pop(session.district_name, None)
     
     def _run_district_crawling(self, district_info: DistrictInfo, session: CrawlingSession) -> Dict:
         """실제 구별 크롤링 실행"""
         # 여기서 실제 크롤링 로직을 호출
-        # main.py의 run_enhanced_crawling과 연동
+        # simple_main.py의 개선된 크롤링과 연동 (저장된 가게 목록 반환)
         
-        from main import run_enhanced_crawling
-        import config
+        from simple_main import crawl_enhanced_stores
+        from config.config import TEST_REGION_CV, TEST_RECT_CV, TEST_KEYWORDS_CV
         
-        # 임시로 설정 변경
-        original_region = getattr(config, 'TEST_REGION', None)
-        original_rect = getattr(config, 'TEST_RECT', None)
-        original_keywords = getattr(config, 'TEST_KEYWORDS', None)
+        # 구별 설정은 현재 컨텍스트에만 지정 (모듈 전역을 바꾸지 않으므로 병렬 실행에 안전)
+        region_token = TEST_REGION_CV.set(district_info.name)
+        rect_token = TEST_RECT_CV.set(district_info.rect)
+        keywords_token = TEST_KEYWORDS_CV.set(district_info.keywords)
         
         try:
-            # 구별 설정으로 변경
-            config.TEST_REGION = district_info.name
-            config.TEST_RECT = district_info.rect
-            config.TEST_KEYWORDS = district_info.keywords
-            
             # 크롤링 실행
-            stores = run_enhanced_crawling()
+            stores = crawl_enhanced_stores()
             
             return {
                 "stores_found": len(stores) if stores else 0,
@@ -317,47 +556,67 @@ class SeoulCrawlingScheduler:
             
         finally:
             # 설정 복원
-            if original_region:
-                config.TEST_REGION = original_region
-            if original_rect:
-                config.TEST_RECT = original_rect
-            if original_keywords:
-                config.TEST_KEYWORDS = original_keywords
+            TEST_KEYWORDS_CV.reset(keywords_token)
+            TEST_RECT_CV.reset(rect_token)
+            TEST_REGION_CV.reset(region_token)
+    
+    def _refresh_store_stats(self):
+        """가게 통계 materialized view 갱신"""
+        from src.core.database import DatabaseManager
+        
+        try:
+            db = DatabaseManager()
+        except Exception as e:
+            logger.warning(f"가게 통계 갱신용 DB 연결 실패: {e}")
+            return
+        try:
+            db.refresh_stats_view()
+            logger.info("가게 통계 view 갱신 완료")
+        finally:
+            db.close()
     
     def _generate_weekly_report(self):
         """주간 리포트 생성"""
         logger.info("=== 주간 크롤링 리포트 생성 ===")
         
         # 지난 주 세션들 조회
-        week_ago = datetime.now() - timedelta(days=7)
-        weekly_sessions = [
-            session for session in self.sessions.values()
-            if session.start_time >= week_ago
-        ]
-        
-        # 통계 계산
-        total_sessions = len(weekly_sessions)
-        completed_sessions = len([s for s in weekly_sessions if s.status == CrawlingStatus.COMPLETED])
-        error_sessions = len([s for s in weekly_sessions if s.status == CrawlingStatus.ERROR])
-        total_stores = sum(s.stores_processed for s in weekly_sessions)
+        now = datetime.now()
+        week_ago = now - timedelta(days=7)
+        weekly_sessions = self.get_sessions_since(week_ago)
+        
+        # 통계 계산 (한 번의 순회로 모든 집계, 루프 안 속성 조회를 줄이기 위해 지역 변수 사용)
+        completed_status = CrawlingStatus.COMPLETED
+        error_status = CrawlingStatus.ERROR
+        total_sessions = completed_sessions = error_sessions = total_stores = 0
+        districts_completed = []
+        districts_with_errors = []
+        for s in weekly_sessions:
+            total_sessions += 1
+            total_stores += s.stores_processed
+            status = s.status
+            if status is completed_status:
+                completed_sessions += 1
+                districts_completed.append(s.district_name)
+            elif status is error_status:
+                error_sessions += 1
+                districts_with_errors.append(s.district_name)
         
         # 리포트 생성
         report = {
-            "period": f"{week_ago.strftime('%Y-%m-%d')} ~ {datetime.now().strftime('%Y-%m-%d')}",
+            "period": f"{week_ago.strftime('%Y-%m-%d')} ~ {now.strftime('%Y-%m-%d')}",
             "total_sessions": total_sessions,
             "completed_sessions": completed_sessions,
             "error_sessions": error_sessions,
             "success_rate": completed_sessions / total_sessions * 100 if total_sessions > 0 else 0,
             "total_stores_processed": total_stores,
             "average_stores_per_district": total_stores / completed_sessions if completed_sessions > 0 else 0,
-            "districts_completed": [s.district_name for s in weekly_sessions if s.status == CrawlingStatus.COMPLETED],
-            "districts_with_errors": [s.district_name for s in weekly_sessions if s.status == CrawlingStatus.ERROR]
+            "districts_completed": districts_completed,
+            "districts_with_errors": districts_with_errors
         }
         
         # 리포트 저장
-        report_filename = f"weekly_report_{datetime.now().strftime('%Y%m%d')}.json"
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        report_filename = f"weekly_report_{now.strftime('%Y%m%d')}.json"
+        _dump_json(report_filename, report)
         
         logger.info(f"주간 리포트 저장: {report_filename}")
         logger.info(f"완료율: {report['success_rate']:.1f}%, 총 가게: {report['total_stores_processed']:,}개")
@@ -367,20 +626,33 @@ class SeoulCrawlingScheduler:
         logger.info("=== 서울 크롤링 스케줄러 시작 ===")
         self.setup_weekly_schedule()
         
-        # 대시보드 시작
+        # 상주 워커 및 대시보드 시작
+        self._start_worker_thread()
         self.dashboard.start()
         
-        # 스케줄 실행 루프
-        while True:
+        # 스케줄 실행 루프 (다음 작업 시각까지만 대기, stop_scheduler 호출 시 즉시 종료)
+        self._stop_event.clear()
+        while not self._stop_event.is_set():
             try:
+                # 실행 시각이 된 구별 슬롯 처리 (힙 최상단만 확인)
+                now = datetime.now()
+                for slot in self.district_slots.pop_due(now):
+                    self._schedule_district_crawling(district_name=slot.district, priority=slot.priority)
+                
+                # 리포트/재시도 작업 처리
                 schedule.run_pending()
-                time.sleep(60)  # 1분마다 체크
+                
+                idle = MAX_SCHEDULER_IDLE_SECONDS
+                for candidate in (self.district_slots.idle_seconds(datetime.now()), schedule.idle_seconds()):
+                    if candidate is not None:
+                        idle = min(idle, candidate)
+                self._stop_event.wait(timeout=max(idle, 0))
             except KeyboardInterrupt:
                 logger.info("스케줄러 중지 요청")
                 break
             except Exception as e:
                 logger.error(f"스케줄러 오류: {e}")
-                time.sleep(60)
+                self._stop_event.wait(timeout=60)
         
         self.stop_scheduler()
     
@@ -388,38 +660,51 @@ class SeoulCrawlingScheduler:
         """스케줄러 중지"""
         logger.info("스케줄러 중지 중...")
         self.is_running = False
+        self._stop_event.set()
+        self._wake.set()
         
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=10)
         
+        if self._crawl_executor:
+            self._crawl_executor.shutdown(wait=False)
+            self._crawl_executor = None
+        
         self.dashboard.stop()
+        
+        if self.error_handler:
+            self.error_handler.close()
         logger.info("스케줄러 중지 완료")
     
     def get_current_status(self) -> Dict:
         """현재 상태 조회"""
+        # 여러 구가 동시에 실행될 수 있으므로 실행 중인 세션 전체를 목록으로 보고
+        with self._active_lock:
+            active_sessions = [session.to_dict() for session in self._active_sessions.values()]
+        
         return {
             "is_running": self.is_running,
-            "current_session": asdict(self.current_session) if self.current_session else None,
-            "queue_size": self.task_queue.qsize(),
+            "active_sessions": active_sessions,
+            "queue_size": self._queued,
             "total_sessions": len(self.sessions),
             "recent_sessions": [
-                asdict(session) for session in 
-                sorted(self.sessions.values(), key=lambda x: x.start_time, reverse=True)[:5]
+                # _recent_sessions는 시작 시간 순이므로 뒤에서 5개만 읽으면 됨 (정렬 불필요)
+                # 다른 스레드가 추가/정리하는 중에도 안전하도록 복사본을 순회
+                session.to_dict() for session in
+                reversed(tuple(self._recent_sessions)[-5:])
             ]
         }
     
     def force_run_district(self, district_name: str) -> bool:
         """특정 구 강제 실행"""
-        if self.current_session and self.current_session.status == CrawlingStatus.RUNNING:
+        with self._active_lock:
+            is_active = district_name in self._active_sessions
+        if is_active:
             logger.warning("이미 실행 중인 세션이 있습니다")
             return False
         
         session = self._create_crawling_session(district_name)
-        self.task_queue.put({
-            "type": "district_crawling",
-            "session": session,
-            "priority": "manual"
-        })
+        self._enqueue_task(session, "manual")
         
         if not self.is_running:
             self._start_worker_thread()
@@ -470,68 +755,63 @@ class SeoulDashboard:
         # 현재 스케줄러 상태
         scheduler_status = self.scheduler.get_current_status()
         
-        # 대시보드 정보 생성
+        # 대시보드 정보 생성 (갱신 시각은 한 번만 조회)
+        now = datetime.now()
         dashboard_info = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "seoul_coverage": coverage_stats,
             "scheduler_status": scheduler_status,
             "next_scheduled": self._get_next_scheduled_districts(),
-            "performance_metrics": self._calculate_performance_metrics()
+            "performance_metrics": self._calculate_performance_metrics(now)
         }
         
         # 대시보드 파일 저장
-        with open("seoul_dashboard.json", "w", encoding="utf-8") as f:
-            json.dump(dashboard_info, f, ensure_ascii=False, indent=2, default=str)
+        _dump_json("seoul_dashboard.json", dashboard_info)
         
         # 콘솔 출력
         self._print_dashboard_summary(dashboard_info)
     
     def _get_next_scheduled_districts(self) -> List[Dict]:
         """다음 예정된 구 목록"""
-        next_jobs = []
-        
-        # schedule 라이브러리에서 다음 작업들 조회
-        for job in schedule.jobs:
-            if hasattr(job, 'next_run') and job.next_run:
-                # 태그에서 구 이름 추출
-                tag = job.tags.pop() if job.tags else "unknown"
-                if "_" in tag:
-                    day, district = tag.split("_", 1)
-                    next_jobs.append({
-                        "district": district,
-                        "scheduled_time": job.next_run.isoformat(),
-                        "day": day
-                    })
-        
-        # 시간순 정렬
-        next_jobs.sort(key=lambda x: x["scheduled_time"])
-        return next_jobs[:5]  # 다음 5개만
-    
-    def _calculate_performance_metrics(self) -> Dict:
-        """성능 지표 계산"""
-        recent_sessions = [
-            session for session in self.scheduler.sessions.values()
-            if session.start_time >= datetime.now() - timedelta(days=1)
+        # 구별 주간 슬롯은 힙 스케줄러에만 있음 (schedule에는 리포트/통계 갱신/재시도 작업만 남음)
+        return [
+            {
+                "district": slot.district,
+                "scheduled_time": slot.next_run.isoformat(),
+                "day": slot.day
+            }
+            for slot in self.scheduler.district_slots.peek(5)
         ]
+    
+    def _calculate_performance_metrics(self, now: Optional[datetime] = None) -> Dict:
+        """성능 지표 계산"""
+        now = now or datetime.now()
+        recent_sessions = self.scheduler.get_sessions_since(now - timedelta(days=1))
         
         if not recent_sessions:
             return {"message": "최근 24시간 내 세션 없음"}
         
-        completed_sessions = [s for s in recent_sessions if s.status == CrawlingStatus.COMPLETED]
+        # 완료 세션 집계 (한 번의 순회)
+        completed_status = CrawlingStatus.COMPLETED
+        completed_count = 0
+        total_processing_time = 0.0
+        total_stores = 0
+        for s in recent_sessions:
+            if s.status is completed_status:
+                completed_count += 1
+                total_processing_time += s.processing_time_seconds
+                total_stores += s.stores_processed
         
-        if not completed_sessions:
+        if not completed_count:
             return {"message": "최근 24시간 내 완료된 세션 없음"}
         
-        avg_processing_time = sum(s.processing_time_seconds for s in completed_sessions) / len(completed_sessions)
-        avg_stores_per_session = sum(s.stores_processed for s in completed_sessions) / len(completed_sessions)
-        
         return {
             "recent_sessions_24h": len(recent_sessions),
-            "completed_sessions_24h": len(completed_sessions),
-            "success_rate_24h": len(completed_sessions) / len(recent_sessions) * 100,
-            "avg_processing_time_minutes": avg_processing_time / 60,
-            "avg_stores_per_session": avg_stores_per_session,
-            "total_stores_24h": sum(s.stores_processed for s in completed_sessions)
+            "completed_sessions_24h": completed_count,
+            "success_rate_24h": completed_count / len(recent_sessions) * 100,
+            "avg_processing_time_minutes": total_processing_time / completed_count / 60,
+            "avg_stores_per_session": total_stores / completed_count,
+            "total_stores_24h": total_stores
         }
     
     def _print_dashboard_summary(self, dashboard_info: Dict):
@@ -542,9 +822,9 @@ class SeoulDashboard:
         logger.info(f"서울 커버리지: {coverage['completion_rate']:.1f}% ({coverage['completed']}/{coverage['total_districts']})")
         
         scheduler = dashboard_info["scheduler_status"]
-        if scheduler["current_session"]:
-            current = scheduler["current_session"]
-            logger.info(f"현재 실행 중: {current['district_name']} ({current['status']})")
+        if scheduler["active_sessions"]:
+            for current in scheduler["active_sessions"]:
+                logger.info(f"현재 실행 중: {current['district_name']} ({current['status']})")
         else:
             logger.info("현재 실행 중인 세션 없음")
         
@@ -563,6 +843,8 @@ class SeoulErrorHandler:
     
     def __init__(self, scheduler: SeoulCrawlingScheduler):
         self.scheduler = scheduler
+        self._error_log_fh = None  # seoul_error_log.json 추가 기록용 핸들 (최초 오류 시 열림)
+        scheduler.error_handler = self
         self.error_patterns = {
             "low_search_results": self._handle_low_search_results,
             "too_many_results": self._handle_too_many_results,
@@ -606,11 +888,12 @@ class SeoulErrorHandler:
         """키워드 효과 저하 처리"""
         logger.info(f"{district_name}: 키워드 효과 저하 → 트렌딩 키워드 업데이트")
         
-        # 트렌딩 키워드 분석 및 업데이트
-        trending_keywords = self._analyze_trending_keywords(district_name)
-        
+        # 구 정보는 한 번만 조회하여 트렌딩 분석과 업데이트에 함께 사용
         district_info = self.scheduler.district_manager.get_district_info(district_name)
         if district_info:
+            # 트렌딩 키워드 분석 및 업데이트
+            trending_keywords = self._analyze_trending_keywords(district_name, district_info)
+            
             # 기존 키워드 중 효과 낮은 것들 제거하고 새로운 키워드 추가
             district_info.keywords = trending_keywords
     
@@ -619,22 +902,26 @@ class SeoulErrorHandler:
         logger.info(f"{district_name}: 네트워크 오류 → 재시도 스케줄링")
         
         # 30분 후 재시도 스케줄링
-        retry_time = datetime.now() + timedelta(minutes=30)
-        schedule.every().day.at(retry_time.strftime("%H:%M")).do(
-            self.scheduler.force_run_district,
-            district_name=district_name
-        ).tag(f"retry_{district_name}")
+        self._schedule_retry(district_name, timedelta(minutes=30), f"retry_{district_name}")
     
     def _handle_rate_limit(self, district_name: str, error_details: str):
         """요청 한도 초과 처리"""
         logger.info(f"{district_name}: 요청 한도 초과 → 지연 후 재시도")
         
         # 2시간 후 재시도
-        retry_time = datetime.now() + timedelta(hours=2)
-        schedule.every().day.at(retry_time.strftime("%H:%M")).do(
-            self.scheduler.force_run_district,
-            district_name=district_name
-        ).tag(f"rate_limit_retry_{district_name}")
+        self._schedule_retry(district_name, timedelta(hours=2), f"rate_limit_retry_{district_name}")
+    
+    def _schedule_retry(self, district_name: str, delay: timedelta, tag: str):
+        """1회성 재시도 작업 등록 (같은 태그의 기존 재시도는 교체)"""
+        # 같은 구의 재시도가 누적되지 않도록 기존 작업 제거
+        schedule.clear(tag)
+        
+        def _retry():
+            self.scheduler.force_run_district(district_name)
+            return schedule.CancelJob  # 한 번 실행 후 자동 제거
+        
+        retry_time = datetime.now() + delay
+        schedule.every().day.at(retry_time.strftime("%H:%M")).do(_retry).tag(tag)
     
     def _handle_unknown_error(self, district_name: str, error_type: str, error_details: str):
         """알 수 없는 오류 처리"""
@@ -648,41 +935,29 @@ class SeoulErrorHandler:
             "error_details": error_details
         }
         
-        with open("seoul_error_log.json", "a", encoding="utf-8") as f:
-            f.write(json.dumps(error_log, ensure_ascii=False) + "\n")
+        # 핸들을 유지하여 오류마다 open/close 반복 방지 (비버퍼링: 한 줄당 write 1회)
+        if self._error_log_fh is None:
+            self._error_log_fh = open("seoul_error_log.json", "ab", buffering=0)
+        self._error_log_fh.write(orjson.dumps(error_log) + b"\n")
+    
+    def close(self):
+        """오류 로그 파일 닫기"""
+        if self._error_log_fh is not None:
+            self._error_log_fh.close()
+            self._error_log_fh = None
     
     def _generate_district_specific_keywords(self, district_name: str) -> List[str]:
         """구별 특화 키워드 생성"""
-        # 구별 특성에 맞는 키워드 생성
-        special_keywords = {
-            "성북구": ["성신여대", "한성대", "정릉"],
-            "관악구": ["서울대", "신림동", "봉천동"],
-            "서대문구": ["연세대", "이화여대", "신촌"],
-            "동대문구": ["한국외대", "경희대", "회기동"],
-            "종로구": ["대학로", "인사동", "삼청동"],
-            "중구": ["명동", "남대문", "동대문"],
-            "용산구": ["이태원", "한남동", "용산역"],
-            "영등포구": ["여의도", "타임스퀘어", "영등포역"]
-        }
-        
-        base_keywords = special_keywords.get(district_name, [])
-        
-        # 무한리필 키워드와 조합
-        additional = []
-        for keyword in base_keywords:
-            additional.extend([
-                f"{keyword} 무한리필",
-                f"{keyword} 고기무한리필",
-                f"{keyword} 뷔페"
-            ])
-        
-        return additional
+        # 미리 조합된 키워드 사용 (호출자가 수정할 수 있도록 새 리스트로 반환)
+        return list(DISTRICT_SPECIFIC_KEYWORDS.get(district_name, ()))
     
-    def _analyze_trending_keywords(self, district_name: str) -> List[str]:
+    def _analyze_trending_keywords(self, district_name: str,
+                                   district_info: Optional[DistrictInfo] = None) -> List[str]:
         """트렌딩 키워드 분석"""
         # 실제로는 검색 트렌드 API나 소셜미디어 분석을 통해 구현
         # 여기서는 기본 키워드 반환
-        district_info = self.scheduler.district_manager.get_district_info(district_name)
+        if district_info is None:
+            district_info = self.scheduler.district_manager.get_district_info(district_name)
         return district_info.keywords if district_info else []
 
 def test_seoul_scheduler():
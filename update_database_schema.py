@@ -3,6 +3,9 @@
 데이터베이스 스키마 업데이트 스크립트
 - description, price_range, average_price 필드 제거
 - 카테고리를 7개로 제한
+- 최근 저장 가게 조회용 created_at 인덱스 추가
+- 필드 수집 현황 집계용 부분 인덱스 추가
+- 상태 확인용 stores_stats materialized view 추가
 """
 
 import psycopg2
@@ -92,12 +95,46 @@ def update_database_schema():
         assigned_count = cursor.rowcount
         logger.info(f"   - {assigned_count}개 가게에 기본 카테고리(한식) 할당")
         
+        # 5. 최근 저장 가게 조회용 인덱스 추가
+        logger.info("5. 인덱스 추가 중...")
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stores_created_at_desc
+            ON stores (created_at DESC) INCLUDE (name, last_order, holiday);
+        """)
+        logger.info("   - idx_stores_created_at_desc 확인/추가 완료")
+        
+        # 필드 수집 현황 집계용 부분 인덱스 (값이 있는 가게만 포함)
+        for column in ('address', 'open_hours', 'break_time', 'last_order', 'holiday'):
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_stores_has_{column}
+                ON stores (id) WHERE {column} IS NOT NULL AND {column} <> '';
+            """)
+            logger.info(f"   - idx_stores_has_{column} 확인/추가 완료")
+        
+        # 상태 확인용 가게 통계 materialized view (CONCURRENTLY 갱신용 고유 인덱스 포함)
+        cursor.execute("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS stores_stats AS
+            SELECT
+                1 AS id,
+                COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE address IS NOT NULL AND address <> '') AS with_address,
+                COUNT(*) FILTER (WHERE open_hours IS NOT NULL AND open_hours <> '') AS with_open_hours,
+                COUNT(*) FILTER (WHERE break_time IS NOT NULL AND break_time <> '') AS with_break_time,
+                COUNT(*) FILTER (WHERE last_order IS NOT NULL AND last_order <> '') AS with_last_order,
+                COUNT(*) FILTER (WHERE holiday IS NOT NULL AND holiday <> '') AS with_holiday,
+                now() AS refreshed_at
+            FROM stores;
+        """)
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_stores_stats_id ON stores_stats (id);")
+        logger.info("   - stores_stats 확인/추가 완료")
+        
         # 변경사항 커밋
         conn.commit()
         logger.info("모든 변경사항 커밋 완료!")
         
-        # 5. 결과 확인
-        logger.info("5. 결과 확인...")
+        # 6. 결과 확인
+        logger.info("6. 결과 확인...")
         
         cursor.execute("SELECT COUNT(*) FROM categories;")
         categories_count = cursor.fetchone()[0]